@@ -0,0 +1,140 @@
+"""
+One-off data backfills for the Portfolio API table.
+
+Rebuilds or moves pre-aggregated items that the API now reads directly
+instead of computing them per request. Every action is safe to re-run.
+
+Usage:
+    # For local DynamoDB
+    python scripts/backfill_data.py --local --action monthly-visitors
+
+    # For AWS DynamoDB
+    python scripts/backfill_data.py --aws --region us-east-1 --action monthly-visitors
+
+    # Move blog category counters to the shared BLOG#CATEGORIES partition
+    python scripts/backfill_data.py --aws --region us-east-1 --action blog-categories
+
+    # Index existing view counters for top-content ranking
+    python scripts/backfill_data.py --aws --region us-east-1 --action analytics-gsi2
+"""
+
+import argparse
+import os
+import sys
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def backfill_monthly_visitors(table_name: str):
+    """
+    Write VISITOR#MONTHLY aggregates summed from the daily visitor counters.
+
+    Args:
+        table_name: Name of the table to backfill
+    """
+    from src.repositories.visitor import VisitorRepository
+
+    totals = VisitorRepository(table_name).backfill_monthly_counts()
+
+    for month, count in sorted(totals.items()):
+        print(f"   {month}: {count} visitors")
+    print(f"\n✅ Backfilled {len(totals)} monthly aggregates")
+
+
+def migrate_blog_categories(table_name: str):
+    """
+    Move legacy BLOG#CATEGORY#<name> counters into the BLOG#CATEGORIES partition.
+
+    Args:
+        table_name: Name of the table to migrate
+    """
+    from src.repositories.blog import BlogRepository
+
+    migrated = BlogRepository(table_name).migrate_category_counts()
+
+    for category, count in sorted(migrated.items()):
+        print(f"   {category}: {count} posts")
+    print(f"\n✅ Migrated {len(migrated)} category counters")
+
+
+def backfill_analytics_gsi2(table_name: str):
+    """
+    Set GSI2PK/GSI2SK on view counters created before the top-content index.
+
+    Args:
+        table_name: Name of the table to backfill
+    """
+    from src.repositories.analytics import AnalyticsRepository
+
+    updated = AnalyticsRepository(table_name).backfill_top_content_keys()
+
+    for content_type, count in sorted(updated.items()):
+        print(f"   {content_type}: {count} counters")
+    print(f"\n✅ Indexed {sum(updated.values())} view counters")
+
+
+def main():
+    """Main function to handle command-line arguments."""
+    parser = argparse.ArgumentParser(
+        description='Backfill aggregate items for Portfolio API'
+    )
+    parser.add_argument(
+        '--local',
+        action='store_true',
+        help='Use local DynamoDB (http://localhost:8000)'
+    )
+    parser.add_argument(
+        '--aws',
+        action='store_true',
+        help='Use AWS DynamoDB'
+    )
+    parser.add_argument(
+        '--region',
+        type=str,
+        default='us-east-1',
+        help='AWS region (default: us-east-1)'
+    )
+    parser.add_argument(
+        '--table-name',
+        type=str,
+        default='portfolio-api-table',
+        help='Table name (default: portfolio-api-table)'
+    )
+    parser.add_argument(
+        '--action',
+        type=str,
+        choices=['monthly-visitors', 'blog-categories', 'analytics-gsi2'],
+        required=True,
+        help='Backfill to run'
+    )
+
+    args = parser.parse_args()
+
+    # Validate environment flag
+    if not args.local and not args.aws:
+        print("❌ Error: Must specify either --local or --aws")
+        parser.print_help()
+        return
+
+    # Settings are read at import time, so configure them before loading repositories
+    if args.local:
+        print("🔧 Using local DynamoDB at http://localhost:8000")
+        os.environ['DYNAMODB_ENDPOINT'] = 'http://localhost:8000'
+        os.environ['AWS_REGION'] = 'us-east-1'
+        os.environ.setdefault('AWS_ACCESS_KEY_ID', 'dummy')
+        os.environ.setdefault('AWS_SECRET_ACCESS_KEY', 'dummy')
+    else:
+        print(f"☁️  Using AWS DynamoDB in region: {args.region}")
+        os.environ['AWS_REGION'] = args.region
+
+    if args.action == 'monthly-visitors':
+        backfill_monthly_visitors(args.table_name)
+    elif args.action == 'blog-categories':
+        migrate_blog_categories(args.table_name)
+    elif args.action == 'analytics-gsi2':
+        backfill_analytics_gsi2(args.table_name)
+
+
+if __name__ == '__main__':
+    main()
@@ -38,7 +38,9 @@ def create_table(dynamodb_client, table_name: str, local: bool = False):
                 {'AttributeName': 'PK', 'AttributeType': 'S'},
                 {'AttributeName': 'SK', 'AttributeType': 'S'},
                 {'AttributeName': 'GSI1PK', 'AttributeType': 'S'},
-                {'AttributeName': 'GSI1SK', 'AttributeType': 'S'}
+                {'AttributeName': 'GSI1SK', 'AttributeType': 'S'},
+                {'AttributeName': 'GSI2PK', 'AttributeType': 'S'},
+                {'AttributeName': 'GSI2SK', 'AttributeType': 'N'}
             ],
             'GlobalSecondaryIndexes': [
                 {
@@ -50,6 +52,16 @@ def create_table(dynamodb_client, table_name: str, local: bool = False):
                     'Projection': {
                         'ProjectionType': 'ALL'  # Include all attributes
                     }
+                },
+                {
+                    'IndexName': 'GSI2',
+                    'KeySchema': [
+                        {'AttributeName': 'GSI2PK', 'KeyType': 'HASH'},
+                        {'AttributeName': 'GSI2SK', 'KeyType': 'RANGE'}  # Numeric sort key
+                    ],
+                    'Projection': {
+                        'ProjectionType': 'ALL'
+                    }
                 }
             ]
         }
@@ -62,10 +74,11 @@ def create_table(dynamodb_client, table_name: str, local: bool = False):
                 'ReadCapacityUnits': 5,
                 'WriteCapacityUnits': 5
             }
-            table_params['GlobalSecondaryIndexes'][0]['ProvisionedThroughput'] = {
-                'ReadCapacityUnits': 5,
-                'WriteCapacityUnits': 5
-            }
+            for gsi in table_params['GlobalSecondaryIndexes']:
+                gsi['ProvisionedThroughput'] = {
+                    'ReadCapacityUnits': 5,
+                    'WriteCapacityUnits': 5
+                }
         else:
             # AWS DynamoDB - use on-demand billing
             table_params['BillingMode'] = 'PAY_PER_REQUEST'
@@ -4,6 +4,7 @@ Authentication API endpoints.
 Handles user authentication, token refresh, and user profile management.
 """
 
+from functools import lru_cache
 from typing import Annotated
 
 import boto3
@@ -18,8 +19,14 @@ from src.utils.errors import UnauthorizedException, ValidationException
 router = APIRouter()
 
 
+@lru_cache(maxsize=1)
 def get_cognito_client():
-    """Get Cognito Identity Provider client."""
+    """
+    Get Cognito Identity Provider client.
+
+    Built once per process: client construction loads the service model and
+    resolves endpoints, and boto3 clients are safe to share across requests.
+    """
     return boto3.client(
         "cognito-idp",
         region_name=settings.cognito_region,
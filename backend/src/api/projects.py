@@ -6,6 +6,7 @@ Public endpoints for reading, owner-only for write operations.
 """
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.concurrency import run_in_threadpool
 
 from src.dependencies import get_project_repository, require_owner_role
 from src.models.project import ProjectCreate, ProjectListResponse, ProjectResponse, ProjectUpdate
@@ -50,7 +51,8 @@ async def list_projects(
             )
 
     # Query repository
-    result = project_repo.list_projects(
+    result = await run_in_threadpool(
+        project_repo.list_projects,
         status=status_filter.upper() if status_filter else None,
         featured=featured,
         limit=limit,
@@ -66,7 +68,7 @@ async def get_project(
     project_repo: ProjectRepository = Depends(get_project_repository),
 ):
     """Get a single project by ID. Public endpoint."""
-    project = project_repo.get_by_id(project_id)
+    project = await run_in_threadpool(project_repo.get_by_id, project_id)
 
     if not project:
         raise HTTPException(
@@ -92,7 +94,7 @@ async def create_project(
 ):
     """Create a new project. Requires owner authentication."""
     project_data = project.model_dump()
-    created_project = project_repo.create(project_data)
+    created_project = await run_in_threadpool(project_repo.create, project_data)
 
     if not created_project:
         raise HTTPException(
@@ -119,7 +121,7 @@ async def update_project(
             detail="No fields to update",
         )
 
-    updated_project = project_repo.update(project_id, project_data)
+    updated_project = await run_in_threadpool(project_repo.update, project_id, project_data)
 
     if not updated_project:
         raise HTTPException(
@@ -137,7 +139,7 @@ async def delete_project(
     project_repo: ProjectRepository = Depends(get_project_repository),
 ):
     """Delete a project. Requires owner authentication."""
-    deleted = project_repo.delete(project_id)
+    deleted = await run_in_threadpool(project_repo.delete, project_id)
 
     if not deleted:
         raise HTTPException(
@@ -155,7 +157,7 @@ async def publish_project(
     project_repo: ProjectRepository = Depends(get_project_repository),
 ):
     """Publish a project (change status from DRAFT to PUBLISHED). Requires owner authentication."""
-    published_project = project_repo.publish(project_id)
+    published_project = await run_in_threadpool(project_repo.publish, project_id)
 
     if not published_project:
         raise HTTPException(
@@ -173,7 +175,7 @@ async def unpublish_project(
     project_repo: ProjectRepository = Depends(get_project_repository),
 ):
     """Unpublish a project (change status from PUBLISHED to DRAFT). Requires owner authentication."""
-    unpublished_project = project_repo.unpublish(project_id)
+    unpublished_project = await run_in_threadpool(project_repo.unpublish, project_id)
 
     if not unpublished_project:
         raise HTTPException(
@@ -10,6 +10,7 @@ from datetime import UTC, datetime
 from typing import Any
 
 from fastapi import APIRouter, Depends, Query, Request
+from fastapi.concurrency import run_in_threadpool
 
 from src.dependencies import get_visitor_repository, require_owner_role
 from src.models.visitor import VisitorCountResponse, VisitorTrackRequest
@@ -35,7 +36,7 @@ async def track_visitor(
         session_id = str(uuid.uuid4())
 
     # Track visitor
-    result = visitor_repo.track_visitor(session_id)
+    result = await run_in_threadpool(visitor_repo.track_visitor, session_id)
 
     return {
         "message": "Visitor tracked successfully",
@@ -53,7 +54,7 @@ async def get_visitor_count(
 
     Public endpoint - returns aggregated visitor statistics.
     """
-    total_count = visitor_repo.get_total_count()
+    total_count = await run_in_threadpool(visitor_repo.get_total_count)
 
     return VisitorCountResponse(total_visitors=total_count, last_updated=datetime.now(UTC))
 
@@ -69,7 +70,7 @@ async def get_daily_trends(
 
     Requires owner authentication.
     """
-    trends = visitor_repo.get_daily_trends(days=days)
+    trends = await run_in_threadpool(visitor_repo.get_daily_trends, days=days)
     return trends
 
 
@@ -84,5 +85,5 @@ async def get_monthly_trends(
 
     Requires owner authentication.
     """
-    trends = visitor_repo.get_monthly_trends(months=months)
+    trends = await run_in_threadpool(visitor_repo.get_monthly_trends, months=months)
     return trends
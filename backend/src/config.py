@@ -5,6 +5,7 @@ Loads configuration from environment variables with sensible defaults.
 Uses Pydantic Settings for validation and type safety.
 """
 
+import importlib.util
 import os
 
 from pydantic import ConfigDict, field_validator
@@ -32,6 +33,21 @@ class Settings(BaseSettings):
     dynamodb_endpoint: str = os.getenv(
         "DYNAMODB_ENDPOINT", ""
     )  # For local DynamoDB (http://localhost:8000)
+    # Optional DAX cluster for the ANALYTICS#TOTAL read. Writes bypass DAX, so the
+    # total can lag by the cluster's item cache TTL (5 minutes by default) on top of
+    # the 2s in-process cache; lower the cluster's record TTL to tighten that window.
+    dax_endpoint: str = os.getenv("DAX_ENDPOINT", "")
+
+    @field_validator("dax_endpoint")
+    @classmethod
+    def require_dax_client(cls, v):
+        """Fail at startup, not on the first read, if DAX is configured but not installed."""
+        if v and importlib.util.find_spec("amazondax") is None:
+            raise ValueError(
+                "DAX_ENDPOINT is set but amazon-dax-client is not installed "
+                "(install the 'dax' extra)"
+            )
+        return v
 
     # CORS Configuration
     cors_origins: str | list[str] = "http://localhost:3000,http://localhost:5173,https://patrickcmd.dev,https://www.patrickcmd.dev"
@@ -111,25 +111,11 @@ def get_dynamodb_resource():
     Dependency to get DynamoDB resource.
 
     Returns:
-        Configured boto3 DynamoDB resource
-    """
-    import boto3
-
-    # Configure DynamoDB resource based on environment
-    if settings.dynamodb_endpoint:
-        # Local DynamoDB
-        resource = boto3.resource(
-            "dynamodb",
-            endpoint_url=settings.dynamodb_endpoint,
-            region_name=settings.aws_region,
-            aws_access_key_id="test",
-            aws_secret_access_key="test",
-        )
-    else:
-        # AWS DynamoDB
-        resource = boto3.resource("dynamodb", region_name=settings.aws_region)
+        Configured boto3 DynamoDB resource (shared by requests served on the same thread)
+    """
+    from src.utils.dynamodb import get_dynamodb_resource as shared_resource
 
-    return resource
+    return shared_resource()
 
 
 def get_dynamodb_table():
@@ -139,8 +125,9 @@ def get_dynamodb_table():
     Returns:
         DynamoDB table resource for the portfolio data table
     """
-    resource = get_dynamodb_resource()
-    return resource.Table(settings.dynamodb_table_name)
+    from src.utils.dynamodb import get_table
+
+    return get_table()
 
 
 # Repository Dependencies
@@ -155,8 +142,7 @@ def get_blog_repository():
     """
     from src.repositories.blog import BlogRepository
 
-    table = get_dynamodb_table()
-    return BlogRepository(table)
+    return BlogRepository(settings.dynamodb_table_name)
 
 
 def get_project_repository():
@@ -168,8 +154,7 @@ def get_project_repository():
     """
     from src.repositories.project import ProjectRepository
 
-    table = get_dynamodb_table()
-    return ProjectRepository(table)
+    return ProjectRepository(settings.dynamodb_table_name)
 
 
 def get_certification_repository():
@@ -181,8 +166,7 @@ def get_certification_repository():
     """
     from src.repositories.certification import CertificationRepository
 
-    table = get_dynamodb_table()
-    return CertificationRepository(table)
+    return CertificationRepository(settings.dynamodb_table_name)
 
 
 def get_visitor_repository():
@@ -194,8 +178,7 @@ def get_visitor_repository():
     """
     from src.repositories.visitor import VisitorRepository
 
-    table = get_dynamodb_table()
-    return VisitorRepository(table)
+    return VisitorRepository(settings.dynamodb_table_name)
 
 
 def get_analytics_repository():
@@ -207,5 +190,4 @@ def get_analytics_repository():
     """
     from src.repositories.analytics import AnalyticsRepository
 
-    table = get_dynamodb_table()
-    return AnalyticsRepository(table)
+    return AnalyticsRepository(settings.dynamodb_table_name)
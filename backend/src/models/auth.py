@@ -6,7 +6,8 @@ Defines all Pydantic models for authentication including:
 - User information models
 """
 
-from pydantic import BaseModel, EmailStr
+from pydantic import BaseModel, field_validator
+from pydantic_core import PydanticCustomError
 
 # API Request Models
 
@@ -14,9 +15,24 @@ from pydantic import BaseModel, EmailStr
 class LoginRequest(BaseModel):
     """Login request model."""
 
-    email: EmailStr
+    email: str
     password: str
 
+    @field_validator("email", mode="after")
+    @classmethod
+    def validate_email_address(cls, v: str) -> str:
+        """Validate email format, importing email-validator only when a login arrives."""
+        from email_validator import EmailNotValidError, validate_email
+
+        try:
+            return validate_email(v, check_deliverability=False).normalized
+        except EmailNotValidError as e:
+            raise PydanticCustomError(
+                "value_error",
+                "value is not a valid email address: {reason}",
+                {"reason": str(e)},
+            )
+
 
 class RefreshTokenRequest(BaseModel):
     """Refresh token request model."""
@@ -8,6 +8,8 @@ Defines all Pydantic models for blog posts including:
 
 from pydantic import BaseModel, Field
 
+from src.models.common import DdbKey
+
 # API Request Models
 
 
@@ -63,4 +65,4 @@ class BlogPostListResponse(BaseModel):
 
     items: list[BlogPostResponse]
     count: int
-    lastEvaluatedKey: dict | None = Field(None, description="Pagination token for next page")
+    lastEvaluatedKey: DdbKey | None = Field(None, description="Pagination token for next page")
@@ -6,7 +6,9 @@ Defines all Pydantic models for certifications including:
 - Internal DynamoDB model
 """
 
-from pydantic import BaseModel, Field, HttpUrl
+from pydantic import BaseModel, Field
+
+from src.models.common import DdbKey, HttpUrlStr
 
 # API Request Models
 
@@ -20,7 +22,7 @@ class CertificationCreate(BaseModel):
     type: str = Field("certification", description="Type: certification or course")
     featured: bool = False
     description: str | None = None
-    credentialUrl: HttpUrl | None = None
+    credentialUrl: HttpUrlStr | None = None
     dateEarned: str | None = Field(None, description="ISO 8601 date when earned")
 
 
@@ -33,7 +35,7 @@ class CertificationUpdate(BaseModel):
     type: str | None = Field(None, description="Type: certification or course")
     featured: bool | None = None
     description: str | None = None
-    credentialUrl: HttpUrl | None = None
+    credentialUrl: HttpUrlStr | None = None
     dateEarned: str | None = None
 
 
@@ -62,4 +64,4 @@ class CertificationListResponse(BaseModel):
 
     items: list[CertificationResponse]
     count: int
-    lastEvaluatedKey: dict | None = Field(None, description="Pagination token for next page")
+    lastEvaluatedKey: DdbKey | None = Field(None, description="Pagination token for next page")
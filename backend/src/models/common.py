@@ -0,0 +1,51 @@
+"""
+Shared data models.
+
+Defines Pydantic models and field types reused across resource modules including:
+- DynamoDB pagination key model
+- Lazily validated URL field type
+"""
+
+from typing import Annotated
+
+from pydantic import AfterValidator, BaseModel, ConfigDict, Field, TypeAdapter
+
+_http_url_adapter: TypeAdapter | None = None
+
+
+def validate_http_url(value: str) -> str:
+    """
+    Validate that a string is an HTTP(S) URL.
+
+    The HttpUrl adapter is built on first use so importing the models stays cheap
+    on Lambda cold start. The original string is returned unchanged.
+
+    Args:
+        value: URL string to validate
+
+    Returns:
+        The validated URL string
+    """
+    global _http_url_adapter
+    if _http_url_adapter is None:
+        from pydantic import HttpUrl
+
+        _http_url_adapter = TypeAdapter(HttpUrl)
+    _http_url_adapter.validate_python(value)
+    return value
+
+
+# String field validated as an HTTP(S) URL
+HttpUrlStr = Annotated[str, AfterValidator(validate_http_url)]
+
+
+class DdbKey(BaseModel):
+    """DynamoDB LastEvaluatedKey returned as a pagination token."""
+
+    pk: str = Field(..., alias="PK", description="Partition key")
+    sk: str = Field(..., alias="SK", description="Sort key")
+    gsi1_pk: str | None = Field(None, alias="GSI1PK", description="GSI1 partition key")
+    gsi1_sk: str | None = Field(None, alias="GSI1SK", description="GSI1 sort key")
+
+    # Allow extra keys so any other index attributes survive the round trip
+    model_config = ConfigDict(extra="allow", populate_by_name=True)
@@ -6,7 +6,9 @@ Defines all Pydantic models for projects including:
 - Internal DynamoDB model
 """
 
-from pydantic import BaseModel, Field, HttpUrl
+from pydantic import BaseModel, Field
+
+from src.models.common import DdbKey, HttpUrlStr
 
 # API Request Models
 
@@ -20,9 +22,9 @@ class ProjectCreate(BaseModel):
     tech: list[str] = Field(default_factory=list, description="Technologies used")
     company: str | None = Field(None, max_length=200)
     featured: bool = False
-    githubUrl: HttpUrl | None = None
-    liveUrl: HttpUrl | None = None
-    imageUrl: HttpUrl | None = None
+    githubUrl: HttpUrlStr | None = None
+    liveUrl: HttpUrlStr | None = None
+    imageUrl: HttpUrlStr | None = None
 
 
 class ProjectUpdate(BaseModel):
@@ -34,9 +36,9 @@ class ProjectUpdate(BaseModel):
     tech: list[str] | None = None
     company: str | None = Field(None, max_length=200)
     featured: bool | None = None
-    githubUrl: HttpUrl | None = None
-    liveUrl: HttpUrl | None = None
-    imageUrl: HttpUrl | None = None
+    githubUrl: HttpUrlStr | None = None
+    liveUrl: HttpUrlStr | None = None
+    imageUrl: HttpUrlStr | None = None
 
 
 # API Response Models
@@ -65,4 +67,4 @@ class ProjectListResponse(BaseModel):
 
     items: list[ProjectResponse]
     count: int
-    lastEvaluatedKey: dict | None = Field(None, description="Pagination token for next page")
+    lastEvaluatedKey: DdbKey | None = Field(None, description="Pagination token for next page")
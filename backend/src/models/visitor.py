@@ -8,7 +8,7 @@ Defines all Pydantic models for visitor tracking including:
 
 from datetime import datetime
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, computed_field
 
 # API Request Models
 
@@ -19,6 +19,8 @@ class VisitorTrackRequest(BaseModel):
     page_path: str
     referrer: str = ""
 
+    model_config = ConfigDict(frozen=True)
+
 
 # API Response Models
 
@@ -34,15 +36,11 @@ class VisitorCountResponse(BaseModel):
 
 
 class VisitorLog(BaseModel):
-    """Visitor log internal model for DynamoDB."""
-
-    # Primary Key
-    pk: str = Field(..., description="Partition key: VISITOR#<date>")
-    sk: str = Field(..., description="Sort key: <timestamp>#<visitor_id>")
+    """Visitor log internal model for DynamoDB.
 
-    # GSI Keys
-    gsi1_pk: str = Field(..., description="GSI1 PK: VISITORS")
-    gsi1_sk: str = Field(..., description="GSI1 SK: <timestamp>")
+    Key attributes are derived from ``visitor_id`` and ``timestamp`` on access
+    and included in ``model_dump()``, so they are never stored or validated.
+    """
 
     # Entity Type
     entity_type: str = Field(default="visitor_log", description="Entity type identifier")
@@ -55,7 +53,30 @@ class VisitorLog(BaseModel):
     user_agent: str | None = Field(None, description="User agent string")
     timestamp: datetime = Field(default_factory=datetime.utcnow, description="Visit timestamp")
 
+    # Primary Key
+    @computed_field(description="Partition key: VISITOR#<date>")
+    @property
+    def pk(self) -> str:
+        return f"VISITOR#{self.timestamp.date().isoformat()}"
+
+    @computed_field(description="Sort key: <timestamp>#<visitor_id>")
+    @property
+    def sk(self) -> str:
+        return f"{self.timestamp.isoformat()}#{self.visitor_id}"
+
+    # GSI Keys
+    @computed_field(description="GSI1 PK: VISITORS")
+    @property
+    def gsi1_pk(self) -> str:
+        return "VISITORS"
+
+    @computed_field(description="GSI1 SK: <timestamp>")
+    @property
+    def gsi1_sk(self) -> str:
+        return self.timestamp.isoformat()
+
     model_config = ConfigDict(
+        frozen=True,
         json_schema_extra={
             "example": {
                 "pk": "VISITOR#2025-01-01",
@@ -69,7 +90,7 @@ class VisitorLog(BaseModel):
                 "ip_address": "192.168.xxx.xxx",
                 "user_agent": "Mozilla/5.0...",
             }
-        }
+        },
     )
 
 
@@ -5,19 +5,68 @@ Implements analytics tracking operations following the single-table design
 specified in docs/DYNAMODB-DESIGN.md.
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from datetime import UTC, datetime, timedelta
 from typing import Any
 
+from boto3.dynamodb.conditions import Key
+
 from src.repositories.base import BaseRepository
+from src.utils.cache import TTLCache
+
+# (result key, content type) pairs returned by get_top_content
+_TOP_CONTENT_TYPES = (
+    ("blogs", "blog"),
+    ("projects", "project"),
+    ("certifications", "certification"),
+)
+
+# Counter reads only need these two fields; projecting them keeps the rest of the
+# item off the wire and out of boto3's per-attribute deserializer.
+_VIEW_PROJECTION = "#data.contentId, #data.viewCount"
+_VIEW_PROJECTION_NAMES = {"#data": "Data"}
+
+# Counters are eventually consistent anyway, so cache reads for a couple of seconds
+# to collapse bursts of page renders into a single GetItem.
+_VIEW_CACHE_TTL = 2.0
+_VIEW_CACHE_MAX_SIZE = 4096
+_TOTAL_VIEWS_KEY = ("TOTAL",)
+
+_view_cache = TTLCache(ttl=_VIEW_CACHE_TTL, max_size=_VIEW_CACHE_MAX_SIZE)
+
+# Shared pool for the independent per-type top-content queries. Workers use
+# client_query: boto3 clients are thread-safe, Table resources are not.
+_QUERY_POOL = ThreadPoolExecutor(
+    max_workers=len(_TOP_CONTENT_TYPES), thread_name_prefix="analytics-query"
+)
 
 
 class AnalyticsRepository(BaseRepository):
     """Repository for analytics operations."""
 
+    __slots__ = ()
+
     def to_item(self, data: dict[str, Any]) -> dict[str, Any]:
-        """Convert analytics data to DynamoDB item."""
-        # This is handled differently for different analytics item types
-        pass
+        """Convert content view data to a DynamoDB view counter item."""
+        content_type = data["contentType"]
+        content_id = data["contentId"]
+        view_count = data.get("viewCount", 0)
+
+        return {
+            "PK": f"ANALYTICS#{content_type}#{content_id}",
+            "SK": "VIEWS",
+            "GSI1PK": f"ANALYTICS#{content_type}",
+            "GSI1SK": f"ANALYTICS#{content_id}",
+            "GSI2PK": f"ANALYTICS#{content_type}",
+            "GSI2SK": view_count,
+            "EntityType": "ANALYTICS_VIEW",
+            "Data": {
+                "contentId": content_id,
+                "contentType": content_type,
+                "viewCount": view_count,
+                "lastViewed": data.get("lastViewed"),
+            },
+        }
 
     def from_item(self, item: dict[str, Any]) -> dict[str, Any]:
         """Convert DynamoDB item to analytics data."""
@@ -37,104 +86,86 @@ class AnalyticsRepository(BaseRepository):
         Returns:
             Dict with views count
         """
-        # Check if session already viewed this content
-        session_item = self.get_item(
-            pk=f"ANALYTICS#SESSION#{session_id}", sk=f"{content_type}#{content_id}"
-        )
+        pk_content = f"ANALYTICS#{content_type}#{content_id}"
+        pk_session = f"ANALYTICS#SESSION#{session_id}"
+        type_key = f"ANALYTICS#{content_type}"
 
-        if session_item:
-            # Already viewed, just return current count
-            view_item = self.get_item(pk=f"ANALYTICS#{content_type}#{content_id}", sk="VIEWS")
-            views = view_item.get("Data", {}).get("viewCount", 0) if view_item else 0
-            return {"views": views}
+        now = datetime.now(UTC)
+        now_iso = now.isoformat()
+        expires_at = int((now + timedelta(hours=24)).timestamp())
 
-        # First, initialize the Data structure if needed
-        self.update_item(
-            pk=f"ANALYTICS#{content_type}#{content_id}",
-            sk="VIEWS",
-            update_expression="SET GSI1PK = if_not_exists(GSI1PK, :gsi1pk), EntityType = if_not_exists(EntityType, :entity_type), #data = if_not_exists(#data, :empty_data)",
-            expression_attribute_values={
-                ":gsi1pk": f"ANALYTICS#{content_type}",
-                ":entity_type": "ANALYTICS_VIEW",
-                ":empty_data": {
-                    "contentId": content_id,
+        # Counters bumped for every new view, with the item each one starts from
+        counter_seeds = [
+            self.to_item(
+                {
                     "contentType": content_type,
+                    "contentId": content_id,
                     "viewCount": 0,
-                    "lastViewed": datetime.now(UTC).isoformat(),
-                },
-            },
-            expression_attribute_names={"#data": "Data"},
-        )
-
-        # Then increment view count and update lastViewed
-        updated_item = self.update_item(
-            pk=f"ANALYTICS#{content_type}#{content_id}",
-            sk="VIEWS",
-            update_expression="SET #data.viewCount = if_not_exists(#data.viewCount, :zero) + :increment, #data.lastViewed = :lastViewed",
-            expression_attribute_values={
-                ":increment": 1,
-                ":zero": 0,
-                ":lastViewed": datetime.now(UTC).isoformat(),
+                    "lastViewed": now_iso,
+                }
+            ),
+            {
+                "PK": "ANALYTICS#TOTAL",
+                "SK": "VIEWS",
+                "EntityType": "ANALYTICS_TOTAL",
+                "Data": {"totalViews": 0, "lastUpdated": now_iso},
             },
-            expression_attribute_names={"#data": "Data"},
-        )
-
-        # Get new view count and update GSI1SK with padded count
-        view_count = updated_item.get("Data", {}).get("viewCount", 1) if updated_item else 1
-        padded_count = str(view_count).zfill(10)  # Pad to 10 digits
-
-        self.update_item(
-            pk=f"ANALYTICS#{content_type}#{content_id}",
-            sk="VIEWS",
-            update_expression="SET GSI1SK = :gsi1sk",
-            expression_attribute_values={":gsi1sk": f"ANALYTICS#VIEWS#{padded_count}"},
-            expression_attribute_names={},
-        )
+        ]
 
-        # Record session view (expires after 24 hours)
-        expires_at = int((datetime.now(UTC) + timedelta(hours=24)).timestamp())
-
-        self.put_item(
+        # Record the session view (expires after 24 hours) and bump both counters
+        # in one round trip. The session put doubles as the deduplication check;
+        # the counter updates fail until their Data map has been seeded. GSI2SK
+        # mirrors the count as a number so top-content ordering needs no extra write.
+        transact_items = [
             {
-                "PK": f"ANALYTICS#SESSION#{session_id}",
-                "SK": f"{content_type}#{content_id}",
-                "EntityType": "ANALYTICS_SESSION",
-                "Data": {"viewedAt": datetime.now(UTC).isoformat()},
-                "ExpiresAt": expires_at,
-            }
-        )
-
-        # Also update total views counter (for efficient retrieval)
-        self.update_item(
-            pk="ANALYTICS#TOTAL",
-            sk="VIEWS",
-            update_expression="SET EntityType = if_not_exists(EntityType, :entity_type), #data = if_not_exists(#data, :empty_data)",
-            expression_attribute_values={
-                ":entity_type": "ANALYTICS_TOTAL",
-                ":empty_data": {"totalViews": 0, "lastUpdated": datetime.now(UTC).isoformat()},
+                "Put": {
+                    "Item": {
+                        "PK": pk_session,
+                        "SK": f"{content_type}#{content_id}",
+                        "EntityType": "ANALYTICS_SESSION",
+                        "Data": {"viewedAt": now_iso},
+                        "ExpiresAt": expires_at,
+                    },
+                    "ConditionExpression": "attribute_not_exists(PK)",
+                }
             },
-            expression_attribute_names={"#data": "Data"},
-        )
-
-        self.update_item(
-            pk="ANALYTICS#TOTAL",
+            self.counter_update(
+                pk_content,
+                "VIEWS",
+                "viewCount",
+                {"lastViewed": now_iso},
+                attribute_updates={"GSI2PK": type_key},
+                counter_sort_key="GSI2SK",
+            ),
+            self.counter_update("ANALYTICS#TOTAL", "VIEWS", "totalViews", {"lastUpdated": now_iso}),
+        ]
+        # A failed session put means this session already viewed the content
+        if self.transact_counters(transact_items, counter_seeds):
+            # Let the writer read its own write
+            _view_cache.invalidate((content_type, content_id), _TOTAL_VIEWS_KEY)
+
+        # Transactions return no attributes, so read the count back (strongly
+        # consistent, or a fresh increment could still show the old count)
+        view_item = self.get_item(
+            pk=pk_content,
             sk="VIEWS",
-            update_expression="SET #data.totalViews = if_not_exists(#data.totalViews, :zero) + :increment, #data.lastUpdated = :updated",
-            expression_attribute_values={
-                ":increment": 1,
-                ":zero": 0,
-                ":updated": datetime.now(UTC).isoformat(),
-            },
-            expression_attribute_names={"#data": "Data"},
+            consistent_read=True,
+            projection_expression="#data.viewCount",
+            expression_attribute_names=_VIEW_PROJECTION_NAMES,
         )
-
-        return {"views": view_count}
+        views = view_item.get("Data", {}).get("viewCount", 0) if view_item else 0
+        return {"views": views}
 
     def get_view_count(self, content_type: str, content_id: str) -> int:
-        """Get view count for specific content."""
-        item = self.get_item(pk=f"ANALYTICS#{content_type}#{content_id}", sk="VIEWS")
+        """Get view count for specific content (cached for a few seconds)."""
+        cached = _view_cache.get((content_type, content_id))
+        if cached is not None:
+            return cached
 
-        return item.get("Data", {}).get("viewCount", 0) if item else 0
+        item = self.get_item(pk=f"ANALYTICS#{content_type}#{content_id}", sk="VIEWS")
+        views = item.get("Data", {}).get("viewCount", 0) if item else 0
+        _view_cache.set((content_type, content_id), views)
+        return views
 
     def get_all_views_for_type(self, content_type: str) -> dict[str, int]:
         """
@@ -146,20 +177,25 @@ class AnalyticsRepository(BaseRepository):
         Returns:
             Dict mapping content_id to view_count
         """
-        from boto3.dynamodb.conditions import Key
-
-        # Use Scan with filter since we can't use begins_with on PK in Query
-        result = self.resource.scan(
-            FilterExpression=Key("PK").begins_with(f"ANALYTICS#{content_type}#")
-            & Key("SK").eq("VIEWS")
+        # Every view counter of a type shares GSI1PK. The low-level paginator follows
+        # LastEvaluatedKey for us and yields raw AttributeValues, so the two projected
+        # fields are read directly without a full TypeDeserializer pass.
+        pages = self.client.get_paginator("query").paginate(
+            TableName=self.table_name,
+            IndexName="GSI1",
+            KeyConditionExpression="GSI1PK = :gsi1pk",
+            ExpressionAttributeValues={":gsi1pk": {"S": f"ANALYTICS#{content_type}"}},
+            ExpressionAttributeNames=_VIEW_PROJECTION_NAMES,
+            ProjectionExpression=_VIEW_PROJECTION,
         )
 
         stats = {}
-        for item in result["Items"]:
-            content_id = item.get("Data", {}).get("contentId")
-            view_count = item.get("Data", {}).get("viewCount", 0)
-            if content_id:
-                stats[content_id] = view_count
+        for page in pages:
+            for item in page["Items"]:
+                data = item.get("Data", {}).get("M", {})
+                content_id = data.get("contentId", {}).get("S")
+                if content_id:
+                    stats[content_id] = int(data.get("viewCount", {}).get("N", 0))
 
         return stats
 
@@ -173,62 +209,87 @@ class AnalyticsRepository(BaseRepository):
         Returns:
             Dict with 'blogs', 'projects', 'certifications' lists
         """
-        result = {"blogs": [], "projects": [], "certifications": []}
-
-        # Query top blogs
-        blog_result = self.query(
-            key_condition_expression="GSI1PK = :gsi1pk",
-            expression_attribute_values={":gsi1pk": "ANALYTICS#blog"},
-            index_name="GSI1",
-            scan_index_forward=False,  # Descending by view count
-            limit=limit,
-        )
-
-        for item in blog_result["Items"]:
-            result["blogs"].append(
+        # One small GSI2 query per type; they are independent, so run them concurrently.
+        # Build the shared client here rather than racing to do it in the workers.
+        # (PartiQL BatchExecuteStatement can't replace these queries: batched reads
+        # must address a single item by full primary key.)
+        _ = self.client
+        futures = [
+            (label, _QUERY_POOL.submit(self._query_top_type, content_type, limit))
+            for label, content_type in _TOP_CONTENT_TYPES
+        ]
+
+        return {
+            label: [
                 {
-                    "contentId": item.get("Data", {}).get("contentId"),
-                    "views": item.get("Data", {}).get("viewCount", 0),
+                    "contentId": item["Data"].get("contentId"),
+                    "views": item["Data"].get("viewCount", 0),
                 }
-            )
-
-        # Query top projects
-        project_result = self.query(
-            key_condition_expression="GSI1PK = :gsi1pk",
-            expression_attribute_values={":gsi1pk": "ANALYTICS#project"},
-            index_name="GSI1",
-            scan_index_forward=False,
+                for item in future.result()
+            ]
+            for label, future in futures
+        }
+
+    def _query_top_type(self, content_type: str, limit: int) -> list[dict[str, Any]]:
+        """Query the most viewed counters of one content type from GSI2."""
+        # Runs on _QUERY_POOL workers, so go through the thread-safe client
+        return self.client_query(
+            key_condition_expression="GSI2PK = :gsi2pk",
+            expression_attribute_values={":gsi2pk": f"ANALYTICS#{content_type}"},
+            expression_attribute_names=_VIEW_PROJECTION_NAMES,
+            index_name="GSI2",
+            scan_index_forward=False,  # Descending by view count
             limit=limit,
-        )
+            projection_expression=_VIEW_PROJECTION,
+        )["Items"]
 
-        for item in project_result["Items"]:
-            result["projects"].append(
-                {
-                    "contentId": item.get("Data", {}).get("contentId"),
-                    "views": item.get("Data", {}).get("viewCount", 0),
-                }
-            )
-
-        # Query top certifications
-        cert_result = self.query(
-            key_condition_expression="GSI1PK = :gsi1pk",
-            expression_attribute_values={":gsi1pk": "ANALYTICS#certification"},
-            index_name="GSI1",
-            scan_index_forward=False,
-            limit=limit,
-        )
+    def get_total_views(self) -> int:
+        """Get total views across all content (O(1) lookup from aggregated counter)."""
+        cached = _view_cache.get(_TOTAL_VIEWS_KEY)
+        if cached is not None:
+            return cached
 
-        for item in cert_result["Items"]:
-            result["certifications"].append(
-                {
-                    "contentId": item.get("Data", {}).get("contentId"),
-                    "views": item.get("Data", {}).get("viewCount", 0),
-                }
-            )
+        item = self.get_item(pk="ANALYTICS#TOTAL", sk="VIEWS", use_dax=True)
+        total = item.get("Data", {}).get("totalViews", 0) if item else 0
+        _view_cache.set(_TOTAL_VIEWS_KEY, total)
+        return total
 
-        return result
+    def backfill_top_content_keys(self) -> dict[str, int]:
+        """
+        Add GSI2 keys to view counters created before the top-content index.
 
-    def get_total_views(self) -> int:
-        """Get total views across all content (O(1) lookup from aggregated counter)."""
-        item = self.get_item(pk="ANALYTICS#TOTAL", sk="VIEWS")
-        return item.get("Data", {}).get("totalViews", 0) if item else 0
+        One-off maintenance (run via scripts/backfill_data.py): track_view only
+        sets GSI2PK/GSI2SK on the next view, so older counters are missing from
+        get_top_content until then. Reads every counter with a paginated Scan and
+        sets GSI2SK from the counter's own viewCount in the same update, so a
+        concurrent view can't leave the two out of step. Safe to re-run.
+
+        Returns:
+            Dict mapping content type to the number of counters updated
+        """
+        params = {
+            "FilterExpression": Key("PK").begins_with("ANALYTICS#") & Key("SK").eq("VIEWS"),
+            "ProjectionExpression": "PK",
+        }
+
+        updated: dict[str, int] = {}
+        while True:
+            result = self.resource.scan(**params)
+            for item in result["Items"]:
+                if item["PK"] == "ANALYTICS#TOTAL":
+                    continue
+                content_type = item["PK"].split("#")[1]
+                self.update_item(
+                    pk=item["PK"],
+                    sk="VIEWS",
+                    update_expression="SET GSI2PK = :gsi2pk, GSI2SK = #data.viewCount",
+                    expression_attribute_values={":gsi2pk": f"ANALYTICS#{content_type}"},
+                    expression_attribute_names={"#data": "Data"},
+                    condition_expression="attribute_exists(#data.viewCount)",
+                )
+                updated[content_type] = updated.get(content_type, 0) + 1
+            if "LastEvaluatedKey" not in result:
+                break
+            params["ExclusiveStartKey"] = result["LastEvaluatedKey"]
+
+        return updated
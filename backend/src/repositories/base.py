@@ -5,25 +5,125 @@ Provides common functionality for all repositories following
 the single-table design pattern.
 """
 
-from abc import ABC, abstractmethod
-from typing import Any, Generic, TypeVar
+import logging
+import random
+import threading
+import time
+from functools import lru_cache, wraps
+from typing import Any
 
 import boto3
+from boto3.dynamodb.types import TypeDeserializer, TypeSerializer
+from botocore.config import Config
 from botocore.exceptions import ClientError
 
 from src.config import settings
 
-T = TypeVar("T")  # Generic type for repository item
+logger = logging.getLogger(__name__)
 
+# Shared botocore settings: a larger keep-alive pool for concurrent queries and
+# adaptive retries so throttling backs off instead of failing fast.
+_BOTO_CONFIG = Config(
+    max_pool_connections=50,
+    retries={"mode": "adaptive", "max_attempts": 5},
+    tcp_keepalive=True,
+)
 
-class BaseRepository(ABC, Generic[T]):
+# Convert between plain Python values and AttributeValues for low-level client calls
+_SERIALIZER = TypeSerializer()
+_DESERIALIZER = TypeDeserializer()
+
+
+def _serialize_map(values: dict[str, Any]) -> dict[str, Any]:
+    """Serialize each value of a mapping to an AttributeValue."""
+    return {key: _SERIALIZER.serialize(value) for key, value in values.items()}
+
+
+def _deserialize_map(values: dict[str, Any]) -> dict[str, Any]:
+    """Deserialize each AttributeValue of a mapping to a plain Python value."""
+    return {key: _DESERIALIZER.deserialize(value) for key, value in values.items()}
+
+
+# Base delay in seconds for retrying unprocessed batch writes
+_BATCH_BACKOFF_BASE = 0.05
+
+# boto3 clients are thread-safe, so one client per (region, endpoint) is cached at
+# module scope and shared by every repository instance and thread in the process.
+# Sessions and resources are not thread-safe, so those are cached per thread: API
+# handlers run repository calls on threadpool workers.
+
+
+def _per_thread(func):
+    """Cache func's result per argument tuple, separately in each thread."""
+    local = threading.local()
+
+    @wraps(func)
+    def wrapper(*args):
+        cache = getattr(local, "cache", None)
+        if cache is None:
+            cache = local.cache = {}
+        if args not in cache:
+            cache[args] = func(*args)
+        return cache[args]
+
+    return wrapper
+
+
+@_per_thread
+def _get_session() -> boto3.session.Session:
+    """Create the boto3 session for the current thread."""
+    return boto3.session.Session()
+
+
+@lru_cache(maxsize=8)
+def _build_client(region: str, endpoint: str | None):
+    """Create the DynamoDB client for a region and optional local endpoint."""
+    if endpoint:
+        # Local DynamoDB
+        return _get_session().client(
+            "dynamodb", endpoint_url=endpoint, region_name=region, config=_BOTO_CONFIG
+        )
+    return _get_session().client("dynamodb", region_name=region, config=_BOTO_CONFIG)
+
+
+@_per_thread
+def _build_service_resource(region: str, endpoint: str | None):
+    """Create the current thread's DynamoDB service resource for a region and endpoint."""
+    if endpoint:
+        # Local DynamoDB
+        return _get_session().resource(
+            "dynamodb", endpoint_url=endpoint, region_name=region, config=_BOTO_CONFIG
+        )
+    return _get_session().resource("dynamodb", region_name=region, config=_BOTO_CONFIG)
+
+
+@_per_thread
+def _build_table(region: str, endpoint: str | None, table_name: str):
+    """Create the current thread's Table resource for a table name."""
+    return _build_service_resource(region, endpoint).Table(table_name)
+
+
+@_per_thread
+def _build_dax_table(region: str, endpoint: str, table_name: str):
+    """Create the current thread's DAX-backed Table resource for a table name."""
+    # Optional dependency: only needed when a DAX endpoint is configured
+    from amazondax import AmazonDaxClient
+
+    return AmazonDaxClient.resource(endpoint_url=endpoint, region_name=region).Table(table_name)
+
+
+class BaseRepository:
     """
     Base repository class for DynamoDB single-table design.
 
     Provides common DynamoDB operations with error handling.
-    All repositories should inherit from this class.
+    All repositories should inherit from this class and override
+    to_item/from_item.
     """
 
+    # Repositories are created per request, so keep instances dict-free
+    __slots__ = ("table_name", "_client")
+
     def __init__(self, table_name: str = "portfolio-api-table"):
         """
         Initialize base repository with DynamoDB client.
@@ -33,7 +133,6 @@ class BaseRepository(ABC, Generic[T]):
         """
         self.table_name = table_name
         self._client = None
-        self._resource = None
 
     @property
     def client(self):
@@ -41,40 +140,24 @@ class BaseRepository(ABC, Generic[T]):
         Lazy-load DynamoDB client.
 
         Returns:
-            boto3 DynamoDB client
+            boto3 DynamoDB client (shared across repository instances)
         """
         if self._client is None:
-            # Check if running locally
-            if hasattr(settings, "dynamodb_endpoint") and settings.dynamodb_endpoint:
-                self._client = boto3.client(
-                    "dynamodb",
-                    endpoint_url=settings.dynamodb_endpoint,
-                    region_name=settings.aws_region,
-                )
-            else:
-                self._client = boto3.client("dynamodb", region_name=settings.aws_region)
+            self._client = _build_client(settings.aws_region, settings.dynamodb_endpoint or None)
         return self._client
 
     @property
     def resource(self):
         """
-        Lazy-load DynamoDB resource (table).
+        Get DynamoDB resource (table).
+
+        Not memoized on the instance, so a repository used from several threads
+        always gets the calling thread's resource.
 
         Returns:
-            boto3 DynamoDB table resource
-        """
-        if self._resource is None:
-            # Check if running locally
-            if hasattr(settings, "dynamodb_endpoint") and settings.dynamodb_endpoint:
-                dynamodb = boto3.resource(
-                    "dynamodb",
-                    endpoint_url=settings.dynamodb_endpoint,
-                    region_name=settings.aws_region,
-                )
-            else:
-                dynamodb = boto3.resource("dynamodb", region_name=settings.aws_region)
-            self._resource = dynamodb.Table(self.table_name)
-        return self._resource
+            boto3 DynamoDB table resource (shared by repositories in the same thread)
+        """
+        return _build_table(settings.aws_region, settings.dynamodb_endpoint or None, self.table_name)
 
     @property
     def dynamodb_resource(self):
@@ -82,17 +165,32 @@ class BaseRepository(ABC, Generic[T]):
         Get DynamoDB service resource (for batch operations).
 
         Returns:
-            boto3 DynamoDB service resource
+            boto3 DynamoDB service resource (shared by repositories in the same thread)
         """
-        # Check if running locally
-        if hasattr(settings, "dynamodb_endpoint") and settings.dynamodb_endpoint:
-            return boto3.resource(
-                "dynamodb", endpoint_url=settings.dynamodb_endpoint, region_name=settings.aws_region
-            )
-        else:
-            return boto3.resource("dynamodb", region_name=settings.aws_region)
+        return _build_service_resource(settings.aws_region, settings.dynamodb_endpoint or None)
 
-    def get_item(self, pk: str, sk: str, consistent_read: bool = False) -> dict[str, Any] | None:
+    @property
+    def read_resource(self):
+        """
+        Get the table resource for hot, read-mostly keys.
+
+        Returns:
+            DAX-backed table resource when a DAX endpoint is configured,
+            otherwise the regular table resource. Writes never go through DAX.
+        """
+        if settings.dax_endpoint:
+            return _build_dax_table(settings.aws_region, settings.dax_endpoint, self.table_name)
+        return self.resource
+
+    def get_item(
+        self,
+        pk: str,
+        sk: str,
+        consistent_read: bool = False,
+        use_dax: bool = False,
+        projection_expression: str | None = None,
+        expression_attribute_names: dict[str, str] | None = None,
+    ) -> dict[str, Any] | None:
         """
         Get a single item by primary key.
 
@@ -100,14 +198,24 @@ class BaseRepository(ABC, Generic[T]):
             pk: Partition key value
             sk: Sort key value
             consistent_read: Whether to use strongly consistent read
+            use_dax: Read through DAX when configured (for hot, read-mostly keys)
+            projection_expression: Attributes to return (all attributes if omitted)
+            expression_attribute_names: Attribute name substitutions for the projection
 
         Returns:
             Item dict or None if not found
         """
         try:
-            response = self.resource.get_item(
-                Key={"PK": pk, "SK": sk}, ConsistentRead=consistent_read
-            )
+            params = {"Key": {"PK": pk, "SK": sk}, "ConsistentRead": consistent_read}
+
+            if projection_expression:
+                params["ProjectionExpression"] = projection_expression
+
+            if expression_attribute_names:
+                params["ExpressionAttributeNames"] = expression_attribute_names
+
+            table = self.read_resource if use_dax else self.resource
+            response = table.get_item(**params)
             return response.get("Item")
         except ClientError as e:
             error_code = e.response["Error"]["Code"]
@@ -115,20 +223,31 @@ class BaseRepository(ABC, Generic[T]):
                 return None
             raise
 
-    def put_item(self, item: dict[str, Any]) -> dict[str, Any]:
+    def put_item(
+        self, item: dict[str, Any], condition_expression: str | None = None
+    ) -> dict[str, Any] | None:
         """
         Put (create or replace) an item.
 
         Args:
             item: Item to put in the table
+            condition_expression: Condition for the put
 
         Returns:
-            The item that was put
+            The item that was put, or None if condition failed
         """
         try:
-            self.resource.put_item(Item=item)
+            params = {"Item": item}
+
+            if condition_expression:
+                params["ConditionExpression"] = condition_expression
+
+            self.resource.put_item(**params)
             return item
-        except ClientError:
+        except ClientError as e:
+            error_code = e.response["Error"]["Code"]
+            if error_code == "ConditionalCheckFailedException":
+                return None
             raise
 
     def update_item(
@@ -202,6 +321,145 @@ class BaseRepository(ABC, Generic[T]):
                 return False
             raise
 
+    def transact_write(self, transact_items: list[dict[str, Any]]) -> bool:
+        """
+        Write several items atomically in one TransactWriteItems call.
+
+        Each entry is a single-operation dict ({"Put": {...}}, {"Update": {...}},
+        {"Delete": {...}} or {"ConditionCheck": {...}}) using plain Python values;
+        the table name and AttributeValue serialization are filled in here.
+
+        Args:
+            transact_items: Operations to apply together
+
+        Returns:
+            True if committed, False if a condition check cancelled the transaction
+        """
+        try:
+            self.client.transact_write_items(
+                TransactItems=self._serialize_transact_items(transact_items)
+            )
+            return True
+        except ClientError as e:
+            if e.response["Error"]["Code"] == "TransactionCanceledException":
+                reasons = e.response.get("CancellationReasons", [])
+                if any(reason.get("Code") == "ConditionalCheckFailed" for reason in reasons):
+                    return False
+            raise
+
+    @staticmethod
+    def counter_update(
+        pk: str,
+        sk: str,
+        counter: str,
+        data_updates: dict[str, Any] | None = None,
+        attribute_updates: dict[str, Any] | None = None,
+        counter_sort_key: str | None = None,
+    ) -> dict[str, Any]:
+        """
+        Build a transaction Update that increments a counter inside an item's Data map.
+
+        A nested Data path cannot be created and incremented in one update
+        expression, so the increment is conditioned on Data existing; pair it
+        with a seed item in transact_counters.
+
+        Args:
+            pk: Partition key value
+            sk: Sort key value
+            counter: Name of the counter attribute inside Data
+            data_updates: Other Data attributes to set alongside the increment
+            attribute_updates: Top-level attributes to set alongside the increment
+            counter_sort_key: Top-level attribute that receives the new counter value
+                (e.g. a numeric GSI sort key)
+
+        Returns:
+            {"Update": {...}} entry for transact_write/transact_counters
+        """
+        set_parts = ["#data.#counter = if_not_exists(#data.#counter, :zero) + :increment"]
+        expression_values = {":increment": 1, ":zero": 0}
+        expression_names = {"#data": "Data", "#counter": counter}
+
+        for key, value in (data_updates or {}).items():
+            set_parts.append(f"#data.#{key} = :{key}")
+            expression_values[f":{key}"] = value
+            expression_names[f"#{key}"] = key
+
+        for key, value in (attribute_updates or {}).items():
+            set_parts.append(f"#{key} = :{key}")
+            expression_values[f":{key}"] = value
+            expression_names[f"#{key}"] = key
+
+        if counter_sort_key:
+            # Right-hand sides read the pre-update item, so this equals the new count
+            set_parts.append("#sort_key = if_not_exists(#data.#counter, :zero) + :increment")
+            expression_names["#sort_key"] = counter_sort_key
+
+        return {
+            "Update": {
+                "Key": {"PK": pk, "SK": sk},
+                "UpdateExpression": "SET " + ", ".join(set_parts),
+                "ConditionExpression": "attribute_exists(#data)",
+                "ExpressionAttributeNames": expression_names,
+                "ExpressionAttributeValues": expression_values,
+            }
+        }
+
+    def transact_counters(
+        self,
+        transact_items: list[dict[str, Any]],
+        counter_seeds: list[dict[str, Any]],
+    ) -> bool:
+        """
+        Write items and increment counters in one transaction, seeding missing counters.
+
+        transact_items ends with one counter_update entry per seed item, in the
+        same order. When only counter updates fail their condition (the counter
+        item doesn't exist yet), those counters are seeded with a conditional put
+        and the transaction is retried once.
+
+        Args:
+            transact_items: Leading operations followed by the counter updates
+            counter_seeds: Item each trailing counter starts from (counter at 0)
+
+        Returns:
+            True if committed, False if a leading operation's condition failed
+        """
+        leading = len(transact_items) - len(counter_seeds)
+        serialized = self._serialize_transact_items(transact_items)
+
+        for _ in range(2):
+            try:
+                self.client.transact_write_items(TransactItems=serialized)
+                return True
+            except ClientError as e:
+                if e.response["Error"]["Code"] != "TransactionCanceledException":
+                    raise
+                reasons = [r.get("Code") for r in e.response.get("CancellationReasons", [])]
+                if "ConditionalCheckFailed" in reasons[:leading]:
+                    return False
+                if "ConditionalCheckFailed" not in reasons:
+                    raise
+
+            for seed_item, reason in zip(counter_seeds, reasons[leading:], strict=False):
+                if reason == "ConditionalCheckFailed":
+                    self.put_item(seed_item, condition_expression="attribute_not_exists(PK)")
+
+        return False
+
+    def _serialize_transact_items(
+        self, transact_items: list[dict[str, Any]]
+    ) -> list[dict[str, Any]]:
+        """Add the table name and serialize values for TransactWriteItems."""
+        serialized = []
+        for entry in transact_items:
+            operation, params = next(iter(entry.items()))
+            params = {**params, "TableName": self.table_name}
+            for field in ("Item", "Key", "ExpressionAttributeValues"):
+                if field in params:
+                    params[field] = _serialize_map(params[field])
+            serialized.append({operation: params})
+        return serialized
+
     def query(
         self,
         key_condition_expression: str,
@@ -212,6 +470,7 @@ class BaseRepository(ABC, Generic[T]):
         scan_index_forward: bool = True,
         limit: int | None = None,
         exclusive_start_key: dict[str, Any] | None = None,
+        projection_expression: str | None = None,
     ) -> dict[str, Any]:
         """
         Query items.
@@ -225,112 +484,226 @@ class BaseRepository(ABC, Generic[T]):
             scan_index_forward: True for ascending, False for descending
             limit: Maximum number of items to return
             exclusive_start_key: Start key for pagination
+            projection_expression: Attributes to return (all attributes if omitted)
 
         Returns:
             Dict with 'Items' list and optional 'LastEvaluatedKey'
         """
-        try:
-            params = {
-                "KeyConditionExpression": key_condition_expression,
-                "ExpressionAttributeValues": expression_attribute_values,
-                "ScanIndexForward": scan_index_forward,
-            }
+        params = self._query_params(
+            key_condition_expression,
+            expression_attribute_values,
+            expression_attribute_names,
+            filter_expression,
+            index_name,
+            scan_index_forward,
+            limit,
+            exclusive_start_key,
+            projection_expression,
+        )
+        response = self.resource.query(**params)
+
+        return {
+            "Items": response.get("Items", []),
+            "LastEvaluatedKey": response.get("LastEvaluatedKey"),
+        }
+
+    def client_query(
+        self,
+        key_condition_expression: str,
+        expression_attribute_values: dict[str, Any],
+        expression_attribute_names: dict[str, str] | None = None,
+        filter_expression: str | None = None,
+        index_name: str | None = None,
+        scan_index_forward: bool = True,
+        limit: int | None = None,
+        exclusive_start_key: dict[str, Any] | None = None,
+        projection_expression: str | None = None,
+    ) -> dict[str, Any]:
+        """
+        Query items through the low-level client.
 
-            if expression_attribute_names:
-                params["ExpressionAttributeNames"] = expression_attribute_names
+        Same arguments and result as query(), but safe to call from worker
+        threads: boto3 clients are thread-safe, the Table resource used by
+        query() is not.
 
-            if filter_expression:
-                params["FilterExpression"] = filter_expression
+        Returns:
+            Dict with 'Items' list and optional 'LastEvaluatedKey'
+        """
+        params = self._query_params(
+            key_condition_expression,
+            _serialize_map(expression_attribute_values),
+            expression_attribute_names,
+            filter_expression,
+            index_name,
+            scan_index_forward,
+            limit,
+            _serialize_map(exclusive_start_key) if exclusive_start_key else None,
+            projection_expression,
+        )
+        response = self.client.query(TableName=self.table_name, **params)
+
+        last_evaluated_key = response.get("LastEvaluatedKey")
+        return {
+            "Items": [_deserialize_map(item) for item in response.get("Items", [])],
+            "LastEvaluatedKey": (
+                _deserialize_map(last_evaluated_key) if last_evaluated_key else None
+            ),
+        }
+
+    @staticmethod
+    def _query_params(
+        key_condition_expression: str,
+        expression_attribute_values: dict[str, Any],
+        expression_attribute_names: dict[str, str] | None,
+        filter_expression: str | None,
+        index_name: str | None,
+        scan_index_forward: bool,
+        limit: int | None,
+        exclusive_start_key: dict[str, Any] | None,
+        projection_expression: str | None,
+    ) -> dict[str, Any]:
+        """Build Query request parameters shared by query() and client_query()."""
+        params = {
+            "KeyConditionExpression": key_condition_expression,
+            "ExpressionAttributeValues": expression_attribute_values,
+            "ScanIndexForward": scan_index_forward,
+        }
 
-            if index_name:
-                params["IndexName"] = index_name
+        if expression_attribute_names:
+            params["ExpressionAttributeNames"] = expression_attribute_names
 
-            if limit:
-                params["Limit"] = limit
+        if filter_expression:
+            params["FilterExpression"] = filter_expression
 
-            if exclusive_start_key:
-                params["ExclusiveStartKey"] = exclusive_start_key
+        if index_name:
+            params["IndexName"] = index_name
 
-            response = self.resource.query(**params)
+        if limit:
+            params["Limit"] = limit
 
-            return {
-                "Items": response.get("Items", []),
-                "LastEvaluatedKey": response.get("LastEvaluatedKey"),
-            }
-        except ClientError:
-            raise
+        if exclusive_start_key:
+            params["ExclusiveStartKey"] = exclusive_start_key
+
+        if projection_expression:
+            params["ProjectionExpression"] = projection_expression
 
-    def batch_get_items(self, keys: list[dict[str, str]]) -> list[dict[str, Any]]:
+        return params
+
+    def batch_get_items(
+        self,
+        keys: list[dict[str, str]],
+        max_retries: int = 5,
+        projection_expression: str | None = None,
+        expression_attribute_names: dict[str, str] | None = None,
+        consistent_read: bool = False,
+    ) -> list[dict[str, Any]]:
         """
-        Get multiple items in a single request.
+        Get multiple items in batches.
+
+        Sends BatchGetItem requests of up to 100 keys and re-requests any
+        UnprocessedKeys with jittered exponential backoff.
 
         Args:
             keys: List of {PK, SK} dicts (plain string values)
+            max_retries: Retries per batch while keys remain unprocessed
+            projection_expression: Attributes to return (all attributes if omitted)
+            expression_attribute_names: Attribute name substitutions for the projection
+            consistent_read: Whether to use strongly consistent reads (double the RCU)
 
         Returns:
-            List of items
+            List of items (keys still unprocessed after max_retries are omitted
+            and logged as a warning)
         """
+        read_params = {"ConsistentRead": consistent_read}
+        if projection_expression:
+            read_params["ProjectionExpression"] = projection_expression
+        if expression_attribute_names:
+            read_params["ExpressionAttributeNames"] = expression_attribute_names
+
         try:
             # Use DynamoDB service resource which handles type conversion automatically
             responses = []
             for i in range(0, len(keys), 100):
-                batch_keys = keys[i : i + 100]
-
-                response = self.dynamodb_resource.batch_get_item(
-                    RequestItems={self.table_name: {"Keys": batch_keys}}
-                )
-
-                responses.extend(response["Responses"].get(self.table_name, []))
+                request_items = {self.table_name: {"Keys": keys[i : i + 100], **read_params}}
+
+                for attempt in range(max_retries + 1):
+                    response = self.dynamodb_resource.batch_get_item(RequestItems=request_items)
+                    responses.extend(response["Responses"].get(self.table_name, []))
+
+                    request_items = response.get("UnprocessedKeys") or {}
+                    if not request_items:
+                        break
+                    if attempt < max_retries:
+                        time.sleep(_BATCH_BACKOFF_BASE * 2**attempt + random.uniform(0, 0.05))
+                else:
+                    logger.warning(
+                        "batch_get_items: %d keys still unprocessed after %d retries: %s",
+                        len(request_items[self.table_name]["Keys"]),
+                        max_retries,
+                        request_items[self.table_name]["Keys"],
+                    )
 
             return responses
         except ClientError:
             raise
 
-    def batch_write_items(self, items: list[dict[str, Any]]) -> bool:
+    def batch_write_items(self, items: list[dict[str, Any]], max_retries: int = 5) -> bool:
         """
         Write multiple items in batches.
 
+        Sends BatchWriteItem requests of up to 25 puts and re-sends any
+        UnprocessedItems with jittered exponential backoff.
+
         Args:
             items: List of items to write
+            max_retries: Retries per batch while items remain unprocessed
 
         Returns:
-            True if all items written successfully
+            True if all items written successfully, False if items were still
+            unprocessed after max_retries
         """
         try:
             # Batch write items (max 25 per request)
             for i in range(0, len(items), 25):
-                batch_items = items[i : i + 25]
-
-                with self.resource.batch_writer() as batch:
-                    for item in batch_items:
-                        batch.put_item(Item=item)
+                request_items = {
+                    self.table_name: [{"PutRequest": {"Item": item}} for item in items[i : i + 25]]
+                }
+
+                for attempt in range(max_retries + 1):
+                    # Service resource handles type conversion, including UnprocessedItems
+                    response = self.dynamodb_resource.batch_write_item(RequestItems=request_items)
+                    request_items = response.get("UnprocessedItems") or {}
+                    if not request_items:
+                        break
+                    if attempt < max_retries:
+                        time.sleep(_BATCH_BACKOFF_BASE * 2**attempt + random.uniform(0, 0.05))
+                else:
+                    return False
 
             return True
         except ClientError:
             raise
 
-    @abstractmethod
-    def to_item(self, data: T) -> dict[str, Any]:
+    def to_item(self, data: dict[str, Any]) -> dict[str, Any]:
         """
-        Convert domain model to DynamoDB item.
+        Convert domain data to DynamoDB item.
 
         Args:
-            data: Domain model instance
+            data: Domain data dict
 
         Returns:
             DynamoDB item dict
         """
-        pass
+        raise NotImplementedError
 
-    @abstractmethod
-    def from_item(self, item: dict[str, Any]) -> T:
+    def from_item(self, item: dict[str, Any]) -> dict[str, Any]:
         """
-        Convert DynamoDB item to domain model.
+        Convert DynamoDB item to domain data.
 
         Args:
             item: DynamoDB item dict
 
         Returns:
-            Domain model instance
+            Domain data dict
         """
-        pass
+        raise NotImplementedError
@@ -5,11 +5,70 @@ Implements all blog post operations following the single-table design
 specified in docs/DYNAMODB-DESIGN.md.
 """
 
+import re
 import uuid
 from datetime import UTC, datetime
 from typing import Any
 
+from boto3.dynamodb.conditions import Key
+
 from src.repositories.base import BaseRepository
+from src.utils.cache import TTLCache
+
+# Slug generation: spaces become dashes, then anything but Unicode letters, digits
+# and dashes is dropped
+_SPACE_TO_DASH = str.maketrans({" ": "-"})
+_SLUG_RE = re.compile(r"[^\w-]|_")
+
+# Read time estimate: whitespace-separated words per minute
+_WORDS_PER_MINUTE = 200
+
+# GSI1 partitions for each post status
+_GSI_BLOG_PUBLISHED = "BLOG#STATUS#PUBLISHED"
+_GSI_BLOG_DRAFT = "BLOG#STATUS#DRAFT"
+
+# Category counters share one partition. The count is a top-level attribute so one
+# update can both seed a new category item and ADD to its count.
+_CATEGORY_PK = "BLOG#CATEGORIES"
+_CATEGORY_ADJUST = (
+    "SET EntityType = if_not_exists(EntityType, :entity_type), "
+    "#data = if_not_exists(#data, :data) ADD CategoryCount :delta"
+)
+
+
+def _category_count_update(category: str, delta: int) -> dict[str, Any]:
+    """Build a transaction Update that adds delta to a category's post count."""
+    return {
+        "Update": {
+            "Key": {"PK": _CATEGORY_PK, "SK": f"CATEGORY#{category}"},
+            "UpdateExpression": _CATEGORY_ADJUST,
+            "ExpressionAttributeNames": {"#data": "Data"},
+            "ExpressionAttributeValues": {
+                ":entity_type": "BLOG_CATEGORY",
+                ":data": {"category": category},
+                ":delta": delta,
+            },
+        }
+    }
+
+
+# Category counts change far less often than they are read, so cache the list
+# briefly. Writes through this process reset it; other instances see changes
+# within _CATEGORY_CACHE_TTL seconds.
+_CATEGORY_CACHE_TTL = 60.0
+_CATEGORIES_KEY = "categories"
+
+_category_cache = TTLCache(ttl=_CATEGORY_CACHE_TTL, max_size=1)
+
+
+# Data attributes that update() may change
+_UPDATABLE = frozenset({"title", "excerpt", "content", "category", "tags", "readTime", "updatedAt"})
+
+
+def _read_time(content: str) -> int:
+    """Estimate read time in minutes (at least 1)."""
+    word_count = len(content.split())
+    return max(1, word_count // _WORDS_PER_MINUTE)
 
 
 class BlogRepository(BaseRepository):
@@ -27,6 +86,8 @@ class BlogRepository(BaseRepository):
     8. Get blog categories
     """
 
+    __slots__ = ()
+
     def to_item(self, data: dict[str, Any]) -> dict[str, Any]:
         """
         Convert blog post dict to DynamoDB item.
@@ -40,12 +101,16 @@ class BlogRepository(BaseRepository):
         blog_id = data.get("id") or str(uuid.uuid4())
         status = data.get("status", "DRAFT")
         published_at = data.get("publishedAt")
-        created_at = data.get("createdAt") or datetime.now(UTC).isoformat()
+        created_at = data.get("createdAt")
+        updated_at = data.get("updatedAt")
+        # create() always supplies both timestamps, so only read the clock when one is missing
+        if not created_at or not updated_at:
+            now = datetime.now(UTC).isoformat()
+            created_at = created_at or now
+            updated_at = updated_at or now
 
-        # Calculate read time (simple: 200 words per minute)
         content = data.get("content", "")
-        word_count = len(content.split())
-        read_time = max(1, word_count // 200)
+        read_time = _read_time(content)
 
         item = {
             "PK": f"BLOG#{blog_id}",
@@ -65,7 +130,7 @@ class BlogRepository(BaseRepository):
                 "readTime": read_time,
                 "publishedAt": published_at,
                 "createdAt": created_at,
-                "updatedAt": data.get("updatedAt") or datetime.now(UTC).isoformat(),
+                "updatedAt": updated_at,
             },
         }
 
@@ -84,12 +149,14 @@ class BlogRepository(BaseRepository):
         if not item or "Data" not in item:
             return None
 
-        # Merge Data with top-level Status field
-        result = {**item["Data"]}
-        if "Status" in item:
-            result["status"] = item["Status"]
+        # Merge top-level Status into Data in place; items come fresh from boto3
+        # and are not reused by callers, so copying them is wasted work
+        data = item["Data"]
+        status = item.get("Status")
+        if status is not None:
+            data["status"] = status
 
-        return result
+        return data
 
     def create(self, data: dict[str, Any]) -> dict[str, Any]:
         """
@@ -103,23 +170,27 @@ class BlogRepository(BaseRepository):
         """
         # Generate slug from title if not provided
         if not data.get("slug") and data.get("title"):
-            slug = data["title"].lower().replace(" ", "-")
-            # Remove special characters
-            slug = "".join(c for c in slug if c.isalnum() or c == "-")
-            data["slug"] = slug
+            data["slug"] = _SLUG_RE.sub("", data["title"].lower().translate(_SPACE_TO_DASH))
+            if not data["slug"]:
+                # Nothing sluggable in the title (e.g. only punctuation): use the post id
+                data["id"] = data.get("id") or str(uuid.uuid4())
+                data["slug"] = data["id"]
 
         # Set initial status as draft
         data["status"] = "DRAFT"
-        data["createdAt"] = datetime.now(UTC).isoformat()
-        data["updatedAt"] = datetime.now(UTC).isoformat()
+        now = datetime.now(UTC).isoformat()
+        data["createdAt"] = now
+        data["updatedAt"] = now
 
         item = self.to_item(data)
-        self.put_item(item)
 
-        # Update category count
+        # Write the post and bump its category count in one atomic round trip
         category = data.get("category")
         if category:
-            self._increment_category_count(category)
+            self.transact_write([{"Put": {"Item": item}}, _category_count_update(category, 1)])
+            _category_cache.clear()
+        else:
+            self.put_item(item)
 
         return self.from_item(item)
 
@@ -183,7 +254,7 @@ class BlogRepository(BaseRepository):
             exclusive_start_key=last_evaluated_key,
         )
 
-        items = [self.from_item(item) for item in result["Items"]]
+        items = list(map(self.from_item, result["Items"]))
 
         return {
             "items": items,
@@ -207,52 +278,65 @@ class BlogRepository(BaseRepository):
         if not current_post:
             return None
 
-        # Build update expression
-        update_parts = []
-        expression_values = {}
-        expression_names = {}
+        # Nothing to change: skip the write rather than bump updatedAt alone
+        if not any(key in _UPDATABLE and key != "updatedAt" for key in data):
+            return current_post
 
         # Update timestamp
         data["updatedAt"] = datetime.now(UTC).isoformat()
 
         # Recalculate read time if content changed
         if "content" in data:
-            word_count = len(data["content"].split())
-            data["readTime"] = max(1, word_count // 200)  # 200 words per minute
+            data["readTime"] = _read_time(data["content"])
 
         # Build update expression for Data attributes
-        for key, value in data.items():
-            if key in ["title", "excerpt", "content", "category", "tags", "readTime", "updatedAt"]:
-                update_parts.append(f"#data.#{key} = :{key}")
-                expression_values[f":{key}"] = value
-                expression_names[f"#{key}"] = key
-
-        if not update_parts:
-            return current_post
+        fields = [key for key in data if key in _UPDATABLE]
 
+        update_expression = "SET " + ", ".join(f"#data.#{key} = :{key}" for key in fields)
+        expression_values = {f":{key}": data[key] for key in fields}
+        expression_names = {f"#{key}": key for key in fields}
         expression_names["#data"] = "Data"
-        update_expression = "SET " + ", ".join(update_parts)
-
-        updated_item = self.update_item(
-            pk=f"BLOG#{blog_id}",
-            sk="METADATA",
-            update_expression=update_expression,
-            expression_attribute_values=expression_values,
-            expression_attribute_names=expression_names,
-            condition_expression="attribute_exists(PK)",
-        )
 
-        # Handle category count update if category changed
-        if "category" in data and data["category"] != current_post.get("category"):
-            old_category = current_post.get("category")
-            new_category = data["category"]
+        key = {"PK": f"BLOG#{blog_id}", "SK": "METADATA"}
+        old_category = current_post.get("category")
+        new_category = data.get("category", old_category)
+
+        if new_category == old_category:
+            updated_item = self.update_item(
+                pk=key["PK"],
+                sk=key["SK"],
+                update_expression=update_expression,
+                expression_attribute_values=expression_values,
+                expression_attribute_names=expression_names,
+                condition_expression="attribute_exists(PK)",
+            )
+            return self.from_item(updated_item) if updated_item else None
+
+        # Category changed: move the post between category counts in the same
+        # transaction, so the counts only change if the post still exists
+        transact_items = [
+            {
+                "Update": {
+                    "Key": key,
+                    "UpdateExpression": update_expression,
+                    "ConditionExpression": "attribute_exists(PK)",
+                    "ExpressionAttributeNames": expression_names,
+                    "ExpressionAttributeValues": expression_values,
+                }
+            }
+        ]
+        if old_category:
+            transact_items.append(_category_count_update(old_category, -1))
+        if new_category:
+            transact_items.append(_category_count_update(new_category, 1))
+
+        if not self.transact_write(transact_items):
+            return None
+        _category_cache.clear()
 
-            if old_category:
-                self._decrement_category_count(old_category)
-            if new_category:
-                self._increment_category_count(new_category)
-
-        return self.from_item(updated_item) if updated_item else None
+        # Transactions return no attributes, so apply the change to the post read above
+        current_post.update((field, data[field]) for field in fields)
+        return current_post
 
     def delete(self, blog_id: str) -> bool:
         """
@@ -264,21 +348,44 @@ class BlogRepository(BaseRepository):
         Returns:
             True if deleted, False if not found
         """
-        # Get post to update category count
-        post = self.get_by_id(blog_id)
-        if not post:
-            return False
-
-        # Delete the post
-        deleted = self.delete_item(
-            pk=f"BLOG#{blog_id}", sk="METADATA", condition_expression="attribute_exists(PK)"
-        )
-
-        # Decrement category count
-        if deleted and post.get("category"):
-            self._decrement_category_count(post["category"])
-
-        return deleted
+        key = {"PK": f"BLOG#{blog_id}", "SK": "METADATA"}
+
+        # Remove the post and its category count together, so a failed write can't
+        # leave the count high. The delete is conditioned on the category read here;
+        # if a concurrent update moved the post, read it again and retry once.
+        for _ in range(2):
+            item = self.get_item(
+                pk=key["PK"],
+                sk=key["SK"],
+                consistent_read=True,
+                projection_expression="#data.category",
+                expression_attribute_names={"#data": "Data"},
+            )
+            if not item:
+                return False
+
+            category = item.get("Data", {}).get("category")
+            if not category:
+                return self.delete_item(
+                    pk=key["PK"], sk=key["SK"], condition_expression="attribute_exists(PK)"
+                )
+
+            delete = {
+                "Delete": {
+                    "Key": key,
+                    "ConditionExpression": "#data.category = :category",
+                    "ExpressionAttributeNames": {"#data": "Data"},
+                    "ExpressionAttributeValues": {":category": category},
+                }
+            }
+            # Unconditional decrement, like the increment: for a category still only
+            # counted under the legacy keys this leaves -1, which
+            # migrate_category_counts folds in
+            if self.transact_write([delete, _category_count_update(category, -1)]):
+                _category_cache.clear()
+                return True
+
+        return False
 
     def publish(self, blog_id: str) -> dict[str, Any] | None:
         """
@@ -298,7 +405,7 @@ class BlogRepository(BaseRepository):
             update_expression="SET #status = :published, GSI1PK = :gsi1pk, GSI1SK = :gsi1sk, #data.#status = :published, #data.publishedAt = :publishedAt, #data.updatedAt = :updatedAt",
             expression_attribute_values={
                 ":published": "PUBLISHED",
-                ":gsi1pk": "BLOG#STATUS#PUBLISHED",
+                ":gsi1pk": _GSI_BLOG_PUBLISHED,
                 ":gsi1sk": f"BLOG#{published_at}",
                 ":publishedAt": published_at,
                 ":updatedAt": published_at,
@@ -325,8 +432,8 @@ class BlogRepository(BaseRepository):
         if not post:
             return None
 
-        created_at = post.get("createdAt", datetime.now(UTC).isoformat())
         updated_at = datetime.now(UTC).isoformat()
+        created_at = post.get("createdAt", updated_at)
 
         updated_item = self.update_item(
             pk=f"BLOG#{blog_id}",
@@ -334,7 +441,7 @@ class BlogRepository(BaseRepository):
             update_expression="SET #status = :draft, GSI1PK = :gsi1pk, GSI1SK = :gsi1sk, #data.#status = :draft, #data.publishedAt = :null, #data.updatedAt = :updatedAt",
             expression_attribute_values={
                 ":draft": "DRAFT",
-                ":gsi1pk": "BLOG#STATUS#DRAFT",
+                ":gsi1pk": _GSI_BLOG_DRAFT,
                 ":gsi1sk": f"BLOG#{created_at}",
                 ":null": None,
                 ":updatedAt": updated_at,
@@ -353,69 +460,77 @@ class BlogRepository(BaseRepository):
         Returns:
             List of categories with counts
         """
-        from boto3.dynamodb.conditions import Key
-
-        # Use scan with filter since we can't use begins_with on partition key in query
-        result = self.resource.scan(
-            FilterExpression=Key("PK").begins_with("BLOG#CATEGORY#") & Key("SK").eq("COUNT")
-        )
+        cached = _category_cache.get(_CATEGORIES_KEY)
+        if cached is not None:
+            return cached
 
+        # All category counters share one partition, so a bounded Query reads them
+        # without scanning the rest of the table
         categories = []
-        for item in result.get("Items", []):
-            category_name = item["PK"].replace("BLOG#CATEGORY#", "")
-            categories.append(
-                {"name": category_name, "count": item.get("Data", {}).get("count", 0)}
+        last_evaluated_key = None
+        while True:
+            result = self.query(
+                key_condition_expression="PK = :pk",
+                expression_attribute_values={":pk": _CATEGORY_PK},
+                exclusive_start_key=last_evaluated_key,
             )
 
-        return categories
+            for item in result["Items"]:
+                categories.append(
+                    {
+                        "name": item.get("Data", {}).get("category"),
+                        "count": item.get("CategoryCount", 0),
+                    }
+                )
 
-    def _increment_category_count(self, category: str) -> None:
-        """
-        Increment category count.
+            last_evaluated_key = result.get("LastEvaluatedKey")
+            if not last_evaluated_key:
+                break
 
-        Args:
-            category: Category name
+        _category_cache.set(_CATEGORIES_KEY, categories)
+        return categories
+
+    def migrate_category_counts(self) -> dict[str, int]:
         """
-        try:
-            # First, set the Data structure if it doesn't exist
-            self.update_item(
-                pk=f"BLOG#CATEGORY#{category}",
-                sk="COUNT",
-                update_expression="SET EntityType = if_not_exists(EntityType, :entity_type), #data = if_not_exists(#data, :empty_data)",
-                expression_attribute_values={
-                    ":entity_type": "BLOG_CATEGORY",
-                    ":empty_data": {"category": category, "count": 0},
-                },
-                expression_attribute_names={"#data": "Data"},
-            )
+        Move category counters from the legacy per-category items into the shared partition.
 
-            # Then increment the count
-            self.update_item(
-                pk=f"BLOG#CATEGORY#{category}",
-                sk="COUNT",
-                update_expression="SET #data.#count = if_not_exists(#data.#count, :zero) + :increment",
-                expression_attribute_values={":increment": 1, ":zero": 0},
-                expression_attribute_names={"#data": "Data", "#count": "count"},
-            )
-        except Exception as e:
-            # Log error but don't fail the main operation
-            print(f"Error incrementing category count: {e}")
+        Counters used to live at BLOG#CATEGORY#<name>/COUNT (Data.count). Each one
+        is added to BLOG#CATEGORIES/CATEGORY#<name>, which may already hold
+        changes made since the new layout shipped, and deleted in the same
+        transaction, so re-running the migration never counts a post twice.
+        One-off maintenance run via scripts/backfill_data.py.
 
-    def _decrement_category_count(self, category: str) -> None:
+        Returns:
+            Dict mapping category name to the legacy count that was moved
         """
-        Decrement category count.
+        params = {
+            "FilterExpression": Key("PK").begins_with("BLOG#CATEGORY#") & Key("SK").eq("COUNT"),
+            "ProjectionExpression": "PK, #data.#count",
+            "ExpressionAttributeNames": {"#data": "Data", "#count": "count"},
+        }
 
-        Args:
-            category: Category name
-        """
-        try:
-            self.update_item(
-                pk=f"BLOG#CATEGORY#{category}",
-                sk="COUNT",
-                update_expression="SET #data.#count = #data.#count - :decrement",
-                expression_attribute_values={":decrement": 1},
-                expression_attribute_names={"#data": "Data", "#count": "count"},
-            )
-        except Exception as e:
-            # Log error but don't fail the main operation
-            print(f"Error decrementing category count: {e}")
+        migrated: dict[str, int] = {}
+        while True:
+            result = self.resource.scan(**params)
+            for item in result["Items"]:
+                category = item["PK"].removeprefix("BLOG#CATEGORY#")
+                count = int(item.get("Data", {}).get("count", 0))
+                moved = self.transact_write(
+                    [
+                        {
+                            "Delete": {
+                                "Key": {"PK": item["PK"], "SK": "COUNT"},
+                                "ConditionExpression": "attribute_exists(PK)",
+                            }
+                        },
+                        _category_count_update(category, count),
+                    ]
+                )
+                if moved:
+                    migrated[category] = count
+            if "LastEvaluatedKey" not in result:
+                break
+            params["ExclusiveStartKey"] = result["LastEvaluatedKey"]
+
+        _category_cache.clear()
+        return migrated
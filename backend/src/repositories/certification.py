@@ -5,27 +5,75 @@ Implements all certification operations following the single-table design
 specified in docs/DYNAMODB-DESIGN.md.
 """
 
+import heapq
+import itertools
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from datetime import UTC, datetime
 from typing import Any
 
 from src.repositories.base import BaseRepository
 
+# Certification types stored under separate GSI1 partitions
+_CERT_TYPES = ("certification", "course")
+
+# GSI1 partition keys for the known status/type combinations
+_GSI_CERT = {
+    (status, cert_type): f"CERT#STATUS#{status}#{cert_type}"
+    for status in ("PUBLISHED", "DRAFT")
+    for cert_type in _CERT_TYPES
+}
+
+
+def _cert_gsi1pk(status: str, cert_type: str) -> str:
+    """Return the GSI1 partition key for a status/type pair."""
+    return _GSI_CERT.get((status, cert_type)) or f"CERT#STATUS#{status}#{cert_type}"
+
+
+# Data attributes that update() may change
+_UPDATABLE = frozenset(
+    {
+        "name",
+        "issuer",
+        "icon",
+        "type",
+        "featured",
+        "description",
+        "credentialUrl",
+        "dateEarned",
+        "updatedAt",
+    }
+)
+
+# Shared pool for the independent per-type queries. Workers use client_query: boto3
+# clients are thread-safe, Table resources are not.
+_QUERY_POOL = ThreadPoolExecutor(max_workers=2, thread_name_prefix="certification-query")
+
 
 class CertificationRepository(BaseRepository):
     """Repository for certification operations."""
 
+    __slots__ = ()
+
     def to_item(self, data: dict[str, Any]) -> dict[str, Any]:
         """Convert certification dict to DynamoDB item."""
         cert_id = data.get("id") or str(uuid.uuid4())
         status = data.get("status", "DRAFT")
         cert_type = data.get("type", "certification")
-        date_earned = data.get("dateEarned") or datetime.now(UTC).isoformat()
+        date_earned = data.get("dateEarned")
+        created_at = data.get("createdAt")
+        updated_at = data.get("updatedAt")
+        # Only read the clock when a timestamp actually needs a default
+        if not (date_earned and created_at and updated_at):
+            now = datetime.now(UTC).isoformat()
+            date_earned = date_earned or now
+            created_at = created_at or now
+            updated_at = updated_at or now
 
         item = {
             "PK": f"CERT#{cert_id}",
             "SK": "METADATA",
-            "GSI1PK": f"CERT#STATUS#{status}#{cert_type}",
+            "GSI1PK": _cert_gsi1pk(status, cert_type),
             "GSI1SK": f"CERT#{date_earned}",
             "EntityType": "CERTIFICATION",
             "Status": status,
@@ -39,8 +87,8 @@ class CertificationRepository(BaseRepository):
                 "description": data.get("description", ""),
                 "credentialUrl": data.get("credentialUrl"),
                 "dateEarned": date_earned,
-                "createdAt": data.get("createdAt") or datetime.now(UTC).isoformat(),
-                "updatedAt": data.get("updatedAt") or datetime.now(UTC).isoformat(),
+                "createdAt": created_at,
+                "updatedAt": updated_at,
             },
         }
         return item
@@ -50,18 +98,21 @@ class CertificationRepository(BaseRepository):
         if not item or "Data" not in item:
             return None
 
-        # Merge Data with top-level Status field
-        result = {**item["Data"]}
-        if "Status" in item:
-            result["status"] = item["Status"]
+        # Merge top-level Status into Data in place; items come fresh from boto3
+        # and are not reused by callers, so copying them is wasted work
+        data = item["Data"]
+        status = item.get("Status")
+        if status is not None:
+            data["status"] = status
 
-        return result
+        return data
 
     def create(self, data: dict[str, Any]) -> dict[str, Any]:
         """Create a new certification."""
         data["status"] = "DRAFT"
-        data["createdAt"] = datetime.now(UTC).isoformat()
-        data["updatedAt"] = datetime.now(UTC).isoformat()
+        now = datetime.now(UTC).isoformat()
+        data["createdAt"] = now
+        data["updatedAt"] = now
 
         item = self.to_item(data)
         self.put_item(item)
@@ -83,41 +134,25 @@ class CertificationRepository(BaseRepository):
         """List certifications with filtering."""
         # When status is provided without cert_type, we need to query both types
         if status and not cert_type:
-            # Query certification type
-            cert_results = self.query(
-                key_condition_expression="GSI1PK = :gsi1pk",
-                expression_attribute_values={":gsi1pk": f"CERT#STATUS#{status}#certification"},
-                index_name="GSI1",
-                scan_index_forward=False,
-                limit=limit,
-            )
-
-            # Query course type
-            course_results = self.query(
-                key_condition_expression="GSI1PK = :gsi1pk",
-                expression_attribute_values={":gsi1pk": f"CERT#STATUS#{status}#course"},
-                index_name="GSI1",
-                scan_index_forward=False,
-                limit=limit,
+            # The per-type queries are independent, so run them concurrently.
+            # Build the shared client here rather than racing to do it in the workers.
+            _ = self.client
+            futures = [
+                _QUERY_POOL.submit(self._query_status_type, status, type_, featured, limit)
+                for type_ in _CERT_TYPES
+            ]
+
+            # Each query is already newest first (GSI1SK is the earned date), so merge
+            # the two runs lazily and stop at limit instead of sorting everything
+            merged = heapq.merge(
+                *(future.result() for future in futures),
+                key=lambda x: x["Data"].get("dateEarned", ""),
+                reverse=True,
             )
-
-            # Combine results
-            all_items = cert_results["Items"] + course_results["Items"]
-
-            # Apply featured filter if needed
-            if featured is not None:
-                all_items = [
-                    item for item in all_items if item.get("Data", {}).get("featured") == featured
-                ]
-
-            # Sort by date descending
-            all_items.sort(key=lambda x: x.get("Data", {}).get("dateEarned", ""), reverse=True)
-
-            # Limit results
-            items = all_items[:limit]
+            items = list(itertools.islice(merged, limit))
 
             return {
-                "items": [self.from_item(item) for item in items],
+                "items": list(map(self.from_item, items)),
                 "count": len(items),
                 "lastEvaluatedKey": None,  # Simplified for combined queries
             }
@@ -125,7 +160,7 @@ class CertificationRepository(BaseRepository):
         # Single query for other cases
         if status and cert_type:
             key_condition = "GSI1PK = :gsi1pk"
-            expression_values = {":gsi1pk": f"CERT#STATUS#{status}#{cert_type}"}
+            expression_values = {":gsi1pk": _cert_gsi1pk(status, cert_type)}
         else:
             # No status - query certification type only or use Scan
             # For simplicity, return empty if no status provided in tests
@@ -149,7 +184,7 @@ class CertificationRepository(BaseRepository):
             exclusive_start_key=last_evaluated_key,
         )
 
-        items = [self.from_item(item) for item in result["Items"]]
+        items = list(map(self.from_item, result["Items"]))
 
         return {
             "items": items,
@@ -157,34 +192,56 @@ class CertificationRepository(BaseRepository):
             "lastEvaluatedKey": result.get("LastEvaluatedKey"),
         }
 
+    def _query_status_type(
+        self, status: str, cert_type: str, featured: bool | None, limit: int
+    ) -> list[dict[str, Any]]:
+        """
+        Query up to limit items of one status/type partition, newest first.
+
+        DynamoDB applies Limit before FilterExpression, so when filtering on
+        featured keep paging until enough matches are found.
+        """
+        expression_values = {":gsi1pk": _cert_gsi1pk(status, cert_type)}
+        filter_expression = None
+        expression_names = None
+        if featured is not None:
+            filter_expression = "#data.featured = :featured"
+            expression_values[":featured"] = featured
+            expression_names = {"#data": "Data"}
+
+        items = []
+        last_evaluated_key = None
+        while True:
+            # Runs on _QUERY_POOL workers, so go through the thread-safe client
+            result = self.client_query(
+                key_condition_expression="GSI1PK = :gsi1pk",
+                expression_attribute_values=expression_values,
+                expression_attribute_names=expression_names,
+                filter_expression=filter_expression,
+                index_name="GSI1",
+                scan_index_forward=False,
+                limit=limit,
+                exclusive_start_key=last_evaluated_key,
+            )
+            items.extend(result["Items"])
+
+            last_evaluated_key = result.get("LastEvaluatedKey")
+            if len(items) >= limit or not last_evaluated_key:
+                return items[:limit]
+
     def update(self, cert_id: str, data: dict[str, Any]) -> dict[str, Any] | None:
         """Update certification."""
-        update_parts = []
-        expression_values = {}
-        expression_names = {"#data": "Data"}
+        # Nothing to change: skip the write rather than bump updatedAt alone
+        if not any(key in _UPDATABLE and key != "updatedAt" for key in data):
+            return self.get_by_id(cert_id)
 
         data["updatedAt"] = datetime.now(UTC).isoformat()
+        fields = [key for key in data if key in _UPDATABLE]
 
-        for key, value in data.items():
-            if key in [
-                "name",
-                "issuer",
-                "icon",
-                "type",
-                "featured",
-                "description",
-                "credentialUrl",
-                "dateEarned",
-                "updatedAt",
-            ]:
-                update_parts.append(f"#data.#{key} = :{key}")
-                expression_values[f":{key}"] = value
-                expression_names[f"#{key}"] = key
-
-        if not update_parts:
-            return self.get_by_id(cert_id)
-
-        update_expression = "SET " + ", ".join(update_parts)
+        update_expression = "SET " + ", ".join(f"#data.#{key} = :{key}" for key in fields)
+        expression_values = {f":{key}": data[key] for key in fields}
+        expression_names = {f"#{key}": key for key in fields}
+        expression_names["#data"] = "Data"
 
         updated_item = self.update_item(
             pk=f"CERT#{cert_id}",
@@ -218,7 +275,7 @@ class CertificationRepository(BaseRepository):
             update_expression="SET #status = :published, GSI1PK = :gsi1pk, #data.#status = :published, #data.updatedAt = :updatedAt",
             expression_attribute_values={
                 ":published": "PUBLISHED",
-                ":gsi1pk": f"CERT#STATUS#PUBLISHED#{cert_type}",
+                ":gsi1pk": _cert_gsi1pk("PUBLISHED", cert_type),
                 ":updatedAt": updated_at,
                 ":draft": "DRAFT",
             },
@@ -243,7 +300,7 @@ class CertificationRepository(BaseRepository):
             update_expression="SET #status = :draft, GSI1PK = :gsi1pk, #data.#status = :draft, #data.updatedAt = :updatedAt",
             expression_attribute_values={
                 ":draft": "DRAFT",
-                ":gsi1pk": f"CERT#STATUS#DRAFT#{cert_type}",
+                ":gsi1pk": _cert_gsi1pk("DRAFT", cert_type),
                 ":updatedAt": updated_at,
                 ":published": "PUBLISHED",
             },
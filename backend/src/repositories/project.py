@@ -10,6 +10,42 @@ from datetime import UTC, datetime
 from typing import Any
 
 from src.repositories.base import BaseRepository
+from src.utils.cache import TTLCache
+
+# Data attributes that update() may change
+_UPDATABLE = frozenset(
+    {
+        "name",
+        "description",
+        "longDescription",
+        "tech",
+        "company",
+        "featured",
+        "githubUrl",
+        "liveUrl",
+        "imageUrl",
+        "updatedAt",
+    }
+)
+
+# Single-project reads back public pages, so keep recently read projects in
+# memory for a short while. Writes through this process update or evict the
+# entry; other instances see changes once it expires.
+_PROJECT_CACHE_TTL = 30.0
+_PROJECT_CACHE_MAX_SIZE = 256
+
+_project_cache = TTLCache(ttl=_PROJECT_CACHE_TTL, max_size=_PROJECT_CACHE_MAX_SIZE)
+
+
+def _get_cached_project(project_id: str) -> dict[str, Any] | None:
+    """Return a copy of a cached project, or None if missing or expired."""
+    project = _project_cache.get(project_id)
+    return dict(project) if project is not None else None
+
+
+def _cache_project(project: dict[str, Any]) -> None:
+    """Cache a copy of a project for _PROJECT_CACHE_TTL seconds."""
+    _project_cache.set(project["id"], dict(project))
 
 
 class ProjectRepository(BaseRepository):
@@ -26,11 +62,19 @@ class ProjectRepository(BaseRepository):
     7. Unpublish project
     """
 
+    __slots__ = ()
+
     def to_item(self, data: dict[str, Any]) -> dict[str, Any]:
         """Convert project dict to DynamoDB item."""
         project_id = data.get("id") or str(uuid.uuid4())
         status = data.get("status", "DRAFT")
-        created_at = data.get("createdAt") or datetime.now(UTC).isoformat()
+        created_at = data.get("createdAt")
+        updated_at = data.get("updatedAt")
+        # Only read the clock when a timestamp actually needs a default
+        if not (created_at and updated_at):
+            now = datetime.now(UTC).isoformat()
+            created_at = created_at or now
+            updated_at = updated_at or now
 
         item = {
             "PK": f"PROJECT#{project_id}",
@@ -51,7 +95,7 @@ class ProjectRepository(BaseRepository):
                 "liveUrl": data.get("liveUrl"),
                 "imageUrl": data.get("imageUrl"),
                 "createdAt": created_at,
-                "updatedAt": data.get("updatedAt") or datetime.now(UTC).isoformat(),
+                "updatedAt": updated_at,
             },
         }
         return item
@@ -62,26 +106,39 @@ class ProjectRepository(BaseRepository):
             return None
 
         # Merge Data with top-level Status field
-        result = {**item["Data"]}
-        if "Status" in item:
-            result["status"] = item["Status"]
+        result = item["Data"].copy()
+        status = item.get("Status")
+        if status is not None:
+            result["status"] = status
 
         return result
 
     def create(self, data: dict[str, Any]) -> dict[str, Any]:
         """Create a new project."""
         data["status"] = "DRAFT"
-        data["createdAt"] = datetime.now(UTC).isoformat()
-        data["updatedAt"] = datetime.now(UTC).isoformat()
+        now = datetime.now(UTC).isoformat()
+        data["createdAt"] = now
+        data["updatedAt"] = now
 
         item = self.to_item(data)
         self.put_item(item)
-        return self.from_item(item)
+        project = self.from_item(item)
+        _cache_project(project)
+        return project
 
     def get_by_id(self, project_id: str) -> dict[str, Any] | None:
         """Get project by ID."""
+        cached = _get_cached_project(project_id)
+        if cached is not None:
+            return cached
+
         item = self.get_item(pk=f"PROJECT#{project_id}", sk="METADATA")
-        return self.from_item(item) if item else None
+        if not item:
+            return None
+
+        project = self.from_item(item)
+        _cache_project(project)
+        return project
 
     def list_projects(
         self,
@@ -124,33 +181,17 @@ class ProjectRepository(BaseRepository):
 
     def update(self, project_id: str, data: dict[str, Any]) -> dict[str, Any] | None:
         """Update project."""
-        update_parts = []
-        expression_values = {}
-        expression_names = {"#data": "Data"}
+        # Nothing to change: skip the write rather than bump updatedAt alone
+        if not any(key in _UPDATABLE and key != "updatedAt" for key in data):
+            return self.get_by_id(project_id)
 
         data["updatedAt"] = datetime.now(UTC).isoformat()
+        fields = [key for key in data if key in _UPDATABLE]
 
-        for key, value in data.items():
-            if key in [
-                "name",
-                "description",
-                "longDescription",
-                "tech",
-                "company",
-                "featured",
-                "githubUrl",
-                "liveUrl",
-                "imageUrl",
-                "updatedAt",
-            ]:
-                update_parts.append(f"#data.#{key} = :{key}")
-                expression_values[f":{key}"] = value
-                expression_names[f"#{key}"] = key
-
-        if not update_parts:
-            return self.get_by_id(project_id)
-
-        update_expression = "SET " + ", ".join(update_parts)
+        update_expression = "SET " + ", ".join(f"#data.#{key} = :{key}" for key in fields)
+        expression_values = {f":{key}": data[key] for key in fields}
+        expression_names = {f"#{key}": key for key in fields}
+        expression_names["#data"] = "Data"
 
         updated_item = self.update_item(
             pk=f"PROJECT#{project_id}",
@@ -161,13 +202,15 @@ class ProjectRepository(BaseRepository):
             condition_expression="attribute_exists(PK)",
         )
 
-        return self.from_item(updated_item) if updated_item else None
+        return self._refresh_cached(project_id, updated_item)
 
     def delete(self, project_id: str) -> bool:
         """Delete project."""
-        return self.delete_item(
+        deleted = self.delete_item(
             pk=f"PROJECT#{project_id}", sk="METADATA", condition_expression="attribute_exists(PK)"
         )
+        _project_cache.invalidate(project_id)
+        return deleted
 
     def publish(self, project_id: str) -> dict[str, Any] | None:
         """Publish project."""
@@ -187,7 +230,7 @@ class ProjectRepository(BaseRepository):
             condition_expression="#status = :draft",
         )
 
-        return self.from_item(updated_item) if updated_item else None
+        return self._refresh_cached(project_id, updated_item)
 
     def unpublish(self, project_id: str) -> dict[str, Any] | None:
         """Unpublish project."""
@@ -207,4 +250,16 @@ class ProjectRepository(BaseRepository):
             condition_expression="#status = :published",
         )
 
-        return self.from_item(updated_item) if updated_item else None
+        return self._refresh_cached(project_id, updated_item)
+
+    def _refresh_cached(
+        self, project_id: str, updated_item: dict[str, Any] | None
+    ) -> dict[str, Any] | None:
+        """Cache the project returned by a write, or evict it if the write failed."""
+        if not updated_item:
+            _project_cache.invalidate(project_id)
+            return None
+
+        project = self.from_item(updated_item)
+        _cache_project(project)
+        return project
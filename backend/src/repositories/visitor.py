@@ -5,15 +5,38 @@ Implements visitor tracking operations following the single-table design
 specified in docs/DYNAMODB-DESIGN.md.
 """
 
+from collections.abc import Mapping
 from datetime import UTC, datetime, timedelta
+from types import MappingProxyType
 from typing import Any
 
+from boto3.dynamodb.conditions import Key
+
 from src.repositories.base import BaseRepository
+from src.utils.cache import TTLCache
+
+# The counter and daily trends are polled far more often than they change, so
+# serve repeat reads from memory for a few seconds. Every entry derives from the
+# counters, so counting a new visitor through this process clears the whole cache.
+_COUNT_CACHE_TTL = 10.0
+_TOTAL_COUNT_KEY = ("total",)
+
+_count_cache = TTLCache(ttl=_COUNT_CACHE_TTL, max_size=64)
+
+# Shared read-only stand-in for a missing item or Data map
+_EMPTY: Mapping[str, Any] = MappingProxyType({})
+
+
+def _data(item: dict[str, Any] | None) -> Mapping[str, Any]:
+    """Return an item's Data map, or an empty mapping if the item or map is missing."""
+    return (item or _EMPTY).get("Data") or _EMPTY
 
 
 class VisitorRepository(BaseRepository):
     """Repository for visitor tracking operations."""
 
+    __slots__ = ()
+
     def to_item(self, data: dict[str, Any]) -> dict[str, Any]:
         """Convert visitor data to DynamoDB item."""
         # This is handled differently for different visitor item types
@@ -35,94 +58,103 @@ class VisitorRepository(BaseRepository):
         Returns:
             Dict with count and session_id
         """
-        today = datetime.now(UTC).strftime("%Y-%m-%d")
-
-        # Check if session already tracked today
-        session_item = self.get_item(pk=f"VISITOR#SESSION#{session_id}", sk="TRACKED")
-
-        # If session already tracked today, just return current count
-        if session_item and session_item.get("Data", {}).get("lastTrackedDate") == today:
-            daily_item = self.get_item(pk=f"VISITOR#DAILY#{today}", sk="COUNT")
-            count = daily_item.get("Data", {}).get("count", 0) if daily_item else 0
-            return {"count": count, "sessionId": session_id}
-
-        # Increment daily count
-        tomorrow_midnight = int(
-            (
-                datetime.now(UTC).replace(hour=0, minute=0, second=0, microsecond=0)
-                + timedelta(days=2)
-            ).timestamp()
+        now = datetime.now(UTC)
+        today = now.date().isoformat()
+        now_iso = now.isoformat()
+        daily_pk = f"VISITOR#DAILY#{today}"
+        monthly_pk = f"VISITOR#MONTHLY#{today[:7]}"
+        session_pk = f"VISITOR#SESSION#{session_id}"
+
+        # Most calls come from sessions already counted today: read the session
+        # and today's count together and return straight away for those.
+        items = self.batch_get_items(
+            [{"PK": session_pk, "SK": "TRACKED"}, {"PK": daily_pk, "SK": "COUNT"}],
+            projection_expression="PK, #data.lastTrackedDate, #data.#count",
+            expression_attribute_names={"#data": "Data", "#count": "count"},
         )
+        found = {item["PK"]: _data(item) for item in items}
+        if found.get(session_pk, _EMPTY).get("lastTrackedDate") == today:
+            return {"count": found.get(daily_pk, _EMPTY).get("count", 0), "sessionId": session_id}
 
-        # First, initialize the Data structure if needed
-        self.update_item(
-            pk=f"VISITOR#DAILY#{today}",
-            sk="COUNT",
-            update_expression="SET EntityType = if_not_exists(EntityType, :entity_type), #data = if_not_exists(#data, :empty_data)",
-            expression_attribute_values={
-                ":entity_type": "VISITOR_DAILY",
-                ":empty_data": {"date": today, "count": 0},
-            },
-            expression_attribute_names={"#data": "Data"},
+        # Session expires two midnights out, so it outlives the whole of today
+        expires_at = int(
+            (now.replace(hour=0, minute=0, second=0, microsecond=0) + timedelta(days=2)).timestamp()
         )
 
-        # Then increment the count
-        self.update_item(
-            pk=f"VISITOR#DAILY#{today}",
-            sk="COUNT",
-            update_expression="SET #data.#count = if_not_exists(#data.#count, :zero) + :increment",
-            expression_attribute_values={":increment": 1, ":zero": 0},
-            expression_attribute_names={"#data": "Data", "#count": "count"},
-        )
+        # Counters bumped for every new session, with the item each one starts from
+        counter_seeds = [
+            {
+                "PK": daily_pk,
+                "SK": "COUNT",
+                "EntityType": "VISITOR_DAILY",
+                "Data": {"date": today, "count": 0},
+            },
+            {
+                "PK": monthly_pk,
+                "SK": "COUNT",
+                "EntityType": "VISITOR_MONTHLY",
+                "Data": {"month": today[:7], "count": 0},
+            },
+            {
+                "PK": "VISITOR#TOTAL",
+                "SK": "COUNT",
+                "EntityType": "VISITOR_TOTAL",
+                "Data": {"totalCount": 0, "lastUpdated": now_iso},
+            },
+        ]
 
-        # Record session
-        self.put_item(
+        # Record the session and bump the counters in one round trip. The
+        # session put fails if it was already tracked today; the counter
+        # updates fail until their Data map has been seeded.
+        transact_items = [
             {
-                "PK": f"VISITOR#SESSION#{session_id}",
-                "SK": "TRACKED",
-                "EntityType": "VISITOR_SESSION",
-                "Data": {
-                    "lastTrackedDate": today,
-                    "lastTrackedTime": datetime.now(UTC).isoformat(),
-                },
-                "ExpiresAt": tomorrow_midnight,
-            }
-        )
+                "Put": {
+                    "Item": {
+                        "PK": session_pk,
+                        "SK": "TRACKED",
+                        "EntityType": "VISITOR_SESSION",
+                        "Data": {"lastTrackedDate": today, "lastTrackedTime": now_iso},
+                        "ExpiresAt": expires_at,
+                    },
+                    "ConditionExpression": "attribute_not_exists(PK) OR #data.lastTrackedDate <> :today",
+                    "ExpressionAttributeNames": {"#data": "Data"},
+                    "ExpressionAttributeValues": {":today": today},
+                }
+            },
+            self.counter_update(daily_pk, "COUNT", "count"),
+            self.counter_update(monthly_pk, "COUNT", "count"),
+            self.counter_update("VISITOR#TOTAL", "COUNT", "totalCount", {"lastUpdated": now_iso}),
+        ]
 
-        # Get updated count
-        daily_item = self.get_item(pk=f"VISITOR#DAILY#{today}", sk="COUNT")
-        count = daily_item.get("Data", {}).get("count", 1) if daily_item else 1
+        # A failed session put means a concurrent request counted it since the read above
+        if self.transact_counters(transact_items, counter_seeds):
+            _count_cache.clear()
 
-        # Also update total count (for efficient retrieval)
-        self.update_item(
-            pk="VISITOR#TOTAL",
+        daily_item = self.get_item(
+            pk=daily_pk,
             sk="COUNT",
-            update_expression="SET EntityType = if_not_exists(EntityType, :entity_type), #data = if_not_exists(#data, :empty_data)",
-            expression_attribute_values={
-                ":entity_type": "VISITOR_TOTAL",
-                ":empty_data": {"totalCount": 0, "lastUpdated": datetime.now(UTC).isoformat()},
-            },
-            expression_attribute_names={"#data": "Data"},
+            consistent_read=True,
+            projection_expression="#data.#count",
+            expression_attribute_names={"#data": "Data", "#count": "count"},
         )
+        count = _data(daily_item).get("count", 0)
+        return {"count": count, "sessionId": session_id}
 
-        self.update_item(
+    def get_total_count(self) -> int:
+        """Get total visitor count (O(1) lookup from aggregated counter)."""
+        cached = _count_cache.get(_TOTAL_COUNT_KEY)
+        if cached is not None:
+            return cached
+
+        item = self.get_item(
             pk="VISITOR#TOTAL",
             sk="COUNT",
-            update_expression="SET #data.totalCount = if_not_exists(#data.totalCount, :zero) + :increment, #data.lastUpdated = :updated",
-            expression_attribute_values={
-                ":increment": 1,
-                ":zero": 0,
-                ":updated": datetime.now(UTC).isoformat(),
-            },
+            projection_expression="#data.totalCount",
             expression_attribute_names={"#data": "Data"},
         )
-
-        return {"count": count, "sessionId": session_id}
-
-    def get_total_count(self) -> int:
-        """Get total visitor count (O(1) lookup from aggregated counter)."""
-        item = self.get_item(pk="VISITOR#TOTAL", sk="COUNT")
-        return item.get("Data", {}).get("totalCount", 0) if item else 0
+        total = _data(item).get("totalCount", 0)
+        _count_cache.set(_TOTAL_COUNT_KEY, total)
+        return total
 
     def get_daily_trends(self, days: int = 30) -> list[dict[str, Any]]:
         """
@@ -134,26 +166,34 @@ class VisitorRepository(BaseRepository):
         Returns:
             List of {date, visitors} dicts
         """
+        cached = _count_cache.get(("daily", days))
+        if cached is not None:
+            return cached
+
         # Generate date keys for last N days
-        dates = []
-        for i in range(days):
-            date = (datetime.now(UTC) - timedelta(days=i)).strftime("%Y-%m-%d")
-            dates.append(date)
+        today = datetime.now(UTC).date()
+        dates = [(today - timedelta(days=i)).isoformat() for i in range(days)]
 
         # Batch get items
         keys = [{"PK": f"VISITOR#DAILY#{date}", "SK": "COUNT"} for date in dates]
-        items = self.batch_get_items(keys)
+        items = self.batch_get_items(
+            keys,
+            projection_expression="#data.#date, #data.#count",
+            expression_attribute_names={"#data": "Data", "#date": "date", "#count": "count"},
+        )
 
         # Create map of date -> count
-        count_map = {
-            item.get("Data", {}).get("date"): item.get("Data", {}).get("count", 0) for item in items
-        }
+        count_map = {}
+        for item in items:
+            data = _data(item)
+            count_map[data.get("date")] = data.get("count", 0)
 
         # Build result with 0 for missing days
         trends = []
         for date in reversed(dates):  # Oldest first
             trends.append({"date": date, "visitors": count_map.get(date, 0)})
 
+        _count_cache.set(("daily", days), trends)
         return trends
 
     def get_monthly_trends(self, months: int = 6) -> list[dict[str, Any]]:
@@ -166,30 +206,72 @@ class VisitorRepository(BaseRepository):
         Returns:
             List of {month, visitors} dicts
         """
-        from boto3.dynamodb.conditions import Key
-
-        trends = []
-
+        # Step back whole calendar months (30-day steps skip or repeat months)
+        now = datetime.now(UTC)
+        current = now.year * 12 + now.month - 1
+        year_months = []
         for i in range(months):
-            # Calculate month
-            date = datetime.now(UTC) - timedelta(days=30 * i)
-            year_month = date.strftime("%Y-%m")
-
-            # Use Scan with filter since we can't use begins_with on PK in Query
-            result = self.resource.scan(
-                FilterExpression=Key("PK").begins_with(f"VISITOR#DAILY#{year_month}")
-                & Key("SK").eq("COUNT")
+            year, month = divmod(current - i, 12)
+            year_months.append(f"{year:04d}-{month + 1:02d}")
+
+        # Monthly aggregates are maintained by track_visitor (older months were
+        # written by backfill_monthly_counts); a month without one had no visitors
+        keys = [
+            {"PK": f"VISITOR#MONTHLY#{year_month}", "SK": "COUNT"} for year_month in year_months
+        ]
+        count_map = {
+            item["Data"]["month"]: item["Data"].get("count", 0)
+            for item in self.batch_get_items(
+                keys,
+                projection_expression="#data.#month, #data.#count",
+                expression_attribute_names={"#data": "Data", "#month": "month", "#count": "count"},
             )
+        }
 
-            # Sum counts
-            total = sum(item.get("Data", {}).get("count", 0) for item in result["Items"])
+        return [
+            {"month": year_month, "visitors": count_map.get(year_month, 0)}
+            for year_month in reversed(year_months)  # Oldest first
+        ]
 
-            trends.insert(
-                0,
-                {  # Insert at beginning for chronological order
-                    "month": year_month,
-                    "visitors": total,
-                },
-            )
+    def backfill_monthly_counts(self) -> dict[str, int]:
+        """
+        Rebuild the monthly aggregates from the daily counters.
 
-        return trends
+        One-off maintenance for months tracked before the aggregates existed
+        (run via scripts/backfill_data.py). Reads every daily item with a
+        paginated Scan and overwrites each month's aggregate with the sum, so
+        it also corrects a month that was only partly aggregated.
+
+        Returns:
+            Dict mapping month (YYYY-MM) to its visitor count
+        """
+        params = {
+            "FilterExpression": Key("PK").begins_with("VISITOR#DAILY#") & Key("SK").eq("COUNT"),
+            "ProjectionExpression": "#data.#date, #data.#count",
+            "ExpressionAttributeNames": {"#data": "Data", "#date": "date", "#count": "count"},
+        }
+
+        totals: dict[str, int] = {}
+        while True:
+            result = self.resource.scan(**params)
+            for item in result["Items"]:
+                data = _data(item)
+                month = data["date"][:7]
+                totals[month] = totals.get(month, 0) + data.get("count", 0)
+            if "LastEvaluatedKey" not in result:
+                break
+            params["ExclusiveStartKey"] = result["LastEvaluatedKey"]
+
+        self.batch_write_items(
+            [
+                {
+                    "PK": f"VISITOR#MONTHLY#{month}",
+                    "SK": "COUNT",
+                    "EntityType": "VISITOR_MONTHLY",
+                    "Data": {"month": month, "count": count},
+                }
+                for month, count in totals.items()
+            ]
+        )
+        _count_cache.clear()
+        return totals
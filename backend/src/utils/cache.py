@@ -0,0 +1,70 @@
+"""
+In-process TTL cache.
+
+Repositories cache hot, eventually consistent reads (counters, category lists,
+single items) for a few seconds to collapse bursts of identical requests.
+"""
+
+import threading
+import time
+from collections.abc import Hashable
+from typing import Any
+
+
+class TTLCache:
+    """
+    Thread-safe mapping whose entries expire a fixed time after they are set.
+
+    Reads are lock-free; writes take a lock. When the cache is full, expired
+    entries are dropped first, then the oldest entries.
+    """
+
+    __slots__ = ("ttl", "max_size", "_entries", "_lock")
+
+    def __init__(self, ttl: float, max_size: int = 1024):
+        """
+        Initialize an empty cache.
+
+        Args:
+            ttl: Seconds an entry stays valid after it is set
+            max_size: Maximum number of entries kept
+        """
+        self.ttl = ttl
+        self.max_size = max_size
+        self._entries: dict[Hashable, tuple[float, Any]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Any | None:
+        """Return the cached value, or None if missing or expired."""
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] > time.monotonic():
+            return entry[1]
+        return None
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Cache a value for ttl seconds."""
+        now = time.monotonic()
+        with self._lock:
+            # Re-insert so dict order stays oldest-first
+            self._entries.pop(key, None)
+            if len(self._entries) >= self.max_size:
+                self._evict(now)
+            self._entries[key] = (now + self.ttl, value)
+
+    def invalidate(self, *keys: Hashable) -> None:
+        """Drop cached values so the next read goes to the source."""
+        with self._lock:
+            for key in keys:
+                self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Drop every cached value."""
+        with self._lock:
+            self._entries.clear()
+
+    def _evict(self, now: float) -> None:
+        """Make room for one entry (caller holds the lock)."""
+        for key in [key for key, (expires, _) in self._entries.items() if expires <= now]:
+            del self._entries[key]
+        while len(self._entries) >= self.max_size:
+            del self._entries[next(iter(self._entries))]
@@ -7,22 +7,21 @@ Provides helper functions for DynamoDB operations.
 from datetime import datetime
 from typing import Any
 
-import boto3
-
 from src.config import settings
+from src.repositories.base import _build_service_resource, _build_table
 
 
 def get_dynamodb_resource():
     """
     Get boto3 DynamoDB resource.
 
+    Shares the repositories' cached resource for the calling thread (boto3
+    resources are not thread-safe) and their retry configuration.
+
     Returns:
         Configured DynamoDB resource
     """
-    return boto3.resource(
-        "dynamodb",
-        region_name=settings.aws_region,
-    )
+    return _build_service_resource(settings.aws_region, settings.dynamodb_endpoint or None)
 
 
 def get_table():
@@ -30,10 +29,11 @@ def get_table():
     Get the portfolio DynamoDB table.
 
     Returns:
-        DynamoDB table resource
+        DynamoDB table resource (shared by requests served on the same thread)
     """
-    dynamodb = get_dynamodb_resource()
-    return dynamodb.Table(settings.dynamodb_table_name)
+    return _build_table(
+        settings.aws_region, settings.dynamodb_endpoint or None, settings.dynamodb_table_name
+    )
 
 
 def serialize_datetime(dt: datetime) -> str:
@@ -4,36 +4,102 @@ JWT token utilities.
 Provides functions for validating and decoding JWT tokens from Cognito.
 """
 
-from functools import lru_cache
+import threading
+import time
 
 import requests
-from jose import JWTError, jwt
+from jose import JWTError, jwk, jwt
+from jose.exceptions import JWKError
 
 from src.config import settings
 
+# Cognito rotates signing keys, so cached JWKS expire after an hour. An unknown
+# kid forces an early refresh, at most once per _JWKS_MIN_REFRESH_INTERVAL so
+# tokens with made-up kids can't turn into a JWKS fetch per request.
+_JWKS_TTL = 3600.0
+_JWKS_MIN_REFRESH_INTERVAL = 60.0
 
-@lru_cache(maxsize=1)
-def get_cognito_public_keys() -> dict:
+_jwks_cache: dict = {"jwks": None, "expires": 0.0, "fetched": 0.0}
+_jwks_lock = threading.Lock()
+
+# Pooled connection for JWKS fetches
+_http = requests.Session()
+
+
+def get_cognito_public_keys(force_refresh: bool = False) -> dict:
     """
     Fetch and cache Cognito public keys for JWT validation.
 
-    Fetches JWKS from Cognito's well-known endpoint and caches the result.
+    Fetches JWKS from Cognito's well-known endpoint and caches the result for
+    _JWKS_TTL seconds. Concurrent misses wait for a single fetch.
     Following docs/AUTHENTICATION.md lines 222-230 for token validation.
 
+    Args:
+        force_refresh: Refetch even if the cache is fresh (e.g. unknown kid)
+
     Returns:
         Dictionary of Cognito public keys (JWKs)
 
     Raises:
         Exception: If unable to fetch public keys from Cognito
     """
-    jwks_url = f"https://cognito-idp.{settings.cognito_region}.amazonaws.com/{settings.cognito_user_pool_id}/.well-known/jwks.json"
+    jwks = _jwks_cache["jwks"]
+    if jwks is not None and not force_refresh and time.monotonic() < _jwks_cache["expires"]:
+        return jwks
+
+    with _jwks_lock:
+        # Another thread may have refreshed while we waited for the lock
+        now = time.monotonic()
+        jwks = _jwks_cache["jwks"]
+        if jwks is not None:
+            if force_refresh:
+                if now - _jwks_cache["fetched"] < _JWKS_MIN_REFRESH_INTERVAL:
+                    return jwks
+            elif now < _jwks_cache["expires"]:
+                return jwks
+
+        jwks_url = f"https://cognito-idp.{settings.cognito_region}.amazonaws.com/{settings.cognito_user_pool_id}/.well-known/jwks.json"
+
+        try:
+            response = _http.get(jwks_url, timeout=5)
+            response.raise_for_status()
+            jwks = response.json()
+        except Exception as e:
+            raise Exception(f"Failed to fetch Cognito public keys: {str(e)}")
+
+        _jwks_cache.update(jwks=jwks, expires=now + _JWKS_TTL, fetched=now)
+        return jwks
 
-    try:
-        response = requests.get(jwks_url, timeout=5)
-        response.raise_for_status()
-        return response.json()
-    except Exception as e:
-        raise Exception(f"Failed to fetch Cognito public keys: {str(e)}")
+
+def _clear_jwks_cache() -> None:
+    """Forget cached public keys so the next call fetches them again."""
+    with _jwks_lock:
+        _jwks_cache.update(jwks=None, expires=0.0, fetched=0.0)
+
+
+# Public keys parsed from the cached JWKS, keyed by kid, paired with the JWKS
+# they came from so they are rebuilt only when the JWKS changes
+_signing_keys: dict = {"entry": (None, {})}
+
+
+def _get_signing_keys(force_refresh: bool = False) -> dict:
+    """
+    Return Cognito public keys as parsed jose Key objects, keyed by kid.
+
+    Parsing a JWK into an RSA key is done once per JWKS fetch rather than on
+    every token verification.
+    """
+    jwks = get_cognito_public_keys(force_refresh=force_refresh)
+    source, keys = _signing_keys["entry"]
+    if source is not jwks:
+        keys = {}
+        for key_data in jwks.get("keys", []):
+            try:
+                keys[key_data["kid"]] = jwk.construct(key_data, settings.jwt_algorithm)
+            except (KeyError, JWKError):
+                continue
+        _signing_keys["entry"] = (jwks, keys)
+    return keys
 
 
 def decode_token(token: str) -> dict | None:
@@ -55,19 +121,14 @@ def decode_token(token: str) -> dict | None:
         Decoded token claims if valid, None if invalid or expired
     """
     try:
-        # Fetch public keys from Cognito
-        jwks = get_cognito_public_keys()
-
         # Extract key ID from token header
         unverified_header = jwt.get_unverified_header(token)
         kid = unverified_header.get("kid")
 
-        # Find matching public key
-        key = None
-        for jwk in jwks.get("keys", []):
-            if jwk.get("kid") == kid:
-                key = jwk
-                break
+        # Find matching public key, refetching once in case keys were rotated
+        key = _get_signing_keys().get(kid)
+        if not key:
+            key = _get_signing_keys(force_refresh=True).get(kid)
 
         if not key:
             raise JWTError("Public key not found")
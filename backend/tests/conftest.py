@@ -4,84 +4,259 @@ Pytest configuration and shared fixtures.
 This file contains pytest fixtures that are available to all test modules.
 """
 
-from datetime import datetime, timedelta
-from unittest.mock import Mock
+import base64
+import time
+from collections.abc import Mapping
+from types import SimpleNamespace
+from unittest.mock import Mock, patch
 
+import boto3
 import pytest
+from botocore.client import BaseClient
+from botocore.exceptions import ClientError
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
 from fastapi.testclient import TestClient
+from moto import mock_aws
 
 from src.config import settings
+from src.dependencies import (
+    get_analytics_repository,
+    get_blog_repository,
+    get_certification_repository,
+    get_project_repository,
+    get_visitor_repository,
+)
 from src.main import app
 
 
-# Test client fixture
+def pytest_addoption(parser):
+    """Register --slow to opt in to the multi-request end-to-end flows."""
+    parser.addoption("--slow", action="store_true", default=False, help="run tests marked slow")
+
+
+def pytest_collection_modifyitems(config, items):
+    """Skip tests marked slow unless --slow is given."""
+    if config.getoption("--slow"):
+        return
+    skip_slow = pytest.mark.skip(reason="slow test; run with --slow")
+    for item in items:
+        if "slow" in item.keywords:
+            item.add_marker(skip_slow)
+
+
+# Reference time for token claims; expiry offsets are an hour, far longer than a run
+_NOW = int(time.time())
+
+# Literal payloads are built once at import and shared by their session-scoped
+# fixtures. Treat them as read-only; copy.deepcopy() one before mutating it.
+_MOCK_COGNITO_SUCCESS_RESPONSE = {
+    "AuthenticationResult": {
+        "AccessToken": "mock-access-token-12345",
+        "IdToken": "mock-id-token-67890",
+        "RefreshToken": "mock-refresh-token-abcde",
+        "ExpiresIn": 3600,
+        "TokenType": "Bearer",
+    }
+}
+
+_MOCK_REFRESH_SUCCESS_RESPONSE = {
+    "AuthenticationResult": {
+        "AccessToken": "new-access-token-12345",
+        "IdToken": "new-id-token-67890",
+        "ExpiresIn": 3600,
+        "TokenType": "Bearer",
+    }
+}
+
+_MOCK_USER_INFO = {
+    "user_id": "test-user-id-123",
+    "email": "test@example.com",
+    "name": "Test User",
+    "role": "owner",
+    "email_verified": True,
+}
+
+_MOCK_VISITOR_USER_INFO = {
+    "user_id": "visitor-user-456",
+    "email": "visitor@example.com",
+    "name": "Visitor User",
+    "role": "visitor",
+    "email_verified": True,
+}
+
+_VALID_AUTH_HEADERS = {"Authorization": "Bearer valid.jwt.token"}
+
+_INVALID_AUTH_HEADERS = {"Authorization": "Bearer invalid.jwt.token"}
+
+_MOCK_BLOG_POST_ITEM = {
+    "PK": "BLOG#test-slug",
+    "SK": "METADATA",
+    "GSI1PK": "BLOG",
+    "GSI1SK": "2024-01-15T10:00:00",
+    "id": "test-blog-id-123",
+    "title": "Test Blog Post",
+    "slug": "test-slug",
+    "content": "This is test content",
+    "excerpt": "Test excerpt",
+    "tags": ["python", "testing"],
+    "is_published": True,
+    "created_at": "2024-01-15T10:00:00",
+    "updated_at": "2024-01-15T10:00:00",
+}
+
+_MOCK_PROJECT_ITEM = {
+    "PK": "PROJECT#test-project-id",
+    "SK": "METADATA",
+    "GSI1PK": "PROJECT",
+    "GSI1SK": "2024-01-15T10:00:00",
+    "id": "test-project-id",
+    "title": "Test Project",
+    "description": "Test project description",
+    "technologies": ["Python", "FastAPI"],
+    "github_url": "https://github.com/test/project",
+    "demo_url": "https://demo.example.com",
+    "is_featured": True,
+    "created_at": "2024-01-15T10:00:00",
+    "updated_at": "2024-01-15T10:00:00",
+}
+
+_SAMPLE_LOGIN_REQUEST = {"email": "test@example.com", "password": "SecurePassword123!"}
+
+_SAMPLE_BLOG_CREATE_REQUEST = {
+    "title": "New Blog Post",
+    "slug": "new-blog-post",
+    "content": "This is the content of the new blog post.",
+    "excerpt": "Brief excerpt of the blog post.",
+    "tags": ["python", "fastapi", "testing"],
+    "is_published": True,
+}
+
+_SAMPLE_PROJECT_CREATE_REQUEST = {
+    "title": "New Project",
+    "description": "Description of the new project",
+    "technologies": ["Python", "FastAPI", "AWS"],
+    "github_url": "https://github.com/test/new-project",
+    "demo_url": "https://demo-new.example.com",
+    "is_featured": False,
+}
+
+
+# Test client fixtures
+@pytest.fixture(scope="session")
+def _session_test_client():
+    """FastAPI test client whose app lifespan is entered once per session."""
+    with TestClient(app) as client:
+        yield client
+
+
+@pytest.fixture
+def test_client(_session_test_client):
+    """FastAPI test client, shared across tests with its cookie jar reset."""
+    _session_test_client.cookies.clear()
+    return _session_test_client
+
+
 @pytest.fixture
-def test_client():
-    """FastAPI test client."""
-    return TestClient(app)
+def fresh_test_client():
+    """FastAPI test client with its own lifespan, for tests that need isolation."""
+    with TestClient(app) as client:
+        yield client
 
 
 # Mock Cognito fixtures
 @pytest.fixture
 def mock_cognito_client():
-    """Mock boto3 Cognito client."""
-    client = Mock()
-    client.initiate_auth = Mock()
-    client.admin_user_global_sign_out = Mock()
-    return client
+    """Cognito client double exposing only the calls the API makes."""
+    return SimpleNamespace(initiate_auth=Mock(), admin_user_global_sign_out=Mock())
+
+
+class CognitoStub:
+    """Wires canned Cognito responses onto a client double in one call."""
+
+    def __init__(self, client):
+        self.client = client
+
+    @staticmethod
+    def error(code: str, operation: str = "InitiateAuth") -> ClientError:
+        """Build the ClientError Cognito raises for an error code."""
+        return ClientError({"Error": {"Code": code}}, operation)
+
+    def login_returns(self, response: Mapping) -> None:
+        """Answer every InitiateAuth call with response."""
+        self.client.initiate_auth.side_effect = None
+        self.client.initiate_auth.return_value = response
+
+    # Refresh goes through InitiateAuth as well
+    refresh_returns = login_returns
+
+    def login_raises(self, code: str) -> None:
+        """Fail every InitiateAuth call with a Cognito error code."""
+        self.client.initiate_auth.side_effect = self.error(code)
+
+    def respond_with(self, side_effect) -> None:
+        """Answer InitiateAuth through a responder callable or a sequence of results."""
+        self.client.initiate_auth.side_effect = side_effect
+
+    def logout_returns(self, response: Mapping) -> None:
+        """Answer AdminUserGlobalSignOut with response."""
+        self.client.admin_user_global_sign_out.return_value = response
 
 
 @pytest.fixture
+def cognito_stub(mock_cognito_client):
+    """Patch the API's Cognito client with a stub for the duration of a test."""
+    with patch("src.api.auth.get_cognito_client", return_value=mock_cognito_client):
+        yield CognitoStub(mock_cognito_client)
+
+
+@pytest.fixture(scope="session")
 def mock_cognito_success_response():
     """Mock successful Cognito authentication response."""
-    return {
-        "AuthenticationResult": {
-            "AccessToken": "mock-access-token-12345",
-            "IdToken": "mock-id-token-67890",
-            "RefreshToken": "mock-refresh-token-abcde",
-            "ExpiresIn": 3600,
-            "TokenType": "Bearer",
-        }
-    }
+    return _MOCK_COGNITO_SUCCESS_RESPONSE
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_refresh_success_response():
     """Mock successful token refresh response."""
-    return {
-        "AuthenticationResult": {
-            "AccessToken": "new-access-token-12345",
-            "IdToken": "new-id-token-67890",
-            "ExpiresIn": 3600,
-            "TokenType": "Bearer",
-        }
-    }
+    return _MOCK_REFRESH_SUCCESS_RESPONSE
 
 
 # JWT and user fixtures
-@pytest.fixture
-def mock_jwks():
-    """Mock JWKS response from Cognito."""
-    return {
+@pytest.fixture(scope="session")
+def rsa_keypair():
+    """RS256 key pair generated once per session: (private PEM, matching JWKS)."""
+    key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    private_pem = key.private_bytes(
+        serialization.Encoding.PEM,
+        serialization.PrivateFormat.PKCS8,
+        serialization.NoEncryption(),
+    )
+    numbers = key.public_key().public_numbers()
+
+    def b64url(value: int) -> str:
+        raw = value.to_bytes((value.bit_length() + 7) // 8, "big")
+        return base64.urlsafe_b64encode(raw).rstrip(b"=").decode()
+
+    jwks = {
         "keys": [
             {
                 "kid": "test-key-id-1",
                 "alg": "RS256",
                 "kty": "RSA",
                 "use": "sig",
-                "n": "test-modulus",
-                "e": "AQAB",
-            },
-            {
-                "kid": "test-key-id-2",
-                "alg": "RS256",
-                "kty": "RSA",
-                "use": "sig",
-                "n": "test-modulus-2",
-                "e": "AQAB",
-            },
+                "n": b64url(numbers.n),
+                "e": b64url(numbers.e),
+            }
         ]
     }
+    return private_pem, jwks
+
+
+@pytest.fixture(scope="session")
+def mock_jwks(rsa_keypair):
+    """JWKS response from Cognito, backed by the session's real RSA key."""
+    return rsa_keypair[1]
 
 
 @pytest.fixture
@@ -95,8 +270,8 @@ def valid_token_claims():
         "email_verified": True,
         "aud": settings.cognito_client_id,
         "iss": settings.jwt_issuer,
-        "exp": int((datetime.utcnow() + timedelta(hours=1)).timestamp()),
-        "iat": int(datetime.utcnow().timestamp()),
+        "exp": _NOW + 3600,
+        "iat": _NOW,
     }
 
 
@@ -111,196 +286,176 @@ def expired_token_claims():
         "email_verified": True,
         "aud": settings.cognito_client_id,
         "iss": settings.jwt_issuer,
-        "exp": int((datetime.utcnow() - timedelta(hours=1)).timestamp()),
-        "iat": int((datetime.utcnow() - timedelta(hours=2)).timestamp()),
+        "exp": _NOW - 3600,
+        "iat": _NOW - 7200,
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_user_info():
     """Mock user information extracted from JWT."""
-    return {
-        "user_id": "test-user-id-123",
-        "email": "test@example.com",
-        "name": "Test User",
-        "role": "owner",
-        "email_verified": True,
-    }
+    return _MOCK_USER_INFO
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_visitor_user_info():
     """Mock visitor (non-owner) user information."""
-    return {
-        "user_id": "visitor-user-456",
-        "email": "visitor@example.com",
-        "name": "Visitor User",
-        "role": "visitor",
-        "email_verified": True,
-    }
+    return _MOCK_VISITOR_USER_INFO
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def valid_auth_headers():
     """Mock valid authorization headers."""
-    return {"Authorization": "Bearer valid.jwt.token"}
+    return _VALID_AUTH_HEADERS
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def invalid_auth_headers():
     """Mock invalid authorization headers."""
-    return {"Authorization": "Bearer invalid.jwt.token"}
+    return _INVALID_AUTH_HEADERS
 
 
 # Mock DynamoDB fixtures
 @pytest.fixture
 def mock_dynamodb_table():
-    """Mock DynamoDB table resource."""
-    table = Mock()
-    table.put_item = Mock()
-    table.get_item = Mock()
-    table.query = Mock()
-    table.update_item = Mock()
-    table.delete_item = Mock()
-    table.scan = Mock()
-    return table
+    """In-memory (moto) DynamoDB table matching aws/backend.yaml (keys, GSI1 and GSI2)."""
+    with mock_aws():
+        dynamodb = boto3.resource("dynamodb", region_name=settings.aws_region)
+        table = dynamodb.create_table(
+            TableName=settings.dynamodb_table_name,
+            KeySchema=[
+                {"AttributeName": "PK", "KeyType": "HASH"},
+                {"AttributeName": "SK", "KeyType": "RANGE"},
+            ],
+            AttributeDefinitions=[
+                {"AttributeName": "PK", "AttributeType": "S"},
+                {"AttributeName": "SK", "AttributeType": "S"},
+                {"AttributeName": "GSI1PK", "AttributeType": "S"},
+                {"AttributeName": "GSI1SK", "AttributeType": "S"},
+                {"AttributeName": "GSI2PK", "AttributeType": "S"},
+                {"AttributeName": "GSI2SK", "AttributeType": "N"},
+            ],
+            GlobalSecondaryIndexes=[
+                {
+                    "IndexName": "GSI1",
+                    "KeySchema": [
+                        {"AttributeName": "GSI1PK", "KeyType": "HASH"},
+                        {"AttributeName": "GSI1SK", "KeyType": "RANGE"},
+                    ],
+                    "Projection": {"ProjectionType": "ALL"},
+                },
+                {
+                    "IndexName": "GSI2",
+                    "KeySchema": [
+                        {"AttributeName": "GSI2PK", "KeyType": "HASH"},
+                        {"AttributeName": "GSI2SK", "KeyType": "RANGE"},
+                    ],
+                    "Projection": {"ProjectionType": "ALL"},
+                },
+            ],
+            BillingMode="PAY_PER_REQUEST",
+        )
+        yield table
 
 
 @pytest.fixture
+def no_scan():
+    """Fail the test if any code issues a DynamoDB Scan; use Query/GetItem/BatchGetItem."""
+    make_api_call = BaseClient._make_api_call
+
+    def guarded(self, operation_name, api_params):
+        if operation_name == "Scan":
+            raise AssertionError("Scan disallowed; use Query/GetItem/BatchGetItem")
+        return make_api_call(self, operation_name, api_params)
+
+    with patch.object(BaseClient, "_make_api_call", guarded):
+        yield
+
+
+@pytest.fixture(scope="session")
 def mock_blog_post_item():
     """Mock blog post DynamoDB item."""
-    return {
-        "PK": "BLOG#test-slug",
-        "SK": "METADATA",
-        "GSI1PK": "BLOG",
-        "GSI1SK": "2024-01-15T10:00:00",
-        "id": "test-blog-id-123",
-        "title": "Test Blog Post",
-        "slug": "test-slug",
-        "content": "This is test content",
-        "excerpt": "Test excerpt",
-        "tags": ["python", "testing"],
-        "is_published": True,
-        "created_at": "2024-01-15T10:00:00",
-        "updated_at": "2024-01-15T10:00:00",
-    }
+    return _MOCK_BLOG_POST_ITEM
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_project_item():
     """Mock project DynamoDB item."""
-    return {
-        "PK": "PROJECT#test-project-id",
-        "SK": "METADATA",
-        "GSI1PK": "PROJECT",
-        "GSI1SK": "2024-01-15T10:00:00",
-        "id": "test-project-id",
-        "title": "Test Project",
-        "description": "Test project description",
-        "technologies": ["Python", "FastAPI"],
-        "github_url": "https://github.com/test/project",
-        "demo_url": "https://demo.example.com",
-        "is_featured": True,
-        "created_at": "2024-01-15T10:00:00",
-        "updated_at": "2024-01-15T10:00:00",
-    }
+    return _MOCK_PROJECT_ITEM
 
 
 # Test data helpers
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_login_request():
     """Sample login request data."""
-    return {"email": "test@example.com", "password": "SecurePassword123!"}
+    return _SAMPLE_LOGIN_REQUEST
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_blog_create_request():
     """Sample blog post creation request."""
-    return {
-        "title": "New Blog Post",
-        "slug": "new-blog-post",
-        "content": "This is the content of the new blog post.",
-        "excerpt": "Brief excerpt of the blog post.",
-        "tags": ["python", "fastapi", "testing"],
-        "is_published": True,
-    }
+    return _SAMPLE_BLOG_CREATE_REQUEST
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_project_create_request():
     """Sample project creation request."""
-    return {
-        "title": "New Project",
-        "description": "Description of the new project",
-        "technologies": ["Python", "FastAPI", "AWS"],
-        "github_url": "https://github.com/test/new-project",
-        "demo_url": "https://demo-new.example.com",
-        "is_featured": False,
-    }
+    return _SAMPLE_PROJECT_CREATE_REQUEST
 
 
-# Repository override helper
+# Repository override helpers
 @pytest.fixture
-def override_get_blog_repository(mock_blog_repo):
-    """Override blog repository dependency."""
-    from src.dependencies import get_blog_repository
-    from src.main import app
+def override_repo():
+    """Factory that overrides a repository dependency; overrides are cleared on teardown."""
 
-    app.dependency_overrides[get_blog_repository] = lambda: mock_blog_repo
-    yield
+    def _apply(getter, impl):
+        app.dependency_overrides[getter] = lambda: impl
+
+    yield _apply
     app.dependency_overrides.clear()
 
 
 @pytest.fixture
-def override_get_project_repository(mock_project_repo):
-    """Override project repository dependency."""
-    from src.dependencies import get_project_repository
-    from src.main import app
+def override_get_blog_repository(override_repo, mock_blog_repo):
+    """Override blog repository dependency."""
+    override_repo(get_blog_repository, mock_blog_repo)
 
-    app.dependency_overrides[get_project_repository] = lambda: mock_project_repo
-    yield
-    app.dependency_overrides.clear()
+
+@pytest.fixture
+def override_get_project_repository(override_repo, mock_project_repo):
+    """Override project repository dependency."""
+    override_repo(get_project_repository, mock_project_repo)
 
 
 @pytest.fixture
-def override_get_certification_repository(mock_cert_repo):
+def override_get_certification_repository(override_repo, mock_cert_repo):
     """Override certification repository dependency."""
-    from src.dependencies import get_certification_repository
-    from src.main import app
-
-    app.dependency_overrides[get_certification_repository] = lambda: mock_cert_repo
-    yield
-    app.dependency_overrides.clear()
+    override_repo(get_certification_repository, mock_cert_repo)
 
 
 @pytest.fixture
-def override_get_visitor_repository(mock_visitor_repo):
+def override_get_visitor_repository(override_repo, mock_visitor_repo):
     """Override visitor repository dependency."""
-    from src.dependencies import get_visitor_repository
-    from src.main import app
-
-    app.dependency_overrides[get_visitor_repository] = lambda: mock_visitor_repo
-    yield
-    app.dependency_overrides.clear()
+    override_repo(get_visitor_repository, mock_visitor_repo)
 
 
 @pytest.fixture
-def override_get_analytics_repository(mock_analytics_repo):
+def override_get_analytics_repository(override_repo, mock_analytics_repo):
     """Override analytics repository dependency."""
-    from src.dependencies import get_analytics_repository
-    from src.main import app
-
-    app.dependency_overrides[get_analytics_repository] = lambda: mock_analytics_repo
-    yield
-    app.dependency_overrides.clear()
+    override_repo(get_analytics_repository, mock_analytics_repo)
 
 
-# Cleanup fixture
-@pytest.fixture(autouse=True)
+# Cleanup fixtures
+@pytest.fixture
 def reset_mocks():
-    """Reset all mocks and dependency overrides after each test."""
+    """Clear dependency overrides after a test that sets them by hand."""
     yield
     # Cleanup happens after test completes
-    from src.main import app
-
     app.dependency_overrides.clear()
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _check_dependency_overrides():
+    """Fail the run if any test left a dependency override behind."""
+    yield
+    assert app.dependency_overrides == {}, "dependency overrides leaked out of a test"
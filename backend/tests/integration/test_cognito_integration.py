@@ -14,16 +14,29 @@ from src.api.auth import get_cognito_client
 from src.config import settings
 
 
+@pytest.fixture(scope="session")
+def real_cognito_client():
+    """Real boto3 Cognito client, built once per session."""
+    get_cognito_client.cache_clear()
+    return get_cognito_client()
+
+
+@pytest.fixture(autouse=True)
+def fresh_cognito_client():
+    """Drop the cached Cognito client so each test sees its own boto3.client patch."""
+    get_cognito_client.cache_clear()
+    yield
+    get_cognito_client.cache_clear()
+
+
 class TestCognitoClientInitialization:
     """Test Cognito client initialization and configuration."""
 
-    def test_get_cognito_client_initialization(self):
+    def test_get_cognito_client_initialization(self, real_cognito_client):
         """Test that Cognito client is properly initialized."""
-        client = get_cognito_client()
-
-        assert client is not None
-        assert hasattr(client, "initiate_auth")
-        assert hasattr(client, "admin_user_global_sign_out")
+        assert real_cognito_client is not None
+        assert hasattr(real_cognito_client, "initiate_auth")
+        assert hasattr(real_cognito_client, "admin_user_global_sign_out")
 
     @patch("boto3.client")
     def test_cognito_client_region_configuration(self, mock_boto_client):
@@ -36,12 +49,33 @@ class TestCognitoClientInitialization:
         # Verify boto3.client was called with correct parameters
         mock_boto_client.assert_called_once_with("cognito-idp", region_name=settings.cognito_region)
 
+    @patch("boto3.client")
+    def test_cognito_client_is_reused(self, mock_boto_client):
+        """Test that the Cognito client is built once and then reused."""
+        assert get_cognito_client() is get_cognito_client()
+        mock_boto_client.assert_called_once()
+
+
+class PatchedBotoClient:
+    """Patch boto3.client once per test class and reset the mock before each test."""
+
+    @classmethod
+    def setup_class(cls):
+        cls._boto_patcher = patch("boto3.client")
+        cls.mock_boto = cls._boto_patcher.start()
+
+    @classmethod
+    def teardown_class(cls):
+        cls._boto_patcher.stop()
 
-class TestCognitoAuthenticationFlow:
+    def setup_method(self):
+        self.mock_boto.reset_mock(return_value=True, side_effect=True)
+
+
+class TestCognitoAuthenticationFlow(PatchedBotoClient):
     """Test Cognito authentication flows."""
 
-    @patch("boto3.client")
-    def test_initiate_auth_with_valid_parameters(self, mock_boto_client):
+    def test_initiate_auth_with_valid_parameters(self):
         """Test InitiateAuth call with valid parameters."""
         # Setup mock
         mock_client = Mock()
@@ -54,7 +88,7 @@ class TestCognitoAuthenticationFlow:
             }
         }
         mock_client.initiate_auth.return_value = mock_auth_response
-        mock_boto_client.return_value = mock_client
+        self.mock_boto.return_value = mock_client
 
         # Execute
         client = get_cognito_client()
@@ -72,65 +106,18 @@ class TestCognitoAuthenticationFlow:
         assert "RefreshToken" in response["AuthenticationResult"]
 
         # Verify initiate_auth was called with correct parameters
-        mock_client.initiate_auth.assert_called_once_with(
-            AuthFlow="USER_PASSWORD_AUTH",
-            ClientId=settings.cognito_client_id,
-            AuthParameters={"USERNAME": "test@example.com", "PASSWORD": "TestPassword123!"},
-        )
-
-    @patch("boto3.client")
-    def test_initiate_auth_not_authorized_exception(self, mock_boto_client):
-        """Test InitiateAuth with NotAuthorizedException."""
-        # Setup mock
-        mock_client = Mock()
-        error_response = {
-            "Error": {
-                "Code": "NotAuthorizedException",
-                "Message": "Incorrect username or password.",
-            }
-        }
-        mock_client.initiate_auth.side_effect = ClientError(error_response, "InitiateAuth")
-        mock_boto_client.return_value = mock_client
+        assert mock_client.initiate_auth.call_count == 1
+        call_kwargs = mock_client.initiate_auth.call_args.kwargs
+        assert call_kwargs["AuthFlow"] == "USER_PASSWORD_AUTH"
+        assert call_kwargs["ClientId"] == settings.cognito_client_id
+        assert call_kwargs["AuthParameters"]["USERNAME"] == "test@example.com"
+        assert call_kwargs["AuthParameters"]["PASSWORD"] == "TestPassword123!"
 
-        # Execute and verify
-        client = get_cognito_client()
-        with pytest.raises(ClientError) as exc_info:
-            client.initiate_auth(
-                AuthFlow="USER_PASSWORD_AUTH",
-                ClientId=settings.cognito_client_id,
-                AuthParameters={"USERNAME": "test@example.com", "PASSWORD": "WrongPassword"},
-            )
-
-        assert exc_info.value.response["Error"]["Code"] == "NotAuthorizedException"
-
-    @patch("boto3.client")
-    def test_initiate_auth_user_not_confirmed(self, mock_boto_client):
-        """Test InitiateAuth with UserNotConfirmedException."""
-        # Setup mock
-        mock_client = Mock()
-        error_response = {
-            "Error": {"Code": "UserNotConfirmedException", "Message": "User is not confirmed."}
-        }
-        mock_client.initiate_auth.side_effect = ClientError(error_response, "InitiateAuth")
-        mock_boto_client.return_value = mock_client
-
-        # Execute and verify
-        client = get_cognito_client()
-        with pytest.raises(ClientError) as exc_info:
-            client.initiate_auth(
-                AuthFlow="USER_PASSWORD_AUTH",
-                ClientId=settings.cognito_client_id,
-                AuthParameters={"USERNAME": "unconfirmed@example.com", "PASSWORD": "Password123!"},
-            )
-
-        assert exc_info.value.response["Error"]["Code"] == "UserNotConfirmedException"
 
-
-class TestCognitoTokenRefresh:
+class TestCognitoTokenRefresh(PatchedBotoClient):
     """Test Cognito token refresh flows."""
 
-    @patch("boto3.client")
-    def test_refresh_token_flow(self, mock_boto_client):
+    def test_refresh_token_flow(self):
         """Test REFRESH_TOKEN_AUTH flow."""
         # Setup mock
         mock_client = Mock()
@@ -142,7 +129,7 @@ class TestCognitoTokenRefresh:
             }
         }
         mock_client.initiate_auth.return_value = mock_refresh_response
-        mock_boto_client.return_value = mock_client
+        self.mock_boto.return_value = mock_client
 
         # Execute
         client = get_cognito_client()
@@ -159,14 +146,13 @@ class TestCognitoTokenRefresh:
         assert "IdToken" in response["AuthenticationResult"]
 
         # Verify initiate_auth was called with correct parameters
-        mock_client.initiate_auth.assert_called_once_with(
-            AuthFlow="REFRESH_TOKEN_AUTH",
-            ClientId=settings.cognito_client_id,
-            AuthParameters={"REFRESH_TOKEN": "test-refresh-token"},
-        )
+        assert mock_client.initiate_auth.call_count == 1
+        call_kwargs = mock_client.initiate_auth.call_args.kwargs
+        assert call_kwargs["AuthFlow"] == "REFRESH_TOKEN_AUTH"
+        assert call_kwargs["ClientId"] == settings.cognito_client_id
+        assert call_kwargs["AuthParameters"]["REFRESH_TOKEN"] == "test-refresh-token"
 
-    @patch("boto3.client")
-    def test_refresh_token_with_new_refresh_token(self, mock_boto_client):
+    def test_refresh_token_with_new_refresh_token(self):
         """Test token refresh that returns a new refresh token."""
         # Setup mock
         mock_client = Mock()
@@ -179,7 +165,7 @@ class TestCognitoTokenRefresh:
             }
         }
         mock_client.initiate_auth.return_value = mock_refresh_response
-        mock_boto_client.return_value = mock_client
+        self.mock_boto.return_value = mock_client
 
         # Execute
         client = get_cognito_client()
@@ -193,39 +179,16 @@ class TestCognitoTokenRefresh:
         assert "RefreshToken" in response["AuthenticationResult"]
         assert response["AuthenticationResult"]["RefreshToken"] == "new-refresh-token"
 
-    @patch("boto3.client")
-    def test_refresh_token_expired(self, mock_boto_client):
-        """Test token refresh with expired refresh token."""
-        # Setup mock
-        mock_client = Mock()
-        error_response = {
-            "Error": {"Code": "NotAuthorizedException", "Message": "Refresh Token has expired"}
-        }
-        mock_client.initiate_auth.side_effect = ClientError(error_response, "InitiateAuth")
-        mock_boto_client.return_value = mock_client
-
-        # Execute and verify
-        client = get_cognito_client()
-        with pytest.raises(ClientError) as exc_info:
-            client.initiate_auth(
-                AuthFlow="REFRESH_TOKEN_AUTH",
-                ClientId=settings.cognito_client_id,
-                AuthParameters={"REFRESH_TOKEN": "expired-refresh-token"},
-            )
-
-        assert exc_info.value.response["Error"]["Code"] == "NotAuthorizedException"
-
 
-class TestCognitoGlobalSignOut:
+class TestCognitoGlobalSignOut(PatchedBotoClient):
     """Test Cognito global sign out functionality."""
 
-    @patch("boto3.client")
-    def test_admin_global_sign_out_success(self, mock_boto_client):
+    def test_admin_global_sign_out_success(self):
         """Test successful admin global sign out."""
         # Setup mock
         mock_client = Mock()
         mock_client.admin_user_global_sign_out.return_value = {}
-        mock_boto_client.return_value = mock_client
+        self.mock_boto.return_value = mock_client
 
         # Execute
         client = get_cognito_client()
@@ -239,8 +202,7 @@ class TestCognitoGlobalSignOut:
             UserPoolId=settings.cognito_user_pool_id, Username="test@example.com"
         )
 
-    @patch("boto3.client")
-    def test_admin_global_sign_out_user_not_found(self, mock_boto_client):
+    def test_admin_global_sign_out_user_not_found(self):
         """Test global sign out with non-existent user."""
         # Setup mock
         mock_client = Mock()
@@ -250,7 +212,7 @@ class TestCognitoGlobalSignOut:
         mock_client.admin_user_global_sign_out.side_effect = ClientError(
             error_response, "AdminUserGlobalSignOut"
         )
-        mock_boto_client.return_value = mock_client
+        self.mock_boto.return_value = mock_client
 
         # Execute and verify
         client = get_cognito_client()
@@ -262,67 +224,65 @@ class TestCognitoGlobalSignOut:
         assert exc_info.value.response["Error"]["Code"] == "UserNotFoundException"
 
 
-class TestCognitoErrorHandling:
+class TestCognitoErrorHandling(PatchedBotoClient):
     """Test Cognito error handling and edge cases."""
 
-    @patch("boto3.client")
-    def test_too_many_requests_exception(self, mock_boto_client):
-        """Test TooManyRequestsException handling."""
-        # Setup mock
-        mock_client = Mock()
-        error_response = {"Error": {"Code": "TooManyRequestsException", "Message": "Rate exceeded"}}
-        mock_client.initiate_auth.side_effect = ClientError(error_response, "InitiateAuth")
-        mock_boto_client.return_value = mock_client
-
-        # Execute and verify
-        client = get_cognito_client()
-        with pytest.raises(ClientError) as exc_info:
-            client.initiate_auth(
-                AuthFlow="USER_PASSWORD_AUTH",
-                ClientId=settings.cognito_client_id,
-                AuthParameters={"USERNAME": "test@example.com", "PASSWORD": "Password123!"},
-            )
-
-        assert exc_info.value.response["Error"]["Code"] == "TooManyRequestsException"
-
-    @patch("boto3.client")
-    def test_invalid_parameter_exception(self, mock_boto_client):
-        """Test InvalidParameterException handling."""
-        # Setup mock
-        mock_client = Mock()
-        error_response = {
-            "Error": {"Code": "InvalidParameterException", "Message": "Invalid parameters"}
-        }
-        mock_client.initiate_auth.side_effect = ClientError(error_response, "InitiateAuth")
-        mock_boto_client.return_value = mock_client
-
-        # Execute and verify
-        client = get_cognito_client()
-        with pytest.raises(ClientError) as exc_info:
-            client.initiate_auth(
-                AuthFlow="USER_PASSWORD_AUTH",
-                ClientId=settings.cognito_client_id,
-                AuthParameters={"USERNAME": "invalid", "PASSWORD": "short"},
-            )
-
-        assert exc_info.value.response["Error"]["Code"] == "InvalidParameterException"
-
-    @patch("boto3.client")
-    def test_internal_error_exception(self, mock_boto_client):
-        """Test InternalErrorException handling."""
+    @pytest.mark.parametrize(
+        ("code", "message", "auth_flow", "auth_parameters"),
+        [
+            (
+                "NotAuthorizedException",
+                "Incorrect username or password.",
+                "USER_PASSWORD_AUTH",
+                {"USERNAME": "test@example.com", "PASSWORD": "WrongPassword"},
+            ),
+            (
+                "UserNotConfirmedException",
+                "User is not confirmed.",
+                "USER_PASSWORD_AUTH",
+                {"USERNAME": "unconfirmed@example.com", "PASSWORD": "Password123!"},
+            ),
+            (
+                "NotAuthorizedException",
+                "Refresh Token has expired",
+                "REFRESH_TOKEN_AUTH",
+                {"REFRESH_TOKEN": "expired-refresh-token"},
+            ),
+            (
+                "TooManyRequestsException",
+                "Rate exceeded",
+                "USER_PASSWORD_AUTH",
+                {"USERNAME": "test@example.com", "PASSWORD": "Password123!"},
+            ),
+            (
+                "InvalidParameterException",
+                "Invalid parameters",
+                "USER_PASSWORD_AUTH",
+                {"USERNAME": "invalid", "PASSWORD": "short"},
+            ),
+            (
+                "InternalErrorException",
+                "Internal error",
+                "USER_PASSWORD_AUTH",
+                {"USERNAME": "test@example.com", "PASSWORD": "Password123!"},
+            ),
+        ],
+    )
+    def test_initiate_auth_errors(self, code, message, auth_flow, auth_parameters):
+        """Test that Cognito InitiateAuth errors surface as ClientError with their code."""
         # Setup mock
         mock_client = Mock()
-        error_response = {"Error": {"Code": "InternalErrorException", "Message": "Internal error"}}
+        error_response = {"Error": {"Code": code, "Message": message}}
         mock_client.initiate_auth.side_effect = ClientError(error_response, "InitiateAuth")
-        mock_boto_client.return_value = mock_client
+        self.mock_boto.return_value = mock_client
 
         # Execute and verify
         client = get_cognito_client()
         with pytest.raises(ClientError) as exc_info:
             client.initiate_auth(
-                AuthFlow="USER_PASSWORD_AUTH",
+                AuthFlow=auth_flow,
                 ClientId=settings.cognito_client_id,
-                AuthParameters={"USERNAME": "test@example.com", "PASSWORD": "Password123!"},
+                AuthParameters=auth_parameters,
             )
 
-        assert exc_info.value.response["Error"]["Code"] == "InternalErrorException"
+        assert exc_info.value.response["Error"]["Code"] == code
@@ -0,0 +1,323 @@
+"""
+Unit tests for BaseRepository.
+
+Tests the shared DynamoDB helpers using moto to mock DynamoDB.
+"""
+
+import logging
+import os
+import threading
+from typing import Any
+from unittest.mock import Mock, PropertyMock, patch
+
+import pytest
+from pydantic import ValidationError
+
+# Set environment before imports
+os.environ["AWS_REGION"] = "us-east-1"
+os.environ["AWS_ACCESS_KEY_ID"] = "testing"
+os.environ["AWS_SECRET_ACCESS_KEY"] = "testing"
+
+from src.config import Settings
+from src.repositories.base import BaseRepository
+
+
+class ItemRepository(BaseRepository):
+    """Minimal concrete repository for exercising BaseRepository."""
+
+    def to_item(self, data: dict[str, Any]) -> dict[str, Any]:
+        return data
+
+    def from_item(self, item: dict[str, Any]) -> dict[str, Any]:
+        return item
+
+
+@pytest.fixture
+def repo(mock_dynamodb_table):
+    """Create a repository instance for testing."""
+    return ItemRepository()
+
+
+class TestBatchWriteItems:
+    """Tests for batch writes."""
+
+    def test_batch_write_items_multiple_batches(self, repo):
+        """Test writing more items than fit in a single batch."""
+        items = [{"PK": f"ITEM#{i}", "SK": "METADATA", "Data": {"n": i}} for i in range(30)]
+
+        assert repo.batch_write_items(items) is True
+
+        assert repo.get_item(pk="ITEM#0", sk="METADATA") is not None
+        assert repo.get_item(pk="ITEM#29", sk="METADATA")["Data"]["n"] == 29
+
+    def test_batch_write_items_retries_unprocessed(self, repo):
+        """Test that unprocessed items are re-sent until accepted."""
+        unprocessed = {repo.table_name: [{"PutRequest": {"Item": {"PK": "A", "SK": "B"}}}]}
+        service = Mock()
+        service.batch_write_item.side_effect = [
+            {"UnprocessedItems": unprocessed},
+            {"UnprocessedItems": {}},
+        ]
+
+        with (
+            patch.object(
+                BaseRepository, "dynamodb_resource", new_callable=PropertyMock
+            ) as mock_resource,
+            patch("src.repositories.base.time.sleep") as mock_sleep,
+        ):
+            mock_resource.return_value = service
+            result = repo.batch_write_items([{"PK": "A", "SK": "B"}])
+
+        assert result is True
+        assert service.batch_write_item.call_count == 2
+        assert service.batch_write_item.call_args.kwargs["RequestItems"] == unprocessed
+        mock_sleep.assert_called_once()
+
+    def test_batch_write_items_gives_up_after_retries(self, repo):
+        """Test that persistently unprocessed items return False."""
+        unprocessed = {repo.table_name: [{"PutRequest": {"Item": {"PK": "A", "SK": "B"}}}]}
+        service = Mock()
+        service.batch_write_item.return_value = {"UnprocessedItems": unprocessed}
+
+        with (
+            patch.object(
+                BaseRepository, "dynamodb_resource", new_callable=PropertyMock
+            ) as mock_resource,
+            patch("src.repositories.base.time.sleep"),
+        ):
+            mock_resource.return_value = service
+            result = repo.batch_write_items([{"PK": "A", "SK": "B"}], max_retries=2)
+
+        assert result is False
+        assert service.batch_write_item.call_count == 3
+
+
+class TestBatchGetItems:
+    """Tests for batch reads."""
+
+    def test_batch_get_items_multiple_batches(self, repo):
+        """Test reading more keys than fit in a single batch."""
+        items = [{"PK": f"ITEM#{i}", "SK": "METADATA", "Data": {"n": i}} for i in range(120)]
+        repo.batch_write_items(items)
+
+        keys = [{"PK": f"ITEM#{i}", "SK": "METADATA"} for i in range(120)]
+        result = repo.batch_get_items(keys)
+
+        assert len(result) == 120
+        assert {item["Data"]["n"] for item in result} == set(range(120))
+
+    def test_batch_get_items_with_projection(self, repo):
+        """Test that a projection limits the returned attributes."""
+        repo.put_item({"PK": "ITEM#1", "SK": "METADATA", "Data": {"n": 1, "big": "x" * 100}})
+
+        result = repo.batch_get_items(
+            [{"PK": "ITEM#1", "SK": "METADATA"}],
+            projection_expression="#data.n",
+            expression_attribute_names={"#data": "Data"},
+        )
+
+        assert result == [{"Data": {"n": 1}}]
+
+    def test_batch_get_items_retries_unprocessed(self, repo):
+        """Test that unprocessed keys are re-requested and their items returned."""
+        unprocessed = {repo.table_name: {"Keys": [{"PK": "B", "SK": "METADATA"}]}}
+        service = Mock()
+        service.batch_get_item.side_effect = [
+            {
+                "Responses": {repo.table_name: [{"PK": "A", "SK": "METADATA"}]},
+                "UnprocessedKeys": unprocessed,
+            },
+            {"Responses": {repo.table_name: [{"PK": "B", "SK": "METADATA"}]}},
+        ]
+
+        with (
+            patch.object(
+                BaseRepository, "dynamodb_resource", new_callable=PropertyMock
+            ) as mock_resource,
+            patch("src.repositories.base.time.sleep") as mock_sleep,
+        ):
+            mock_resource.return_value = service
+            result = repo.batch_get_items(
+                [{"PK": "A", "SK": "METADATA"}, {"PK": "B", "SK": "METADATA"}]
+            )
+
+        assert [item["PK"] for item in result] == ["A", "B"]
+        assert service.batch_get_item.call_args.kwargs["RequestItems"] == unprocessed
+        mock_sleep.assert_called_once()
+
+
+    def test_batch_get_items_logs_keys_left_unprocessed(self, repo, caplog):
+        """Test that keys still unprocessed after the retries are logged, not dropped silently."""
+        unprocessed = {repo.table_name: {"Keys": [{"PK": "B", "SK": "METADATA"}]}}
+        service = Mock()
+        service.batch_get_item.return_value = {
+            "Responses": {repo.table_name: []},
+            "UnprocessedKeys": unprocessed,
+        }
+
+        with (
+            patch.object(
+                BaseRepository, "dynamodb_resource", new_callable=PropertyMock
+            ) as mock_resource,
+            patch("src.repositories.base.time.sleep"),
+            caplog.at_level(logging.WARNING, logger="src.repositories.base"),
+        ):
+            mock_resource.return_value = service
+            result = repo.batch_get_items([{"PK": "B", "SK": "METADATA"}], max_retries=2)
+
+        assert result == []
+        assert service.batch_get_item.call_count == 3
+        assert "1 keys still unprocessed after 2 retries" in caplog.text
+
+
+class TestResourcePerThread:
+    """Tests for keeping boto3 resources out of shared use across threads."""
+
+    def test_resource_is_cached_per_thread(self, repo):
+        """Test that each thread gets its own Table resource but shares the client."""
+        other = {}
+
+        def read_in_thread():
+            other["resource"] = repo.resource
+            other["client"] = ItemRepository(repo.table_name).client
+
+        worker = threading.Thread(target=read_in_thread)
+        worker.start()
+        worker.join()
+
+        assert repo.resource is ItemRepository(repo.table_name).resource
+        assert other["resource"] is not repo.resource
+        assert other["client"] is repo.client
+
+
+class TestReadResource:
+    """Tests for routing hot reads through DAX."""
+
+    def test_read_resource_defaults_to_table(self, repo):
+        """Test that reads use the regular table when no DAX endpoint is set."""
+        with patch("src.repositories.base.settings.dax_endpoint", ""):
+            assert repo.read_resource is repo.resource
+
+    def test_get_item_reads_through_dax_when_configured(self, repo):
+        """Test that use_dax reads go to the DAX table and other reads do not."""
+        dax_table = Mock()
+        dax_table.get_item.return_value = {"Item": {"PK": "A", "SK": "B"}}
+
+        with (
+            patch("src.repositories.base.settings.dax_endpoint", "dax://cluster"),
+            patch("src.repositories.base._build_dax_table", return_value=dax_table),
+        ):
+            assert repo.get_item(pk="A", sk="B", use_dax=True) == {"PK": "A", "SK": "B"}
+            assert repo.get_item(pk="A", sk="B") is None
+
+        dax_table.get_item.assert_called_once()
+
+    def test_dax_endpoint_requires_dax_client(self):
+        """Test that configuring DAX without amazon-dax-client fails at startup."""
+        with (
+            patch("src.config.importlib.util.find_spec", return_value=None),
+            pytest.raises(ValidationError, match="amazon-dax-client"),
+        ):
+            Settings(dax_endpoint="dax://cluster")
+
+
+class TestTransactWrite:
+    """Tests for transactional writes."""
+
+    def test_transact_write_applies_all_operations(self, repo):
+        """Test that a put and an update commit together."""
+        repo.put_item({"PK": "COUNTER", "SK": "TOTAL", "Hits": 1})
+
+        committed = repo.transact_write(
+            [
+                {"Put": {"Item": {"PK": "ITEM#1", "SK": "METADATA", "Data": {"tags": ["a"]}}}},
+                {
+                    "Update": {
+                        "Key": {"PK": "COUNTER", "SK": "TOTAL"},
+                        "UpdateExpression": "ADD Hits :one",
+                        "ExpressionAttributeValues": {":one": 1},
+                    }
+                },
+            ]
+        )
+
+        assert committed is True
+        assert repo.get_item(pk="ITEM#1", sk="METADATA")["Data"] == {"tags": ["a"]}
+        assert repo.get_item(pk="COUNTER", sk="TOTAL")["Hits"] == 2
+
+    def test_transact_write_condition_failed(self, repo):
+        """Test that a failed condition cancels every operation."""
+        committed = repo.transact_write(
+            [
+                {"Put": {"Item": {"PK": "ITEM#1", "SK": "METADATA"}}},
+                {
+                    "ConditionCheck": {
+                        "Key": {"PK": "ITEM#missing", "SK": "METADATA"},
+                        "ConditionExpression": "attribute_exists(PK)",
+                    }
+                },
+            ]
+        )
+
+        assert committed is False
+        assert repo.get_item(pk="ITEM#1", sk="METADATA") is None
+
+
+class TestTransactCounters:
+    """Tests for transactions that increment seeded counters."""
+
+    def test_transact_counters_seeds_missing_counter(self, repo):
+        """Test that a missing counter is seeded and the transaction retried."""
+        committed = repo.transact_counters(
+            [
+                {"Put": {"Item": {"PK": "ITEM#1", "SK": "METADATA"}}},
+                repo.counter_update("COUNTER", "TOTAL", "hits", {"last": "ITEM#1"}),
+            ],
+            [{"PK": "COUNTER", "SK": "TOTAL", "Data": {"hits": 0}}],
+        )
+
+        assert committed is True
+        assert repo.get_item(pk="ITEM#1", sk="METADATA") is not None
+        assert repo.get_item(pk="COUNTER", sk="TOTAL")["Data"] == {"hits": 1, "last": "ITEM#1"}
+
+    def test_transact_counters_leading_condition_failed(self, repo):
+        """Test that a failed leading condition returns False without seeding."""
+        repo.put_item({"PK": "ITEM#1", "SK": "METADATA"})
+
+        committed = repo.transact_counters(
+            [
+                {
+                    "Put": {
+                        "Item": {"PK": "ITEM#1", "SK": "METADATA"},
+                        "ConditionExpression": "attribute_not_exists(PK)",
+                    }
+                },
+                repo.counter_update("COUNTER", "TOTAL", "hits"),
+            ],
+            [{"PK": "COUNTER", "SK": "TOTAL", "Data": {"hits": 0}}],
+        )
+
+        assert committed is False
+        assert repo.get_item(pk="COUNTER", sk="TOTAL") is None
+
+
+class TestClientQuery:
+    """Tests for queries through the low-level client."""
+
+    def test_client_query_matches_resource_query(self, repo):
+        """Test that client_query returns the same plain items and keys as query."""
+        for i in range(3):
+            repo.put_item({"PK": "ITEM", "SK": f"#{i}", "Data": {"n": i, "tags": ["a"]}})
+
+        params = {
+            "key_condition_expression": "PK = :pk",
+            "expression_attribute_values": {":pk": "ITEM"},
+            "limit": 2,
+        }
+        first = repo.client_query(**params)
+        second = repo.client_query(**params, exclusive_start_key=first["LastEvaluatedKey"])
+
+        assert first == repo.query(**params)
+        assert first["LastEvaluatedKey"] == {"PK": "ITEM", "SK": "#1"}
+        assert [item["Data"]["n"] for item in first["Items"] + second["Items"]] == [0, 1, 2]
+        assert second["LastEvaluatedKey"] is None
@@ -142,6 +142,26 @@ class TestListBlogs:
         call_args = mock_blog_repo.list_posts.call_args
         assert call_args.kwargs["limit"] == 10
 
+    def test_list_blogs_last_evaluated_key_round_trip(
+        self, test_client, override_get_blog_repository, mock_blog_repo, sample_blog_list_response
+    ):
+        """Test that the pagination key keeps its DynamoDB attribute names."""
+        last_key = {
+            "PK": "BLOG#blog-2",
+            "SK": "METADATA",
+            "GSI1PK": "BLOG#STATUS#PUBLISHED",
+            "GSI1SK": "BLOG#2024-01-16T10:00:00Z",
+        }
+        mock_blog_repo.list_posts.return_value = {
+            **sample_blog_list_response,
+            "lastEvaluatedKey": last_key,
+        }
+
+        response = test_client.get("/blogs")
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json()["lastEvaluatedKey"] == last_key
+
     def test_list_blogs_invalid_status(
         self, test_client, override_get_blog_repository, mock_blog_repo
     ):
@@ -5,61 +5,23 @@ Tests all blog repository operations using moto to mock DynamoDB.
 """
 
 import os
+from unittest.mock import patch
 
-import boto3
 import pytest
-from moto import mock_aws
 
 # Set environment before imports
 os.environ["AWS_REGION"] = "us-east-1"
 os.environ["AWS_ACCESS_KEY_ID"] = "testing"
 os.environ["AWS_SECRET_ACCESS_KEY"] = "testing"
 
+from src.repositories import blog as blog_module
 from src.repositories.blog import BlogRepository
 
 
 @pytest.fixture
-def dynamodb_table():
-    """Create a mock DynamoDB table for testing."""
-    with mock_aws():
-        # Create DynamoDB client
-        dynamodb = boto3.client("dynamodb", region_name="us-east-1")
-
-        # Create table
-        table_name = "portfolio-api-table"
-        dynamodb.create_table(
-            TableName=table_name,
-            KeySchema=[
-                {"AttributeName": "PK", "KeyType": "HASH"},
-                {"AttributeName": "SK", "KeyType": "RANGE"},
-            ],
-            AttributeDefinitions=[
-                {"AttributeName": "PK", "AttributeType": "S"},
-                {"AttributeName": "SK", "AttributeType": "S"},
-                {"AttributeName": "GSI1PK", "AttributeType": "S"},
-                {"AttributeName": "GSI1SK", "AttributeType": "S"},
-            ],
-            GlobalSecondaryIndexes=[
-                {
-                    "IndexName": "GSI1",
-                    "KeySchema": [
-                        {"AttributeName": "GSI1PK", "KeyType": "HASH"},
-                        {"AttributeName": "GSI1SK", "KeyType": "RANGE"},
-                    ],
-                    "Projection": {"ProjectionType": "ALL"},
-                    "ProvisionedThroughput": {"ReadCapacityUnits": 5, "WriteCapacityUnits": 5},
-                }
-            ],
-            BillingMode="PROVISIONED",
-            ProvisionedThroughput={"ReadCapacityUnits": 5, "WriteCapacityUnits": 5},
-        )
-
-        yield table_name
-
-
-@pytest.fixture
-def blog_repo(dynamodb_table):
+def blog_repo(mock_dynamodb_table):
     """Create a BlogRepository instance for testing."""
+    blog_module._category_cache.clear()
     return BlogRepository()
 
 
@@ -126,6 +88,35 @@ class TestBlogRepositoryCreate:
 
         assert post["slug"] == "building-rest-apis-with-fastapi"
 
+    def test_create_slug_strips_special_characters(self, blog_repo):
+        """Test that punctuation is dropped from generated slugs."""
+        post = blog_repo.create(
+            {
+                "title": "What's New in Python 3.12?",
+                "content": "Content",
+                "excerpt": "Excerpt",
+                "category": "Python",
+                "tags": [],
+            }
+        )
+
+        assert post["slug"] == "whats-new-in-python-312"
+
+    def test_create_slug_keeps_unicode_letters(self, blog_repo):
+        """Test that accented and non-Latin letters survive slug generation."""
+        cafe = blog_repo.create({"title": "Café au lait", "content": "Content"})
+        japanese = blog_repo.create({"title": "日本語のブログ", "content": "Content"})
+
+        assert cafe["slug"] == "café-au-lait"
+        assert japanese["slug"] == "日本語のブログ"
+
+    def test_create_slug_falls_back_to_post_id(self, blog_repo):
+        """Test that a title with nothing sluggable gets the post id as its slug."""
+        post = blog_repo.create({"title": "?!", "content": "Content"})
+
+        assert post["slug"] == post["id"]
+        assert blog_repo.get_by_id(post["id"])["slug"] == post["id"]
+
     def test_create_calculates_read_time(self, blog_repo):
         """Test read time calculation based on content length."""
         # Short content (< 200 words)
@@ -315,6 +306,64 @@ class TestBlogRepositoryUpdate:
         result = blog_repo.update("nonexistent-id", {"title": "New Title"})
         assert result is None
 
+    def test_update_without_changes_skips_write(self, blog_repo):
+        """Test that an update with no updatable fields leaves the post untouched."""
+        post = blog_repo.create(
+            {
+                "title": "Original Title",
+                "content": "Content",
+                "excerpt": "Excerpt",
+                "category": "Test",
+                "tags": [],
+            }
+        )
+
+        result = blog_repo.update(post["id"], {"slug": "ignored"})
+
+        assert result["updatedAt"] == post["updatedAt"]
+        assert blog_repo.get_by_id(post["id"])["updatedAt"] == post["updatedAt"]
+
+    def test_update_category_moves_count(self, blog_repo):
+        """Test that changing category moves the post between category counts."""
+        post = blog_repo.create(
+            {
+                "title": "Test Post",
+                "content": "Content",
+                "excerpt": "Excerpt",
+                "category": "Backend",
+                "tags": [],
+            }
+        )
+
+        updated = blog_repo.update(post["id"], {"category": "DevOps", "title": "Moved"})
+
+        assert updated["category"] == "DevOps"
+        assert updated["title"] == "Moved"
+        assert blog_repo.get_by_id(post["id"])["category"] == "DevOps"
+        counts = {c["name"]: c["count"] for c in blog_repo.get_categories()}
+        assert counts == {"Backend": 0, "DevOps": 1}
+
+    def test_update_category_of_deleted_post_leaves_counts(self, blog_repo):
+        """Test that category counts don't move if the post is gone before the write."""
+        post = blog_repo.create(
+            {
+                "title": "Test Post",
+                "content": "Content",
+                "excerpt": "Excerpt",
+                "category": "Backend",
+                "tags": [],
+            }
+        )
+        # Post deleted between the read in update() and its write
+        blog_repo.resource.delete_item(Key={"PK": f"BLOG#{post['id']}", "SK": "METADATA"})
+
+        with patch.object(BlogRepository, "get_by_id", return_value=dict(post)):
+            result = blog_repo.update(post["id"], {"category": "DevOps"})
+
+        assert result is None
+        counts = {c["name"]: c["count"] for c in blog_repo.get_categories()}
+        assert counts == {"Backend": 1}
+
 
 class TestBlogRepositoryPublish:
     """Tests for publishing/unpublishing posts."""
@@ -475,3 +524,71 @@ class TestBlogRepositoryCategories:
         else:
             # Category removed if count reached 0
             assert count_before == 1
+
+    def test_delete_post_removes_post_and_count_in_one_transaction(self, blog_repo):
+        """Test that the delete and the category decrement commit together."""
+        post = blog_repo.create({"title": "Atomic", "content": "Content", "category": "Atomic"})
+
+        with patch.object(
+            BlogRepository, "transact_write", wraps=blog_repo.transact_write
+        ) as mock_transact:
+            assert blog_repo.delete(post["id"]) is True
+
+        operations = [next(iter(entry)) for entry in mock_transact.call_args.args[0]]
+        assert operations == ["Delete", "Update"]
+        assert blog_repo.get_by_id(post["id"]) is None
+        assert next(c for c in blog_repo.get_categories() if c["name"] == "Atomic")["count"] == 0
+
+    def test_get_categories_cached_until_next_write(self, blog_repo):
+        """Test that categories are served from cache and refreshed by writes."""
+        post_data = {
+            "title": "Cached Post",
+            "content": "Content",
+            "excerpt": "Excerpt",
+            "category": "Caching",
+            "tags": [],
+        }
+        blog_repo.create(dict(post_data))
+        assert blog_repo.get_categories() == [{"name": "Caching", "count": 1}]
+
+        # Changes made behind the repository's back are not seen while cached
+        blog_repo.resource.update_item(
+            Key={"PK": "BLOG#CATEGORIES", "SK": "CATEGORY#Caching"},
+            UpdateExpression="SET CategoryCount = :count",
+            ExpressionAttributeValues={":count": 10},
+        )
+        assert blog_repo.get_categories() == [{"name": "Caching", "count": 1}]
+
+        # A write through the repository invalidates the cache
+        blog_repo.create(dict(post_data))
+        assert blog_repo.get_categories() == [{"name": "Caching", "count": 11}]
+
+    def test_migrate_category_counts_from_legacy_items(self, blog_repo):
+        """Test that legacy per-category counters are folded into the shared partition."""
+        for category, count in (("Backend", 3), ("DevOps", 2)):
+            blog_repo.put_item(
+                {
+                    "PK": f"BLOG#CATEGORY#{category}",
+                    "SK": "COUNT",
+                    "EntityType": "BLOG_CATEGORY",
+                    "Data": {"category": category, "count": count},
+                }
+            )
+        # A post written after the new layout shipped, before the migration ran
+        blog_repo.create(
+            {
+                "title": "New Post",
+                "content": "Content",
+                "excerpt": "Excerpt",
+                "category": "Backend",
+                "tags": [],
+            }
+        )
+
+        assert blog_repo.migrate_category_counts() == {"Backend": 3, "DevOps": 2}
+        # Re-running finds nothing left to move
+        assert blog_repo.migrate_category_counts() == {}
+
+        counts = {c["name"]: c["count"] for c in blog_repo.get_categories()}
+        assert counts == {"Backend": 4, "DevOps": 2}
+        assert blog_repo.get_item(pk="BLOG#CATEGORY#Backend", sk="COUNT") is None
@@ -0,0 +1,53 @@
+"""
+Unit tests for the in-process TTL cache.
+"""
+
+from unittest.mock import patch
+
+from src.utils.cache import TTLCache
+
+
+class TestTTLCache:
+    """Tests for TTLCache."""
+
+    def test_get_returns_value_until_expired(self):
+        """Test that entries are served until their TTL passes."""
+        cache = TTLCache(ttl=10.0)
+
+        with patch("src.utils.cache.time.monotonic", return_value=100.0):
+            cache.set("key", 1)
+        with patch("src.utils.cache.time.monotonic", return_value=109.0):
+            assert cache.get("key") == 1
+        with patch("src.utils.cache.time.monotonic", return_value=110.0):
+            assert cache.get("key") is None
+
+    def test_invalidate_and_clear(self):
+        """Test that invalidate drops the given keys and clear drops everything."""
+        cache = TTLCache(ttl=10.0)
+        for key in ("a", "b", "c"):
+            cache.set(key, key)
+
+        cache.invalidate("a", "missing")
+        assert cache.get("a") is None
+        assert cache.get("b") == "b"
+
+        cache.clear()
+        assert cache.get("b") is None
+        assert cache.get("c") is None
+
+    def test_full_cache_evicts_expired_then_oldest(self):
+        """Test that a full cache drops expired entries before live ones."""
+        cache = TTLCache(ttl=10.0, max_size=3)
+
+        with patch("src.utils.cache.time.monotonic", return_value=0.0):
+            cache.set("expired", 0)
+        with patch("src.utils.cache.time.monotonic", return_value=5.0):
+            cache.set("old", 1)
+            cache.set("new", 2)
+        with patch("src.utils.cache.time.monotonic", return_value=11.0):
+            cache.set("first", 3)
+            assert (cache.get("old"), cache.get("new")) == (1, 2)
+
+            cache.set("second", 4)
+            assert cache.get("old") is None
+            assert (cache.get("new"), cache.get("first"), cache.get("second")) == (2, 3, 4)
@@ -6,9 +6,7 @@ Tests all certification repository operations using moto to mock DynamoDB.
 
 import os
 
-import boto3
 import pytest
-from moto import mock_aws
 
 # Set environment before imports
 os.environ["AWS_REGION"] = "us-east-1"
@@ -19,46 +17,7 @@ from src.repositories.certification import CertificationRepository
 
 
 @pytest.fixture
-def dynamodb_table():
-    """Create a mock DynamoDB table for testing."""
-    with mock_aws():
-        # Create DynamoDB client
-        dynamodb = boto3.client("dynamodb", region_name="us-east-1")
-
-        # Create table
-        table_name = "portfolio-api-table"
-        dynamodb.create_table(
-            TableName=table_name,
-            KeySchema=[
-                {"AttributeName": "PK", "KeyType": "HASH"},
-                {"AttributeName": "SK", "KeyType": "RANGE"},
-            ],
-            AttributeDefinitions=[
-                {"AttributeName": "PK", "AttributeType": "S"},
-                {"AttributeName": "SK", "AttributeType": "S"},
-                {"AttributeName": "GSI1PK", "AttributeType": "S"},
-                {"AttributeName": "GSI1SK", "AttributeType": "S"},
-            ],
-            GlobalSecondaryIndexes=[
-                {
-                    "IndexName": "GSI1",
-                    "KeySchema": [
-                        {"AttributeName": "GSI1PK", "KeyType": "HASH"},
-                        {"AttributeName": "GSI1SK", "KeyType": "RANGE"},
-                    ],
-                    "Projection": {"ProjectionType": "ALL"},
-                    "ProvisionedThroughput": {"ReadCapacityUnits": 5, "WriteCapacityUnits": 5},
-                }
-            ],
-            BillingMode="PROVISIONED",
-            ProvisionedThroughput={"ReadCapacityUnits": 5, "WriteCapacityUnits": 5},
-        )
-
-        yield table_name
-
-
-@pytest.fixture
-def cert_repo(dynamodb_table):
+def cert_repo(mock_dynamodb_table):
     """Create a CertificationRepository instance for testing."""
     return CertificationRepository()
 
@@ -294,6 +253,66 @@ class TestCertificationRepositoryRead:
         assert results["count"] == 1
         assert results["items"][0]["featured"] is True
 
+    def test_list_certifications_merges_types_newest_first(self, cert_repo):
+        """Test that certifications and courses are interleaved by date earned."""
+        for name, cert_type, date_earned in [
+            ("Cert Jan", "certification", "2023-01-01"),
+            ("Course Mar", "course", "2023-03-01"),
+            ("Cert Feb", "certification", "2023-02-01"),
+        ]:
+            cert_repo.create(
+                {
+                    "name": name,
+                    "issuer": "Issuer",
+                    "icon": "🏆",
+                    "type": cert_type,
+                    "featured": False,
+                    "description": name,
+                    "dateEarned": date_earned,
+                }
+            )
+
+        results = cert_repo.list_certifications(status="DRAFT", limit=10)
+
+        assert [cert["name"] for cert in results["items"]] == [
+            "Course Mar",
+            "Cert Feb",
+            "Cert Jan",
+        ]
+
+    def test_list_certifications_featured_filter_beyond_limit(self, cert_repo):
+        """Test that the featured filter still finds older items past the limit."""
+        cert_repo.create(
+            {
+                "name": "Featured Cert",
+                "issuer": "Issuer",
+                "icon": "🏆",
+                "type": "certification",
+                "featured": True,
+                "description": "Featured",
+                "dateEarned": "2023-01-01",
+            }
+        )
+
+        # Newer non-featured certifications sort ahead of the featured one
+        for i in range(3):
+            cert_repo.create(
+                {
+                    "name": f"Regular Cert {i}",
+                    "issuer": "Issuer",
+                    "icon": "📜",
+                    "type": "certification",
+                    "featured": False,
+                    "description": "Regular",
+                    "dateEarned": f"2023-02-0{i+1}",
+                }
+            )
+
+        results = cert_repo.list_certifications(status="DRAFT", featured=True, limit=1)
+
+        assert results["count"] == 1
+        assert results["items"][0]["name"] == "Featured Cert"
+
 
 class TestCertificationRepositoryUpdate:
     """Tests for updating certifications."""
@@ -11,9 +11,12 @@ from datetime import datetime, timedelta
 from unittest.mock import Mock, patch
 
 import pytest
-from jose import JWTError
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+from jose import JWTError, jwt
 
 from src.config import settings
+from src.utils import jwt as jwt_utils
 from src.utils.jwt import decode_token, extract_user_from_token, get_cognito_public_keys
 
 
@@ -76,7 +79,7 @@ def mock_expired_token_claims():
 class TestGetCognitoPublicKeys:
     """Test suite for get_cognito_public_keys function."""
 
-    @patch("src.utils.jwt.requests.get")
+    @patch("src.utils.jwt._http.get")
     def test_get_cognito_public_keys_success(self, mock_get, mock_jwks):
         """Test successful retrieval of Cognito public keys."""
         # Setup mock response
@@ -86,7 +89,7 @@ class TestGetCognitoPublicKeys:
         mock_get.return_value = mock_response
 
         # Clear cache before test
-        get_cognito_public_keys.cache_clear()
+        jwt_utils._clear_jwks_cache()
 
         # Execute
         result = get_cognito_public_keys()
@@ -100,14 +103,14 @@ class TestGetCognitoPublicKeys:
         expected_url = f"https://cognito-idp.{settings.cognito_region}.amazonaws.com/{settings.cognito_user_pool_id}/.well-known/jwks.json"
         mock_get.assert_called_once_with(expected_url, timeout=5)
 
-    @patch("src.utils.jwt.requests.get")
+    @patch("src.utils.jwt._http.get")
     def test_get_cognito_public_keys_http_error(self, mock_get):
         """Test handling of HTTP errors when fetching public keys."""
         # Setup mock to raise HTTP error
         mock_get.side_effect = Exception("HTTP 404 Not Found")
 
         # Clear cache before test
-        get_cognito_public_keys.cache_clear()
+        jwt_utils._clear_jwks_cache()
 
         # Execute and verify exception
         with pytest.raises(Exception) as exc_info:
@@ -115,7 +118,7 @@ class TestGetCognitoPublicKeys:
 
         assert "Failed to fetch Cognito public keys" in str(exc_info.value)
 
-    @patch("src.utils.jwt.requests.get")
+    @patch("src.utils.jwt._http.get")
     def test_get_cognito_public_keys_caching(self, mock_get, mock_jwks):
         """Test that public keys are cached after first fetch."""
         # Setup mock response
@@ -125,7 +128,7 @@ class TestGetCognitoPublicKeys:
         mock_get.return_value = mock_response
 
         # Clear cache before test
-        get_cognito_public_keys.cache_clear()
+        jwt_utils._clear_jwks_cache()
 
         # First call
         result1 = get_cognito_public_keys()
@@ -138,6 +141,40 @@ class TestGetCognitoPublicKeys:
         # Should only call once due to caching
         assert mock_get.call_count == 1
 
+    @patch("src.utils.jwt._http.get")
+    def test_get_cognito_public_keys_expires(self, mock_get, mock_jwks):
+        """Test that cached public keys are refetched once the TTL passes."""
+        mock_response = Mock()
+        mock_response.json.return_value = mock_jwks
+        mock_response.raise_for_status.return_value = None
+        mock_get.return_value = mock_response
+
+        jwt_utils._clear_jwks_cache()
+
+        get_cognito_public_keys()
+        jwt_utils._jwks_cache["expires"] = 0.0
+        get_cognito_public_keys()
+
+        assert mock_get.call_count == 2
+
+    @patch("src.utils.jwt._http.get")
+    def test_get_cognito_public_keys_force_refresh_rate_limited(self, mock_get, mock_jwks):
+        """Test that forced refreshes right after a fetch reuse the cached keys."""
+        mock_response = Mock()
+        mock_response.json.return_value = mock_jwks
+        mock_response.raise_for_status.return_value = None
+        mock_get.return_value = mock_response
+
+        jwt_utils._clear_jwks_cache()
+
+        get_cognito_public_keys()
+        get_cognito_public_keys(force_refresh=True)
+        assert mock_get.call_count == 1
+
+        jwt_utils._jwks_cache["fetched"] -= jwt_utils._JWKS_MIN_REFRESH_INTERVAL
+        get_cognito_public_keys(force_refresh=True)
+        assert mock_get.call_count == 2
+
 
 class TestDecodeToken:
     """Test suite for decode_token function."""
@@ -169,6 +206,27 @@ class TestDecodeToken:
         assert call_args[1]["audience"] == settings.cognito_client_id
         assert call_args[1]["issuer"] == settings.jwt_issuer
 
+    @patch("src.utils.jwt.get_cognito_public_keys")
+    @patch("src.utils.jwt.jwt.get_unverified_header")
+    @patch("src.utils.jwt.jwt.decode")
+    def test_decode_token_reuses_parsed_key(
+        self, mock_decode, mock_header, mock_keys, mock_jwks, mock_valid_token_claims
+    ):
+        """Test that the matching JWK is parsed once and reused across tokens."""
+        from jose.backends.base import Key
+
+        mock_keys.return_value = mock_jwks
+        mock_header.return_value = {"kid": "test-key-id-2"}
+        mock_decode.return_value = mock_valid_token_claims
+
+        decode_token("first.jwt.token")
+        decode_token("second.jwt.token")
+
+        first_key = mock_decode.call_args_list[0][0][1]
+        second_key = mock_decode.call_args_list[1][0][1]
+        assert isinstance(first_key, Key)
+        assert first_key is second_key
+
     @patch("src.utils.jwt.get_cognito_public_keys")
     @patch("src.utils.jwt.jwt.get_unverified_header")
     def test_decode_token_key_not_found(self, mock_header, mock_keys, mock_jwks):
@@ -248,6 +306,50 @@ class TestDecodeToken:
         assert result is None
 
 
+class TestDecodeTokenSignature:
+    """Test decode_token against tokens signed with a real RSA key."""
+
+    @patch("src.utils.jwt.get_cognito_public_keys")
+    def test_decode_token_verifies_real_signature(
+        self, mock_keys, rsa_keypair, mock_valid_token_claims
+    ):
+        """Test that a token signed by the JWKS key is verified and decoded."""
+        private_pem, jwks = rsa_keypair
+        mock_keys.return_value = jwks
+        token = jwt.encode(
+            mock_valid_token_claims,
+            private_pem,
+            algorithm="RS256",
+            headers={"kid": "test-key-id-1"},
+        )
+
+        result = decode_token(token)
+
+        assert result["sub"] == "test-user-id-123"
+
+    @patch("src.utils.jwt.get_cognito_public_keys")
+    def test_decode_token_rejects_foreign_signature(
+        self, mock_keys, rsa_keypair, mock_valid_token_claims
+    ):
+        """Test that a token signed by another key fails verification."""
+        _, jwks = rsa_keypair
+        mock_keys.return_value = jwks
+        other_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+        other_pem = other_key.private_bytes(
+            serialization.Encoding.PEM,
+            serialization.PrivateFormat.PKCS8,
+            serialization.NoEncryption(),
+        )
+        token = jwt.encode(
+            mock_valid_token_claims,
+            other_pem,
+            algorithm="RS256",
+            headers={"kid": "test-key-id-1"},
+        )
+
+        assert decode_token(token) is None
+
+
 class TestExtractUserFromToken:
     """Test suite for extract_user_from_token function."""
 
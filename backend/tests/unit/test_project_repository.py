@@ -6,60 +6,21 @@ Tests all project repository operations using moto to mock DynamoDB.
 
 import os
 
-import boto3
 import pytest
-from moto import mock_aws
 
 # Set environment before imports
 os.environ["AWS_REGION"] = "us-east-1"
 os.environ["AWS_ACCESS_KEY_ID"] = "testing"
 os.environ["AWS_SECRET_ACCESS_KEY"] = "testing"
 
+from src.repositories import project as project_module
 from src.repositories.project import ProjectRepository
 
 
 @pytest.fixture
-def dynamodb_table():
-    """Create a mock DynamoDB table for testing."""
-    with mock_aws():
-        # Create DynamoDB client
-        dynamodb = boto3.client("dynamodb", region_name="us-east-1")
-
-        # Create table
-        table_name = "portfolio-api-table"
-        dynamodb.create_table(
-            TableName=table_name,
-            KeySchema=[
-                {"AttributeName": "PK", "KeyType": "HASH"},
-                {"AttributeName": "SK", "KeyType": "RANGE"},
-            ],
-            AttributeDefinitions=[
-                {"AttributeName": "PK", "AttributeType": "S"},
-                {"AttributeName": "SK", "AttributeType": "S"},
-                {"AttributeName": "GSI1PK", "AttributeType": "S"},
-                {"AttributeName": "GSI1SK", "AttributeType": "S"},
-            ],
-            GlobalSecondaryIndexes=[
-                {
-                    "IndexName": "GSI1",
-                    "KeySchema": [
-                        {"AttributeName": "GSI1PK", "KeyType": "HASH"},
-                        {"AttributeName": "GSI1SK", "KeyType": "RANGE"},
-                    ],
-                    "Projection": {"ProjectionType": "ALL"},
-                    "ProvisionedThroughput": {"ReadCapacityUnits": 5, "WriteCapacityUnits": 5},
-                }
-            ],
-            BillingMode="PROVISIONED",
-            ProvisionedThroughput={"ReadCapacityUnits": 5, "WriteCapacityUnits": 5},
-        )
-
-        yield table_name
-
-
-@pytest.fixture
-def project_repo(dynamodb_table):
+def project_repo(mock_dynamodb_table):
     """Create a ProjectRepository instance for testing."""
+    project_module._project_cache.clear()
     return ProjectRepository()
 
 
@@ -250,6 +211,45 @@ class TestProjectRepositoryRead:
         assert results["items"][0]["featured"] is True
 
 
+class TestProjectCache:
+    """Tests for the in-process project cache."""
+
+    def test_get_by_id_served_from_cache(self, project_repo):
+        """Test that repeat reads skip DynamoDB until the entry is evicted."""
+        project = project_repo.create(
+            {"name": "Cached", "description": "Description", "tech": [], "featured": False}
+        )
+
+        # Change the stored item behind the repository's back
+        project_repo.update_item(
+            pk=f"PROJECT#{project['id']}",
+            sk="METADATA",
+            update_expression="SET #data.#name = :name",
+            expression_attribute_values={":name": "Changed"},
+            expression_attribute_names={"#data": "Data", "#name": "name"},
+        )
+        assert project_repo.get_by_id(project["id"])["name"] == "Cached"
+
+        project_module._project_cache.invalidate(project["id"])
+        assert project_repo.get_by_id(project["id"])["name"] == "Changed"
+
+    def test_writes_refresh_cache(self, project_repo):
+        """Test that update, publish and delete keep cached reads current."""
+        project = project_repo.create(
+            {"name": "Original", "description": "Description", "tech": [], "featured": False}
+        )
+        project_repo.get_by_id(project["id"])
+
+        project_repo.update(project["id"], {"name": "Renamed"})
+        assert project_repo.get_by_id(project["id"])["name"] == "Renamed"
+
+        project_repo.publish(project["id"])
+        assert project_repo.get_by_id(project["id"])["status"] == "PUBLISHED"
+
+        project_repo.delete(project["id"])
+        assert project_repo.get_by_id(project["id"]) is None
+
+
 class TestProjectRepositoryUpdate:
     """Tests for updating projects."""
 
@@ -294,6 +294,21 @@ class TestProjectRepositoryUpdate:
         result = project_repo.update("nonexistent-id", {"name": "New Name"})
         assert result is None
 
+    def test_update_without_changes_skips_write(self, project_repo):
+        """Test that an update with no updatable fields leaves the project untouched."""
+        project = project_repo.create(
+            {
+                "name": "Unchanged",
+                "description": "Description",
+                "tech": [],
+                "featured": False,
+            }
+        )
+
+        result = project_repo.update(project["id"], {"status": "PUBLISHED"})
+
+        assert result == project
+
 
 class TestProjectRepositoryPublish:
     """Tests for publishing/unpublishing projects."""
@@ -223,6 +223,26 @@ class TestCreateProject:
         assert response.status_code == status.HTTP_201_CREATED
         data = response.json()
         assert data["name"] == "Test Project"
+        create_kwargs = mock_project_repo.create.call_args.args[0]
+        assert create_kwargs["githubUrl"] == "https://github.com/test/project"
+
+    def test_create_project_invalid_url(
+        self,
+        test_client,
+        override_get_project_repository,
+        mock_project_repo,
+        mock_user_info,
+    ):
+        """Test creating a project with a malformed URL."""
+        create_data = {"name": "Test Project", "description": "Description", "githubUrl": "nope"}
+
+        with patch("src.dependencies.extract_user_from_token", return_value=mock_user_info):
+            response = test_client.post(
+                "/projects", json=create_data, headers={"Authorization": "Bearer valid-token"}
+            )
+
+        assert response.status_code == status.HTTP_422_UNPROCESSABLE_CONTENT
+        mock_project_repo.create.assert_not_called()
 
     def test_create_project_without_auth(
         self, test_client, override_get_project_repository, mock_project_repo
@@ -0,0 +1,26 @@
+"""
+Unit tests for visitor tracking models.
+"""
+
+from datetime import datetime
+
+from src.models.visitor import VisitorLog
+
+
+class TestVisitorLog:
+    """Tests for the VisitorLog DynamoDB model."""
+
+    def test_model_dump_includes_derived_keys(self):
+        """Test that the table keys are derived from timestamp and visitor_id."""
+        log = VisitorLog(
+            visitor_id="abc123",
+            page_path="/blog/my-first-post",
+            timestamp=datetime(2025, 1, 1, 12, 0, 0),
+        )
+
+        dumped = log.model_dump()
+
+        assert dumped["pk"] == "VISITOR#2025-01-01"
+        assert dumped["sk"] == "2025-01-01T12:00:00#abc123"
+        assert dumped["gsi1_pk"] == "VISITORS"
+        assert dumped["gsi1_sk"] == "2025-01-01T12:00:00"
@@ -8,46 +8,21 @@ import os
 import uuid
 from datetime import datetime
 
-import boto3
 import pytest
-from moto import mock_aws
 
 # Set environment before imports
 os.environ["AWS_REGION"] = "us-east-1"
 os.environ["AWS_ACCESS_KEY_ID"] = "testing"
 os.environ["AWS_SECRET_ACCESS_KEY"] = "testing"
 
+from src.repositories import visitor as visitor_module
 from src.repositories.visitor import VisitorRepository
 
 
 @pytest.fixture
-def dynamodb_table():
-    """Create a mock DynamoDB table for testing."""
-    with mock_aws():
-        # Create DynamoDB client
-        dynamodb = boto3.client("dynamodb", region_name="us-east-1")
-
-        # Create table
-        table_name = "portfolio-api-table"
-        dynamodb.create_table(
-            TableName=table_name,
-            KeySchema=[
-                {"AttributeName": "PK", "KeyType": "HASH"},
-                {"AttributeName": "SK", "KeyType": "RANGE"},
-            ],
-            AttributeDefinitions=[
-                {"AttributeName": "PK", "AttributeType": "S"},
-                {"AttributeName": "SK", "AttributeType": "S"},
-            ],
-            BillingMode="PAY_PER_REQUEST",
-        )
-
-        yield table_name
-
-
-@pytest.fixture
-def visitor_repo(dynamodb_table):
+def visitor_repo(mock_dynamodb_table):
     """Create a VisitorRepository instance for testing."""
+    visitor_module._count_cache.clear()
     return VisitorRepository()
 
 
@@ -79,6 +54,19 @@ class TestVisitorTracking:
 
         assert count2 == count1  # Count should not increase
 
+    def test_track_visitor_already_counted_skips_write(self, visitor_repo):
+        """Test that a session already counted today is answered without a write."""
+        from unittest.mock import PropertyMock, patch
+
+        session_id = str(uuid.uuid4())
+        visitor_repo.track_visitor(session_id)
+
+        with patch.object(VisitorRepository, "client", new_callable=PropertyMock) as mock_client:
+            result = visitor_repo.track_visitor(session_id)
+
+        assert result == {"count": 1, "sessionId": session_id}
+        mock_client.assert_not_called()
+
     def test_track_different_visitors(self, visitor_repo):
         """Test tracking different visitors increments count."""
         session1 = str(uuid.uuid4())
@@ -116,6 +104,26 @@ class TestVisitorTracking:
 
         assert new_total > initial_total
 
+    def test_track_visitor_counts_session_from_previous_day(self, visitor_repo):
+        """Test that a session last tracked on an earlier day is counted again."""
+        session_id = str(uuid.uuid4())
+        visitor_repo.track_visitor(session_id)
+
+        # Session record not yet removed by TTL, but from yesterday
+        visitor_repo.put_item(
+            {
+                "PK": f"VISITOR#SESSION#{session_id}",
+                "SK": "TRACKED",
+                "EntityType": "VISITOR_SESSION",
+                "Data": {"lastTrackedDate": "2000-01-01"},
+            }
+        )
+
+        result = visitor_repo.track_visitor(session_id)
+
+        assert result["count"] == 2
+        assert visitor_repo.get_total_count() == 2
+
 
 class TestVisitorCounts:
     """Tests for visitor count retrieval."""
@@ -147,6 +155,36 @@ class TestVisitorCounts:
         assert total == 1  # Should only count once
 
 
+class TestCountCache:
+    """Tests for the in-process count and trends cache."""
+
+    def test_total_count_served_from_cache(self, visitor_repo):
+        """Test that repeat reads of the total count skip DynamoDB."""
+        visitor_repo.track_visitor(str(uuid.uuid4()))
+        assert visitor_repo.get_total_count() == 1
+
+        visitor_repo.update_item(
+            pk="VISITOR#TOTAL",
+            sk="COUNT",
+            update_expression="SET #data.totalCount = :count",
+            expression_attribute_values={":count": 50},
+            expression_attribute_names={"#data": "Data"},
+        )
+
+        assert visitor_repo.get_total_count() == 1
+
+    def test_track_visitor_invalidates_cache(self, visitor_repo):
+        """Test that counting a new visitor refreshes cached reads."""
+        visitor_repo.track_visitor(str(uuid.uuid4()))
+        assert visitor_repo.get_total_count() == 1
+        assert visitor_repo.get_daily_trends(days=1)[0]["visitors"] == 1
+
+        visitor_repo.track_visitor(str(uuid.uuid4()))
+
+        assert visitor_repo.get_total_count() == 2
+        assert visitor_repo.get_daily_trends(days=1)[0]["visitors"] == 2
+
+
 class TestDailyTrends:
     """Tests for daily visitor trends."""
 
@@ -220,6 +258,78 @@ class TestMonthlyTrends:
         assert current_month_trend is not None
         assert current_month_trend["visitors"] == 5
 
+    def test_track_visitor_maintains_monthly_aggregate(self, visitor_repo):
+        """Test that tracking keeps a pre-aggregated monthly counter."""
+        for _ in range(3):
+            visitor_repo.track_visitor(str(uuid.uuid4()))
+
+        current_month = datetime.now().strftime("%Y-%m")
+        monthly_item = visitor_repo.get_item(pk=f"VISITOR#MONTHLY#{current_month}", sk="COUNT")
+
+        assert monthly_item["EntityType"] == "VISITOR_MONTHLY"
+        assert monthly_item["Data"] == {"month": current_month, "count": 3}
+
+    def test_monthly_trends_with_aggregate_do_not_scan(self, visitor_repo, no_scan):
+        """Test that months with an aggregate are read without a Scan."""
+        visitor_repo.track_visitor(str(uuid.uuid4()))
+
+        trends = visitor_repo.get_monthly_trends(months=1)
+
+        assert trends[0]["visitors"] == 1
+
+    def test_monthly_trends_without_aggregate_are_zero(self, visitor_repo, no_scan):
+        """Test that months without an aggregate count as zero, without a Scan."""
+        trends = visitor_repo.get_monthly_trends(months=6)
+
+        assert [trend["visitors"] for trend in trends] == [0] * 6
+
+    def test_backfill_monthly_counts(self, visitor_repo):
+        """Test that monthly aggregates are rebuilt from the daily items."""
+        from datetime import UTC
+        from unittest.mock import patch
+
+        for date, count in (("2025-01-10", 3), ("2025-01-20", 2), ("2025-03-05", 7)):
+            visitor_repo.put_item(
+                {
+                    "PK": f"VISITOR#DAILY#{date}",
+                    "SK": "COUNT",
+                    "EntityType": "VISITOR_DAILY",
+                    "Data": {"date": date, "count": count},
+                }
+            )
+        # Partial aggregate from a month that was only tracked after deploy
+        visitor_repo.put_item(
+            {
+                "PK": "VISITOR#MONTHLY#2025-03",
+                "SK": "COUNT",
+                "EntityType": "VISITOR_MONTHLY",
+                "Data": {"month": "2025-03", "count": 1},
+            }
+        )
+
+        assert visitor_repo.backfill_monthly_counts() == {"2025-01": 5, "2025-03": 7}
+
+        with patch("src.repositories.visitor.datetime") as mock_datetime:
+            mock_datetime.now.return_value = datetime(2025, 3, 15, tzinfo=UTC)
+            trends = visitor_repo.get_monthly_trends(months=3)
+
+        assert trends == [
+            {"month": "2025-01", "visitors": 5},
+            {"month": "2025-02", "visitors": 0},
+            {"month": "2025-03", "visitors": 7},
+        ]
+
+    def test_monthly_trends_cover_each_calendar_month_once(self, visitor_repo):
+        """Test that months are stepped by calendar month, not 30-day blocks."""
+        from datetime import UTC
+        from unittest.mock import patch
+
+        with patch("src.repositories.visitor.datetime") as mock_datetime:
+            mock_datetime.now.return_value = datetime(2025, 3, 31, tzinfo=UTC)
+            trends = visitor_repo.get_monthly_trends(months=4)
+
+        assert [t["month"] for t in trends] == ["2024-12", "2025-01", "2025-02", "2025-03"]
+
     def test_monthly_trends_ordered_chronologically(self, visitor_repo):
         """Test that monthly trends are ordered from oldest to newest."""
         trends = visitor_repo.get_monthly_trends(months=6)
@@ -4,6 +4,7 @@ Unit tests for Visitors API endpoints.
 Tests visitor tracking and analytics endpoints.
 """
 
+from decimal import Decimal
 from unittest.mock import Mock, patch
 
 import pytest
@@ -73,6 +74,17 @@ class TestGetVisitorCount:
         assert data["total_visitors"] == 1234
         assert "last_updated" in data
 
+    def test_get_visitor_count_from_decimal(
+        self, test_client, override_get_visitor_repository, mock_visitor_repo
+    ):
+        """Test that a DynamoDB Decimal count is returned as an integer."""
+        mock_visitor_repo.get_total_count.return_value = Decimal("42")
+
+        response = test_client.get("/visitors/count")
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json()["total_visitors"] == 42
+
 
 class TestGetDailyTrends:
     """Tests for GET /visitors/trends/daily endpoint."""